@@ -29,6 +29,7 @@ if 'page' not in st.session_state:
 
 if 'engine' not in st.session_state:
     st.session_state.engine = ReactorEngine()
+    st.session_state.engine.start_rewind() # Input journal + keyframes, for re-simulation and rewind
     st.session_state.active_unit_id = "A" # Default for take-control
 
 # Navigation Logic
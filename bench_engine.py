@@ -0,0 +1,221 @@
+"""
+Tick-throughput benchmarks for the reactor engine.
+
+    python bench_engine.py                      # run, append to history, compare with baseline
+    python bench_engine.py --save-baseline      # run and store the result as the new baseline
+    python bench_engine.py --quick --threshold 0.3
+
+Each case reports ticks/s and per-tick latency percentiles. Every run is appended
+to bench_history.jsonl; the process exits 1 if any case's throughput falls more
+than --threshold below bench_baseline.json, and 2 if there is no baseline.
+
+Simulated units run under a fixed control script (LOAD_SCRIPT): the automatic
+rod controller follows a repeating turbine-load schedule, so every case times
+a plant at power instead of one that has drifted to zero or tripped.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+import numpy as np
+from logic.engine import ReactorEngine, ReactorUnit, ReactorType
+from logic.fleet import FleetEngine
+from logic.scenarios.historical import SCENARIOS
+
+TYPES = [ReactorType.PWR, ReactorType.BWR, ReactorType.RBMK]
+DTS = [0.1, 1.0]
+FLEET_SIZES = [3, 30, 300]
+# Turbine load (MW) set at each tick of a repeating LOAD_CYCLE-tick schedule
+LOAD_SCRIPT = {0: 1000.0, 500: 970.0, 1000: 1000.0, 1500: 1030.0}
+LOAD_CYCLE = 2000
+
+
+def _measure(step, ticks, warmup):
+    for _ in range(warmup):
+        step()
+    samples = np.empty(ticks)
+    clock = time.perf_counter_ns
+    for i in range(ticks):
+        start = clock()
+        step()
+        samples[i] = clock() - start
+    total_s = samples.sum() / 1e9
+    return {
+        "ticks": ticks,
+        "ticks_per_s": ticks / total_s if total_s > 0 else float("inf"),
+        "p50_us": float(np.percentile(samples, 50) / 1e3),
+        "p90_us": float(np.percentile(samples, 90) / 1e3),
+        "p99_us": float(np.percentile(samples, 99) / 1e3),
+    }
+
+
+def _scripted(step, set_load):
+    """step() under LOAD_SCRIPT: set_load(mw) runs at each breakpoint of the cycle."""
+    tick = 0
+
+    def scripted():
+        nonlocal tick
+        load = LOAD_SCRIPT.get(tick % LOAD_CYCLE)
+        if load is not None:
+            set_load(load)
+        tick += 1
+        step()
+    return scripted
+
+
+def _unit_load(units):
+    def set_load(mw):
+        for unit in units:
+            unit.control_state.auto_rod_control = True
+            unit.control_state.turbine_load_mw = mw
+    return set_load
+
+
+def _fleet_load(fleet):
+    def set_load(mw):
+        fleet.controls["auto_rod_control"][:] = True
+        fleet.controls["turbine_load_mw"][:] = mw
+    return set_load
+
+
+def _replay_unit(scenario):
+    unit = ReactorUnit("BENCH", scenario.title, ReactorType.PWR)
+    unit.replay_scenario = scenario
+    unit.is_replay = True
+    unit.time_seconds = 0
+    return unit
+
+
+def _engine_with_fleet(size):
+    engine = ReactorEngine()
+    engine.units = {str(i): ReactorUnit(str(i), f"UNIT-{i}", TYPES[i % 3]) for i in range(size)}
+    return engine
+
+
+def _fleet_engine(size):
+    fleet = FleetEngine()
+    for i in range(size):
+        fleet.add_reactor(str(i), f"UNIT-{i}", TYPES[i % 3])
+    return fleet
+
+
+def run_cases(ticks, warmup):
+    results = {}
+
+    for r_type in TYPES:
+        for dt in DTS:
+            unit = ReactorUnit("BENCH", "BENCH", r_type)
+            step = _scripted(lambda unit=unit, dt=dt: unit._tick_simulation(dt), _unit_load([unit]))
+            results[f"unit._tick_simulation[{r_type.value},dt={dt}]"] = _measure(step, ticks, warmup)
+
+    for sid, scenario in SCENARIOS.items():
+        for dt in DTS:
+            unit = _replay_unit(scenario)
+            end = scenario.phases[-1]["time"]
+
+            def step(unit=unit, dt=dt, end=end):
+                if unit.time_seconds > end:
+                    unit.time_seconds = 0
+                unit._tick_replay(dt)
+            results[f"unit._tick_replay[{sid},dt={dt}]"] = _measure(step, ticks, warmup)
+
+    for size in FLEET_SIZES:
+        for dt in DTS:
+            engine = _engine_with_fleet(size)
+            n = max(10, ticks // size)
+            step = _scripted(lambda engine=engine, dt=dt: engine.tick(dt), _unit_load(engine.units.values()))
+            results[f"engine.tick[units={size},dt={dt}]"] = _measure(step, n, warmup)
+            fleet = _fleet_engine(size)
+            step = _scripted(lambda fleet=fleet, dt=dt: fleet.tick(dt), _fleet_load(fleet))
+            results[f"fleet.tick[units={size},dt={dt}]"] = _measure(step, n, warmup)
+
+    for sid in SCENARIOS:
+        for dt in DTS:
+            engine = ReactorEngine()
+            engine.load_scenario(sid)
+            end = engine.active_scenario.phases[-1]["time"]
+
+            def step(engine=engine, dt=dt, end=end):
+                if engine.scenario_time > end:
+                    engine.scenario_time = 0.0
+                engine.tick_scenario(dt)
+            results[f"engine.tick_scenario[{sid},dt={dt}]"] = _measure(step, ticks, warmup)
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Returns the names of cases whose throughput regressed past threshold."""
+    regressions = []
+    for name, res in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        ratio = res["ticks_per_s"] / base["ticks_per_s"]
+        res["vs_baseline"] = ratio
+        if ratio < 1.0 - threshold:
+            regressions.append(name)
+    return regressions
+
+
+def print_table(results, regressions):
+    print(f"{'CASE':<48} {'TICKS/S':>12} {'P50 us':>9} {'P90 us':>9} {'P99 us':>9} {'VS BASE':>8}")
+    for name, r in results.items():
+        vs = f"{r['vs_baseline']:.2f}x" if "vs_baseline" in r else "-"
+        flag = "  << REGRESSION" if name in regressions else ""
+        print(f"{name:<48} {r['ticks_per_s']:>12,.0f} {r['p50_us']:>9.1f} {r['p90_us']:>9.1f} {r['p99_us']:>9.1f} {vs:>8}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reactor engine tick-throughput benchmarks")
+    parser.add_argument("--ticks", type=int, default=2000, help="Timed ticks per case")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--quick", action="store_true", help="Short run (300 ticks)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed throughput drop (0.2 = 20%%)")
+    parser.add_argument("--history", default="bench_history.jsonl")
+    parser.add_argument("--baseline", default="bench_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    ticks = 300 if args.quick else args.ticks
+    results = run_cases(ticks, args.warmup)
+
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "node": platform.node(),
+        "results": results,
+    }
+
+    regressions = []
+    missing = False
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(run, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    else:
+        try:
+            with open(args.baseline) as f:
+                regressions = compare(results, json.load(f), args.threshold)
+        except FileNotFoundError:
+            missing = True
+
+    with open(args.history, "a") as f:
+        f.write(json.dumps(run) + "\n")
+
+    print_table(results, regressions)
+    if regressions:
+        print(f"\nFAILED: {len(regressions)} case(s) regressed more than {args.threshold:.0%}")
+        return 1
+    if missing:
+        print(f"\nFAILED: no baseline at {args.baseline}, nothing was compared "
+              "(run with --save-baseline to create one)", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Headless driver for the reactor engine (no Streamlit).
+
+    python cli.py run --type RBMK --duration 600 --dt 0.1 --schedule schedule.json --out rbmk.npz
+    python cli.py run --type PWR --duration 120 --set 30:rods_pos=80 --set 60:disturbance=SPIKE --out pwr.csv
+    python cli.py run --type RBMK --duration 120 --integrator delayed --set 10:rods_pos=49 --out rbmk_delayed.npz
+    python cli.py replay chernobyl --dt 0.1 --out chernobyl.npz
+    python cli.py batch manifest.json --workers 8 --out-dir results/
+    python cli.py envelope --workers 8
+    python cli.py sweep --type RBMK --axis rods_pos=30:70:21 --axis pump_speed=20:100:9 --axis void_coefficient=0.01,0.05 --out map.npz
+
+Schedules are JSON lists of actions: {"time": 30, "controls": {"rods_pos": 80}},
+{"time": 60, "disturbance": "SPIKE"}, {"time": 0, "config": {...}}, {"time": 0, "preset": "DEGRADED"}.
+Manifests are JSON lists of runs: {"name": "...", "mode": "run", "type": "RBMK", "duration": 600, ...}
+or {"name": "...", "mode": "replay", "scenario": "tmi"}.
+Sweep axes are FIELD=LOW:HIGH:COUNT (evenly spaced) or FIELD=V1,V2,... over control or config fields.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from logic.headless import run_unit, replay_scenario, run_manifest, write_columns
+from logic.scenarios.historical import SCENARIOS
+
+
+def _parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _parse_set(entry):
+    """'30:rods_pos=80' -> {"time": 30, "controls": {"rods_pos": 80}}"""
+    when, assignment = entry.split(":", 1)
+    key, value = assignment.split("=", 1)
+    action = {"time": float(when)}
+    if key in ("disturbance", "preset"):
+        action[key] = value
+    elif key.startswith("config."):
+        action["config"] = {key[len("config."):]: _parse_value(value)}
+    else:
+        action["controls"] = {key: _parse_value(value)}
+    return action
+
+
+def _parse_axis(entry):
+    """'rods_pos=30:70:21' -> ("rods_pos", [30.0, 32.0, ...]); 'void_coefficient=0.01,0.05' -> explicit values"""
+    field, spec = entry.split("=", 1)
+    if ":" in spec:
+        low, high, count = spec.split(":")
+        step = (float(high) - float(low)) / max(1, int(count) - 1)
+        return field, [float(low) + i * step for i in range(int(count))]
+    return field, [float(v) for v in spec.split(",")]
+
+
+def _summary(name, columns, elapsed):
+    n = len(columns["time_seconds"])
+    end = columns["time_seconds"][-1] if n else 0.0
+    print(f"{name}: {n} samples, T+{end:.1f}s, {len(columns['event_time'])} events ({elapsed:.2f}s wall)")
+
+
+def cmd_run(args):
+    schedule = []
+    if args.schedule:
+        with open(args.schedule) as f:
+            schedule.extend(json.load(f))
+    schedule.extend(_parse_set(s) for s in args.set or [])
+
+    start = time.perf_counter()
+    columns = run_unit(args.type, args.duration, dt=args.dt, schedule=schedule, record_every=args.record_every,
+                       integrator=args.integrator)
+    write_columns(args.out, columns)
+    _summary(args.out, columns, time.perf_counter() - start)
+
+
+def cmd_replay(args):
+    start = time.perf_counter()
+    columns = replay_scenario(args.scenario, dt=args.dt, duration=args.duration, record_every=args.record_every)
+    write_columns(args.out, columns)
+    _summary(args.out, columns, time.perf_counter() - start)
+
+
+def cmd_batch(args):
+    with open(args.manifest) as f:
+        specs = json.load(f)
+    os.makedirs(args.out_dir, exist_ok=True)
+    start = time.perf_counter()
+    for name, columns in run_manifest(specs, workers=args.workers):
+        path = os.path.join(args.out_dir, f"{name}.{args.format}")
+        write_columns(path, columns)
+        _summary(path, columns, time.perf_counter() - start)
+
+
+def cmd_sweep(args):
+    from logic.engine import ReactorType
+    from logic.sweep import StabilitySweep
+    axes = dict(_parse_axis(a) for a in args.axis)
+    start = time.perf_counter()
+    sweep = StabilitySweep(ReactorType(args.type), axes, horizon=args.duration, dt=args.dt, workers=args.workers)
+    result = sweep.run()
+    size = result.save(args.out)
+    shape = " x ".join(f"{len(v)} {f}" for f, v in result.axes.items())
+    print(f"{args.out}: {result.size} cells ({shape}), {size:,} bytes ({time.perf_counter() - start:.2f}s wall)")
+
+
+def cmd_envelope(args):
+    from logic.engine import ReactorUnit, ReactorType
+    from logic.envelope import envelope_for
+    for r_type in args.type or ["PWR", "BWR", "RBMK"]:
+        unit = ReactorUnit("CLI", "ENVELOPE", ReactorType(r_type))
+        start = time.perf_counter()
+        envelope = envelope_for(unit, workers=args.workers)
+        cells = envelope.arrays["time_to_trip"].size
+        print(f"{r_type}: {cells:,} states cached ({time.perf_counter() - start:.2f}s wall)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless nuclear reactor simulator")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Simulate one reactor type with a control schedule")
+    p_run.add_argument("--type", default="PWR", choices=["PWR", "BWR", "RBMK"])
+    p_run.add_argument("--duration", type=float, default=300.0, help="Plant seconds to simulate")
+    p_run.add_argument("--dt", type=float, default=0.1)
+    p_run.add_argument("--schedule", help="JSON file with a list of timed actions")
+    p_run.add_argument("--set", action="append", metavar="T:KEY=VALUE", help="Inline timed action (repeatable)")
+    p_run.add_argument("--record-every", type=int, default=1, help="Record one sample every N ticks")
+    p_run.add_argument("--integrator", choices=["explicit", "adaptive", "delayed"],
+                       help="Flux integrator; defaults to adaptive when --dt is coarser than 0.1 s, else explicit")
+    p_run.add_argument("--out", default="run.npz", help=".npz or .csv")
+    p_run.set_defaults(func=cmd_run)
+
+    p_replay = sub.add_parser("replay", help="Replay a historical scenario at max speed")
+    p_replay.add_argument("scenario", choices=sorted(SCENARIOS))
+    p_replay.add_argument("--dt", type=float, default=0.1)
+    p_replay.add_argument("--duration", type=float, default=None, help="Defaults to just past the last phase")
+    p_replay.add_argument("--record-every", type=int, default=1)
+    p_replay.add_argument("--out", default="replay.npz", help=".npz or .csv")
+    p_replay.set_defaults(func=cmd_replay)
+
+    p_batch = sub.add_parser("batch", help="Run a JSON manifest of runs across a process pool")
+    p_batch.add_argument("manifest")
+    p_batch.add_argument("--workers", type=int, default=None, help="Defaults to all cores")
+    p_batch.add_argument("--out-dir", default="results")
+    p_batch.add_argument("--format", default="npz", choices=["npz", "csv"])
+    p_batch.set_defaults(func=cmd_batch)
+
+    p_env = sub.add_parser("envelope", help="Pre-build the Instructor's cached safety envelopes")
+    p_env.add_argument("--type", action="append", choices=["PWR", "BWR", "RBMK"], help="Defaults to all (repeatable)")
+    p_env.add_argument("--workers", type=int, default=None, help="Defaults to all cores")
+    p_env.set_defaults(func=cmd_envelope)
+
+    p_sweep = sub.add_parser("sweep", help="Stability map over a grid of control/config settings")
+    p_sweep.add_argument("--type", default="RBMK", choices=["PWR", "BWR", "RBMK"])
+    p_sweep.add_argument("--axis", action="append", required=True, metavar="FIELD=SPEC", help="Swept field (repeatable)")
+    p_sweep.add_argument("--duration", type=float, default=120.0, help="Plant seconds per cell")
+    p_sweep.add_argument("--dt", type=float, default=0.1)
+    p_sweep.add_argument("--workers", type=int, default=None, help="Defaults to all cores")
+    p_sweep.add_argument("--out", default="sweep.npz")
+    p_sweep.set_defaults(func=cmd_sweep)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
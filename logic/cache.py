@@ -0,0 +1,39 @@
+import hashlib
+import json
+import os
+import numpy as np
+
+# Directory for derived tables (equilibrium, safety envelope) that are
+# expensive to build and safe to delete; entries are keyed by a hash of
+# everything that went into them, so stale ones are simply never read again.
+# Anchored at the repository root, not the working directory, so the CLI and
+# the Streamlit app share one cache wherever they are started from.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.environ.get("REACTOR_CACHE_DIR", os.path.join(_ROOT, "cache"))
+
+
+def cache_key(fields):
+    """Short stable hash of a JSON-serializable dict."""
+    return hashlib.sha1(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def load_or_build(prefix, key, names, build):
+    """
+    {name: array} from CACHE_DIR/<prefix>_<key>.npz, or from build() (then
+    written there atomically) when the file is missing or unreadable.
+    """
+    path = os.path.join(CACHE_DIR, f"{prefix}_{key}.npz")
+    try:
+        with np.load(path) as data:
+            return {name: data[name] for name in names}
+    except (OSError, KeyError, ValueError):
+        pass
+    arrays = build()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+    except OSError:
+        pass # Read-only checkout: keep the in-memory copy only
+    return arrays
@@ -1,10 +1,25 @@
 from .layers.reactivity import ReactivityLayer
 from .layers.thermal import ThermalLayer
-from .layers.safety import SafetyLayer
+from .layers.safety import SafetyLayer, crossing_fraction
 from .scenarios.historical import SCENARIOS
+from .state import Telemetry, ControlState, ReactivityComponents, StateView
+from .recorder import FlightRecorder, DiskRecorder, DEFAULT_CAPACITY
+from .events import (EventLog, EVENT_NOTE, EVENT_HISTORICAL, EVENT_MELTDOWN, EVENT_CONTAINMENT,
+                     EVENT_FUEL_TEMP, EVENT_VOID, EVENT_XENON)
+from .keyframes import keyframes_for
+from .equilibrium import table_for
+from .rules import RULESET
+from .multirate import MultiRateScheduler
+from datetime import datetime
+import os
 from enum import Enum
 import math
 import random
+import time
+
+# The explicit flux update is tuned at this tick; coarser ticks from advance()
+# and the headless runner use the coupled "adaptive" integrator instead
+EXPLICIT_MAX_DT = 0.1
 
 class ReactorType(Enum):
     PWR = "PWR"   # Pressurized Water Reactor (Negative Void coeff, Safe)
@@ -49,8 +64,18 @@ class ReactorConfig:
         self.coupling_strength = 0.5 if r_type == ReactorType.RBMK else 1.0
         self.safety_bias = 0.5
 
+def apply_disturbance(config, type="SPIKE"):
+    """Applies a named external disturbance to a ReactorConfig."""
+    if type == "SPIKE":
+        config.disturbance_flux = 0.5 
+    elif type == "COOLING_FAIL":
+        config.cooling_penalty = 0.2
+    elif type == "RESET":
+        config.disturbance_flux = 0
+        config.cooling_penalty = 1.0
+
 class ReactorUnit:
-    def __init__(self, id, name, r_type=ReactorType.PWR):
+    def __init__(self, id, name, r_type=ReactorType.PWR, history_capacity=DEFAULT_CAPACITY):
         self.id = id
         self.name = name
         self.type = r_type
@@ -62,7 +87,7 @@ class ReactorUnit:
         self.safety = SafetyLayer()
         
         # State
-        self.control_state = {
+        self.control_state = ControlState({
             "rods_pos": 50.0, # 0 (Full Out) to 100 (Full In)
             "pump_speed": 100.0,
             "flow_rate_core": 100.0, # Actual flow
@@ -83,9 +108,9 @@ class ReactorUnit:
             "turbine_load_mw": 1000.0,
             "msiv_open": True, 
             "auto_rod_control": False,
-        }
+        })
         
-        self.telemetry = {
+        self.telemetry = Telemetry({
             "flux": 0.001,
             "power_mw": 0.0,
             "temp": 300.0,
@@ -110,14 +135,20 @@ class ReactorUnit:
             "containment_integrity": 100.0,
             "radiation_released": 0.0, # Sieverts
             "warnings": [],
-        }
+        })
         
 
         
-        self.history = []
-        self.event_log = [] # List of {"time": t, "event": str}
+        self.reactivity_components = ReactivityComponents()
+        self.history = FlightRecorder(history_capacity) # 1 Hz flight recorder
+        self.history_interval = 1.0 # Plant seconds between history samples (raised in accelerated time)
+        self.disk_recorder = None # Every-tick on-disk recording (start_recording)
+        self.event_log = EventLog() # {"time": t, "event": str, "code": str} entries
         self.failure_cause = None
         self.post_mortem_report = None
+        self.rules = RULESET.evaluator(r_type) # Incremental alarm/advice rule state
+        self.multirate = None # Per-subsystem step sizes (use_multirate); None = everything at the tick's dt
+        self.nodal = None # Spatial core model (use_nodal_core); None = point model only
         
         self.time_seconds = 0
         self.reset() # Start in optimal state
@@ -127,7 +158,7 @@ class ReactorUnit:
         r_type = self.type
         
         # 1. OPTIMAL CONTROL STATE
-        self.control_state = {
+        self.control_state = ControlState({
             "rods_pos": 65.0, # 35% Withdrawal - Matches ~30% Power (1000MW)
             "pump_speed": 100.0,
             "flow_rate_core": 100.0,
@@ -148,7 +179,7 @@ class ReactorUnit:
             "turbine_load_mw": 1000.0,
             "msiv_open": True,
             "auto_rod_control": False,
-        }
+        })
         
         # 2. OPTIMAL TELEMETRY
         # PWR: 315C, 155 Bar
@@ -166,7 +197,7 @@ class ReactorUnit:
             target_press = 65.0
             self.control_state["rods_pos"] = 70.0 # RBMK needs more withdrawal
             
-        self.telemetry = {
+        self.telemetry = Telemetry({
             "flux": 1000.0 / 3200.0, # Match Target Payload (1000MW)
             "power_mw": 1000.0,
             "temp": target_temp,
@@ -191,13 +222,13 @@ class ReactorUnit:
             "containment_integrity": 100.0,
             "radiation_released": 0.0,
             "warnings": [],
-        }
+        })
         
-        self.event_log = []
+        self.event_log.clear()
         self.failure_cause = None
         self.post_mortem_report = None
         self.safety.alerts = []
-        self.history = []
+        self.history.clear()
         
         # Replay State
         self.replay_scenario = None
@@ -207,8 +238,44 @@ class ReactorUnit:
         # Reset physics layers if needed (simplified)
         self.physics.xenon_poisoning = 0.0
         
-        # 3. TRIM TO EQUILIBRIUM (Auto-Stabilize)
-        self._trim_to_equilibrium()
+        # 3. TRIM TO EQUILIBRIUM (Auto-Stabilize) from the cached steady-state table
+        if not self._apply_equilibrium_table():
+            self._trim_to_equilibrium()
+        if self.nodal is not None:
+            self._initialize_nodal()
+
+    @staticmethod
+    def _net_heat(q_gen, temp, cooling_factor, sink_mw):
+        """Heat generated minus heat removed (MW) at core temperature `temp`."""
+        # Physical Transfer Capacity
+        q_removed_physical = (temp - 20) * 10.0 * cooling_factor
+
+        # Actual removal is limited by physical capacity, but also affected by sink demand.
+        # If Sink < Physical, the return water is hotter, reducing Q_removed.
+        # We simulate this by clamping Q_removed to Sink (plus some inertia).
+        # But we must ensure Q_removed doesn't exceed physical limits.
+        q_removed = min(q_removed_physical, sink_mw)
+
+        # Fallback: Natural losses (losses to ambient)
+        q_removed = max(q_removed, q_removed_physical * 0.05)
+        return q_gen - q_removed
+
+    def _apply_equilibrium_table(self):
+        """Sets rods, turbine load and feedwater from table_for(self) at the current power (boron is left as is)."""
+        row = table_for(self).lookup(self.telemetry["power_mw"])
+        if row is None:
+            return False
+        t, c = self.telemetry, self.control_state
+        c["rods_pos"] = row["rods_pos"]
+        c["turbine_load_mw"] = row["turbine_load_mw"]
+        c["feedwater_flow"] = row["feedwater_flow"]
+        if t["temp"] > 280:
+            t["void_fraction"] = min(1.0, min(1.0, (t["temp"] - 280) * 0.01) * (t["power_mw"]/3200.0))
+        else:
+            t["void_fraction"] = 0.0
+        self.physics.reactivity = 0.0
+        self.physics.neutron_flux = t["flux"]
+        return True
 
     def _trim_to_equilibrium(self):
         """Calculates exact rod position for 0.0 Net Reactivity at current state."""
@@ -219,7 +286,7 @@ class ReactorUnit:
         # Void (Recalculate expected void to match Tick logic)
         void_fraction = 0.0
         if t["temp"] > 280:
-             void_fraction = min(1.0, (t["temp"] - 280) * 0.01) * (t["power_mw"]/3200.0)
+             void_fraction = min(1.0, min(1.0, (t["temp"] - 280) * 0.01) * (t["power_mw"]/3200.0))
         t["void_fraction"] = void_fraction # Sync telemetry
         
         fb_void = void_fraction * conf.void_coefficient
@@ -257,66 +324,68 @@ class ReactorUnit:
         self.physics.reactivity = 0.0
         self.physics.neutron_flux = t["flux"]
 
-    def log_event(self, message):
-        """Logs a critical event if it hasn't just happened."""
+    def log_event(self, message, code=EVENT_NOTE, key=None, time=None):
+        """Logs a critical event (at `time`, default now) if it hasn't just happened."""
         # Simple debounce: don't log same msg within 5 seconds
-        if self.event_log and self.event_log[-1]["event"] == message and (self.time_seconds - self.event_log[-1]["time"] < 5.0):
-            return
-        self.event_log.append({"time": self.time_seconds, "event": message})
+        return self.event_log.log(self.time_seconds if time is None else time, message, code, key)
 
     def tick(self, dt=1.0):
         if self.is_replay and self.replay_scenario:
             self._tick_replay(dt)
         else:
             self._tick_simulation(dt)
+        if self.disk_recorder is not None:
+            self.disk_recorder.record(self)
+
+    def start_recording(self, path=None, flush_interval=1.0):
+        """Starts persisting every tick to a memory-mapped recording; returns its path."""
+        self.stop_recording()
+        if path is None:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join("recordings", f"{self.id}_{self.type.value}_{stamp}.rxrec")
+        self.disk_recorder = DiskRecorder(path, unit=self, flush_interval=flush_interval)
+        return self.disk_recorder.path
+
+    def stop_recording(self):
+        """Flushes and closes the active recording, if any; returns its path."""
+        recorder, self.disk_recorder = self.disk_recorder, None
+        if recorder is None:
+            return None
+        recorder.close()
+        return recorder.path
+
+    def branch(self, variants, horizon=120.0, dt=0.1, **kwargs):
+        """What-if: runs each {name: schedule} variant ahead from the current state (see logic.branching)."""
+        from .branching import branch
+        return branch(self, variants, horizon=horizon, dt=dt, **kwargs)
+
+    def seek(self, t):
+        """Jumps a replay unit to scenario time t (telemetry, event log and history)."""
+        if not (self.is_replay and self.replay_scenario):
+            raise ValueError(f"Unit {self.id} is not replaying a scenario")
+        keyframes = keyframes_for(self.replay_scenario, self.type,
+                                  lambda: ReactorUnit(self.id, self.name, self.type, self.history.capacity))
+        keyframes.restore(self, t)
 
     def _tick_replay(self, dt):
         """Advances the simulation by interpolating historical phases."""
         self.time_seconds += dt * self.replay_speed
-        phases = self.replay_scenario.phases
-        
-        # Find current and next phase
-        current_phase = phases[0]
-        next_phase = None
-        
-        for p in phases:
-            if p['time'] <= self.time_seconds:
-                current_phase = p
-            else:
-                next_phase = p
-                break
+        table = self.replay_scenario.table
         
-        if not next_phase:
-            # Reached end of history
-            self.telemetry.update(current_phase['telemetry'])
+        # searchsorted + vectorized interpolation over the compiled phase table
+        phase_index = table.apply(self.telemetry, self.time_seconds)
+        if phase_index == len(table.phases) - 1 or self.time_seconds < table.times[0]:
+            # Reached end of history (or before it starts): phase applied as-is
             return
-
-        # Interpolation factor
-        total_gap = next_phase['time'] - current_phase['time']
-        if total_gap <= 0:
-             self.telemetry.update(next_phase['telemetry'])
-             return
-             
-        progress = (self.time_seconds - current_phase['time']) / total_gap
-        
-        # Interpolate all numeric keys in telemetry
-        for k, v_next in next_phase['telemetry'].items():
-            if k in current_phase['telemetry']:
-                v_curr = current_phase['telemetry'][k]
-                if isinstance(v_next, (int, float)) and isinstance(v_curr, (int, float)):
-                    self.telemetry[k] = v_curr + (v_next - v_curr) * progress
-                else:
-                    self.telemetry[k] = v_next # Non-numeric (bools, etc)
-            else:
-                self.telemetry[k] = v_next
+        current_phase = table.phases[phase_index]
         
         # Ensure health is checked for meltdown visual
         if self.telemetry.get("health", 100) <= 0:
             self.telemetry["melted"] = True
 
         # Log historical events
-        if "label" in current_phase and not any(current_phase["label"] in e["event"] for e in self.event_log[-2:]):
-            self.log_event(f"HISTORICAL: {current_phase['label']}")
+        if "label" in current_phase and not self.event_log.seen_within(EVENT_HISTORICAL, entries=2, key=current_phase["label"]):
+            self.log_event(f"HISTORICAL: {current_phase['label']}", EVENT_HISTORICAL, key=current_phase["label"])
 
         self._record_history()
 
@@ -326,111 +395,121 @@ class ReactorUnit:
         c = self.control_state
         t = self.telemetry
         conf = self.config
+        # Step-start values for locating limit crossings inside the step
+        flux0, temp0, pressure0, flow0 = t.flux, t.temp, t.pressure, c.flow_rate_core
         
         # --- 0. Control Response & Mechanics ---
         
         # A. Auto-Rod Control (PID Lite)
-        if c.get("auto_rod_control", False) and not c["manual_scram"]:
+        if c.auto_rod_control and not c.manual_scram:
             # Target is Turbine Load (follow the grid)
-            target_p = c.get("turbine_load_mw", 1000.0)
-            err = target_p - t["power_mw"]
+            target_p = c.turbine_load_mw
+            err = target_p - t.power_mw
             # If power is low, pull rods (decrease pos). If high, insert (increase pos).
             # Gain needs to be small to avoid oscillation
             rod_speed = -0.01 * err * dt # Neg because Lower Pos = Higher Power
-            c["rods_pos"] = max(0.0, min(100.0, c["rods_pos"] + rod_speed))
+            c.rods_pos = max(0.0, min(100.0, c.rods_pos + rod_speed))
 
         # Flow Logic & Water Inventory
         # Flow Logic & Water Inventory
         # Mass Balance: dM/dt = Feedwater - SteamFlow
         # Level approx M
         
-        steam_production = t["power_mw"] / 20.0 # Arbitrary units
-        t["steam_flow"] = steam_production
+        steam_production = t.power_mw / 20.0 # Arbitrary units
+        t.steam_flow = steam_production
         
-        feedwater_in = c["feedwater_flow"] / 100.0 * 160.0 # Scale to match max steam
+        feedwater_in = c.feedwater_flow / 100.0 * 160.0 # Scale to match max steam
         
         if self.type != ReactorType.PWR: # PWR usually has closed secondary, but let's simplify
              # Open loop for BWR/RBMK
              level_change = (feedwater_in - steam_production) * 0.01 * dt
-             t["water_level"] = max(0.0, t["water_level"] + level_change)
+             t.water_level = max(0.0, t.water_level + level_change)
              
              # Low level trip
-             if t["water_level"] < 2.0: # Core uncovering
-                 t["health"] -= 1.0 * dt
+             if t.water_level < 2.0: # Core uncovering
+                 t.health -= 1.0 * dt
                  self.safety.alerts.append("LOW WATER LEVEL")
         
-        target_flow = c["pump_speed"] * conf.cooling_penalty
+        # Slow subsystems advance at their own rate under multi-rate integration
+        mr = self.multirate
+        dt_flow = mr.take("flow", dt) if mr is not None else dt
+        dt_pressure = mr.take("pressure", dt) if mr is not None else dt
+        dt_boron = mr.take("boron", dt) if mr is not None else dt
+
+        target_flow = c.pump_speed * conf.cooling_penalty
         # Flow inertia
-        c["flow_rate_core"] += (target_flow - c["flow_rate_core"]) * 0.1 * dt
+        if dt_flow:
+            c.flow_rate_core += (target_flow - c.flow_rate_core) * 0.1 * dt_flow
         
         # PWR Pressure Logic
-        if self.type == ReactorType.PWR:
+        if self.type == ReactorType.PWR and dt_pressure:
             # P changes with Temp (expansion) + Heaters/Sprays
             # Ideal Gas-ish: P ~ T
-            p_target = (t["temp"] / 300.0) * 150.0
+            p_target = (t.temp / 300.0) * 150.0
             
-            if c["pressurizer_heaters"]: p_target += 20.0
-            if c["pressurizer_sprays"]: p_target -= 20.0
+            if c.pressurizer_heaters: p_target += 20.0
+            if c.pressurizer_sprays: p_target -= 20.0
             
             
             # Inertia
-            t["pressure"] += (p_target - t["pressure"]) * 0.1 * dt
+            t.pressure += (p_target - t.pressure) * 0.1 * dt_pressure
             
         # MSIV & Pressure buildup (BWR/RBMK mostly, but affects PWR SG too)
         # If MSIV Closed and Bypass Closed, Steam has nowhere to go.
-        if not c.get("msiv_open", True) and c.get("turbine_bypass", 0) < 1.0:
+        if not c.msiv_open and c.turbine_bypass < 1.0:
             # Pressure spike
-            t["pressure"] += 2.0 * dt
-            if t["pressure"] > 300: 
+            t.pressure += 2.0 * dt
+            if t.pressure > 300: 
                  self.safety.alerts.append("MSIV OVERPRESSURE")
-                 t["health"] -= 1.0 * dt
+                 t.health -= 1.0 * dt
 
         # Emergency Venting
-        if c.get("manual_vent", False) and t["pressure"] > 5.0:
+        if c.manual_vent and t.pressure > 5.0:
             vent_rate = 50.0 # Bar/s
-            t["pressure"] = max(1.0, t["pressure"] - vent_rate * dt)
-            t["water_level"] -= 0.1 * dt # Lose inventory
-            t["radiation_released"] += 5.0 * dt # Massive release
+            t.pressure = max(1.0, t.pressure - vent_rate * dt)
+            t.water_level -= 0.1 * dt # Lose inventory
+            t.radiation_released += 5.0 * dt # Massive release
             self.safety.alerts.append("VENTING RADS")
 
         # ECCS Injection
-        if c.get("eccs_active", False):
+        if c.eccs_active:
             # Massive flow, cold water
-            t["water_level"] += 0.5 * dt 
-            t["temp"] -= 50.0 * dt # Rapid cooling
-            t["boron_ppm"] += 100.0 * dt # ECCS water is heavily borated
+            t.water_level += 0.5 * dt 
+            t.temp -= 50.0 * dt # Rapid cooling
+            t.boron_ppm += 100.0 * dt # ECCS water is heavily borated
             
             # Thermal Shock damage
-            if t["temp"] > 800:
-                t["health"] -= 2.0 * dt
+            if t.temp > 800:
+                t.health -= 2.0 * dt
                 self.safety.alerts.append("THERMAL SHOCK")
 
         # Boron Logic (PWR)
         boron_reactivity = 0.0
         if self.type == ReactorType.PWR:
             # Mixing lag
-            t["boron_ppm"] += (c["boron_concentration"] - t["boron_ppm"]) * 0.05 * dt
+            t.boron_ppm += (c.boron_concentration - t.boron_ppm) * 0.05 * dt_boron
             # Worth: -10 pcm per ppm? Let's say -0.01 reactivity per 1000 ppm
-            boron_reactivity = -(t["boron_ppm"] / 20000.0)
+            boron_reactivity = -(t.boron_ppm / 20000.0)
             
         # --- 1. Safety Check (Scram Override) ---
-        self.safety.interlocks_active = c["safety_enabled"]
-        is_scrammed = self.safety.check(t["flux"], t["temp"], c["flow_rate_core"], c["manual_scram"])
+        self.safety.interlocks_active = c.safety_enabled
+        # Step-start flow like flux and temp: a drop during this step is located in 3b
+        is_scrammed = self.safety.check(t.flux, t.temp, flow0, c.manual_scram)
         
         if is_scrammed:
             # Rod movement logic
             # RBMK: Slow insertion + Tip Effect
             # PWR/BWR: Fast
             speed = conf.scram_insertion_speed * 10.0 # % per second base
-            c["rods_pos"] = min(100.0, c["rods_pos"] + speed * dt)
-            c["manual_scram"] = False # Latch handles state
+            c.rods_pos = min(100.0, c.rods_pos + speed * dt)
+            c.manual_scram = False # Latch handles state
             
         # --- 2. Advanced Physics Loop ---
         
         # A. Rod Worth & Tip Effect
         # Standard rod worth curve is cosine-like (most worth in center)
         # 100% in = -5.0 delta k, 0% in = +2.0 delta k (just roughly)
-        raw_rod_pos = c["rods_pos"] / 100.0
+        raw_rod_pos = c.rods_pos / 100.0
         
         # RBMK Graphite Tip Effect Logic
         # If rods move IN from 0%, initially they displace water with graphite -> POSITIVE reactivity
@@ -440,194 +519,201 @@ class ReactorUnit:
              if raw_rod_pos < 0.3 and raw_rod_pos >= 0.0:
                  tip_reactivity = 0.005 # Massive positive spike (+500 pcm)
         
-        eff_rods = c["rods_pos"] 
+        eff_rods = c.rods_pos 
         
         # B. Reactivity Feedbacks
         
         # Void Feedback (Steam)
         # More power -> More Temp -> More Voids
         # BWR/RBMK has boiling. PWR has subcooled boiling (rarely voids unless accident)
+        # A fraction: past 3200 MW the core is fully voided, not more than fully
         void_fraction = 0.0
-        if t["temp"] > 280: # Boiling onset
-            void_fraction = min(1.0, (t["temp"] - 280) * 0.01) * (t["power_mw"]/3200.0)
+        if t.temp > 280: # Boiling onset
+            void_fraction = min(1.0, min(1.0, (t.temp - 280) * 0.01) * (t.power_mw/3200.0))
         
-        t["void_fraction"] = void_fraction
+        t.void_fraction = void_fraction
         
         feedback_void = void_fraction * conf.void_coefficient
         
         # Doppler Feedback (Fuel Temp)
-        feedback_doppler = ((t["temp"] - 300) * 0.0001) * conf.doppler_coefficient
+        feedback_doppler = ((t.temp - 300) * 0.0001) * conf.doppler_coefficient
         
         # Xenon Poisoning (Simplified)
         # Flux burns Xenon. Low flux = Xenon builds up (transient).
         # We model 'xenon_poison' as negative reactivity
         xenon_production = 0.001 # constant decay from Iodine
-        xenon_burnout = t["flux"] * 0.002 * conf.xenon_burnout_rate
-        t["xenon"] = max(0.0, t["xenon"] + (xenon_production - xenon_burnout) * dt)
-        feedback_xenon = (t["xenon"] - 1.0) * -0.01 # Excess xenon = neg reactivity
+        # (multi-rate: one update over the skipped span, burnout from its mean flux)
+        dt_xenon, xenon_flux = mr.take_mean("xenon", dt, t.flux) if mr is not None else (dt, t.flux)
+        if dt_xenon:
+            xenon_burnout = xenon_flux * 0.002 * conf.xenon_burnout_rate
+            t.xenon = max(0.0, t.xenon + (xenon_production - xenon_burnout) * dt_xenon)
+        feedback_xenon = (t.xenon - 1.0) * -0.01 # Excess xenon = neg reactivity
         
         # Total External Reactivity Addition
         disturbances = conf.disturbance_flux
         
         total_feedback = feedback_void + feedback_doppler + feedback_xenon + tip_reactivity + disturbances + boron_reactivity
         
-        # Store components for advanced analysis/charts
-        t["reactivity_components"] = {
-            "void": feedback_void,
-            "doppler": feedback_doppler,
-            "xenon": feedback_xenon,
-            "rods": self.physics.reactivity - (feedback_void + feedback_doppler + feedback_xenon + disturbances), # infer rod contribution? 
-            # Actually self.physics.reactivity is total. Rod worth is handled inside physics.update usually.
-            # Let's check physics layer. Assuming physics.update returns flux, but sets self.physics.reactivity.
-            # If ReactivityLayer logic is hidden, we might need to be careful.
-            # BUT, we have `eff_rods`. 
-            # Let's just log the explicit feedbacks we know.
-            "boron": boron_reactivity,
-            "total": total_feedback
-        }
+        # Store components for advanced analysis/charts (one record per unit, reused every tick)
+        comps = self.reactivity_components
+        comps.void = feedback_void
+        comps.doppler = feedback_doppler
+        comps.xenon = feedback_xenon
+        comps.boron = boron_reactivity
+        comps.total = total_feedback
+        t.reactivity_components = comps
         
         # Physics update
         # Pass total_feedback as extra_k
-        current_flux = self.physics.update(eff_rods, t["temp"], extra_k=total_feedback, dt=dt)
-        
-        # Rod worth is implicit in physics.reactivity (Total) - total_feedback (External).
-        # So t["reactivity_components"]["rods"] = self.physics.reactivity - total_feedback
-        # We'll set this 'rods' component AFTER physics.update lines.
+        feedback = None
+        if self.physics.integrator == "adaptive":
+            # Coarse ticks: void and Doppler follow flux and temperature inside the
+            # tick (rods, xenon, boron and disturbances held at their tick values)
+            rho_held = feedback_xenon + tip_reactivity + disturbances + boron_reactivity
+            cooling_factor = (c.flow_rate_core / 100.0) * conf.cooling_penalty
+            sink_mw = (c.turbine_load_mw if c.msiv_open else 0.0) + c.turbine_bypass * 32.0
+
+            def feedback(flux, temp):
+                power_mw = flux * 3200.0
+                void = min(1.0, min(1.0, (temp - 280) * 0.01) * flux) if temp > 280 else 0.0
+                extra_k = rho_held + void * conf.void_coefficient + ((temp - 300) * 0.0001) * conf.doppler_coefficient
+                return extra_k, self._net_heat(power_mw, temp, cooling_factor, sink_mw) * 0.05 / conf.thermal_inertia
+        current_flux = self.physics.update(eff_rods, t.temp, extra_k=total_feedback, dt=dt, feedback=feedback)
+        
+        # Rod worth is implicit in physics.reactivity (Total) - total_feedback (External),
+        # so the 'rods' component is set AFTER physics.update.
 
         # ... (lines 397-400)
-        t["period"] = self.physics.period
-        t["reactivity"] = self.physics.reactivity
+        t.period = self.physics.period
+        t.reactivity = self.physics.reactivity
         
-        t["reactivity_components"]["rods"] = t["reactivity"] - total_feedback
+        comps.rods = t.reactivity - total_feedback
         
         # Apply visual jitter to flux
-        t["flux"] = max(0, current_flux)
+        t.flux = max(0, current_flux)
         
         # --- 3. Thermal Update ---
         # Cooling based on Flow
-        cooling_factor = (c["flow_rate_core"] / 100.0) * conf.cooling_penalty
+        cooling_factor = (c.flow_rate_core / 100.0) * conf.cooling_penalty
         
         # Thermal power generation
-        t["power_mw"] = t["flux"] * 3200.0 # 3200MWth max
+        t.power_mw = t.flux * 3200.0 # 3200MWth max
         
         # Heat transfer
         # Q_gen - Q_removed = M*Cp*dT/dt
-        q_gen = t["power_mw"]
+        q_gen = t.power_mw
         
         # Heat Sink Logic (Grid Demand + Bypass)
-        sink_mw = c.get("turbine_load_mw", 1000.0) if c.get("msiv_open", True) else 0.0
-        sink_mw += c.get("turbine_bypass", 0.0) * 32.0 # 100% bypass = 3200MW
-        
-        # Physical Transfer Capacity
-        q_removed_physical = (t["temp"] - 20) * 10.0 * cooling_factor 
-        
-        # Actual removal is limited by physical capacity, but also affected by sink demand.
-        # If Sink < Physical, the return water is hotter, reducing Q_removed.
-        # We simulate this by clamping Q_removed to Sink (plus some inertia).
-        # But we must ensure Q_removed doesn't exceed physical limits.
-        q_removed = min(q_removed_physical, sink_mw)
+        sink_mw = c.turbine_load_mw if c.msiv_open else 0.0
+        sink_mw += c.turbine_bypass * 32.0 # 100% bypass = 3200MW
         
-        # Fallback: Natural losses (losses to ambient)
-        q_removed = max(q_removed, q_removed_physical * 0.05) 
-        
-        delta_temp = (q_gen - q_removed) * 0.05 * (dt / conf.thermal_inertia)
-        t["temp"] += delta_temp
+        if self.physics.core_temp is not None:
+            t.temp = self.physics.core_temp # Integrated together with the flux
+        else:
+            delta_temp = self._net_heat(q_gen, t.temp, cooling_factor, sink_mw) * 0.05 * (dt / conf.thermal_inertia)
+            t.temp += delta_temp
         
         # --- Advanced Thermal Hydraulics (NEW) ---
         # 1. Mass Flow
         # Natural Circulation ~ 5% flow
         flow_max = 18000.0 # kg/s
-        pump_ratio = c.get("pump_speed", 100.0) / 100.0
+        pump_ratio = c.pump_speed / 100.0
         mass_flow = flow_max * max(0.05, pump_ratio) 
         
         # 2. Inlet/Outlet Temps (Calorimetric)
         # Q = m * Cp * dT  => dT = Q / (m * Cp)
         # Cp Water ~ 4200 J/kgK
         # Power MW -> Watts
-        if t["power_mw"] > 0:
-            delta_t_core = (t["power_mw"] * 1e6) / (mass_flow * 4200.0)
+        if t.power_mw > 0:
+            delta_t_core = (t.power_mw * 1e6) / (mass_flow * 4200.0)
         else:
             delta_t_core = 0.0
             
-        t["t_inlet"] = t["temp"] - (delta_t_core / 2.0)
-        t["t_outlet"] = t["temp"] + (delta_t_core / 2.0)
-        t["mass_flow"] = mass_flow
-        t["flow_rate_core"] = (mass_flow / flow_max) * 100.0 # For visuals
+        t.t_inlet = t.temp - (delta_t_core / 2.0)
+        t.t_outlet = t.temp + (delta_t_core / 2.0)
+        t.mass_flow = mass_flow
+        t.flow_rate_core = (mass_flow / flow_max) * 100.0 # For visuals
         
         # 3. DNBR (Departure from Nucleate Boiling Ratio)
         # Critical Heat Flux margin. < 1.3 is dangerous.
         # Simplified correlation: DNB drops if Power High, Flow Low, Pressure Low.
-        power_ratio = max(0.01, t["power_mw"] / 3200.0)
+        power_ratio = max(0.01, t.power_mw / 3200.0)
         flow_ratio = mass_flow / flow_max
-        pressure_factor = min(1.5, max(0.5, t["pressure"] / 155.0))
+        pressure_factor = min(1.5, max(0.5, t.pressure / 155.0))
         
         # Base CHF margin around 4.0 at nominal
         dnbr_est = 3.5 * (flow_ratio / power_ratio) * pressure_factor
-        t["dnbr"] = min(99.9, dnbr_est)
-        
+        t.dnbr = min(99.9, dnbr_est)
+        
+        # --- 3b. Event Location ---
+        # A trip limit crossed during this step trips at the crossing instant:
+        # the rods have been moving for the rest of the step by the time the
+        # next check would have caught it
+        frac = self.safety.check_step(flux0, temp0, t.flux, t.temp, log_flux=self.physics.integrator != "explicit",
+                                      flow0=flow0, flow1=c.flow_rate_core)
+        if frac is not None:
+            is_scrammed = True
+            speed = conf.scram_insertion_speed * 10.0
+            c.rods_pos = min(100.0, c.rods_pos + speed * (1.0 - frac) * dt)
+
+        # --- 3c. Core Power Shape ---
+        # The nodal model follows rods, temperatures and its own xenon; the
+        # point model keeps owning the amplitude (shape-only coupling)
+        if self.nodal is not None and dt > 0 and math.isfinite(t.flux + t.temp + t.t_inlet):
+            self.nodal.step(dt, c.rods_pos, t.temp, t.t_inlet, power_level=t.flux)
+            t["peaking_factor"] = self.nodal.peaking_factor()
+            if self.nodal.geometry == "axial":
+                t["axial_offset"] = self.nodal.axial_offset()
+
         # --- 4. Health & Safety ---
-        t["scram"] = is_scrammed
-        t["alerts"] = self.safety.alerts
+        t.scram = is_scrammed
+        t.alerts = self.safety.alerts
         
         # Stability Margin
         # Based on how close k is to Prompt Critical
         # And how much thermal margin is left
-        t["stability_margin"] = max(0, 100 - (abs(self.physics.reactivity) * 50000) - ((t["temp"]/1000)*50))
+        t.stability_margin = max(0, 100 - (abs(self.physics.reactivity) * 50000) - ((t.temp/1000)*50))
         
         # Damage
-        if t["temp"] > 900:
+        if t.temp > 900:
              # Fuel melting
-             t["health"] -= 0.5 * dt
+             t.health -= 0.5 * dt
         
-             t["health"] -= 1.0 * dt
+             t.health -= 1.0 * dt
              
         # Catastrophic Failure Logic
-        if t["temp"] > 2800.0 and not t["melted"]:
-            t["melted"] = True
-            t["health"] = 0.0
+        # (timed at the crossing inside the step, see crossing_fraction)
+        if t.temp > 2800.0 and not t.melted:
+            t.melted = True
+            t.health = 0.0
             self.failure_cause = "Core Meltdown (Fuel Liquefaction)"
-            self.log_event("CORE MELTDOWN TRIGGERED")
+            at = self.time_seconds - dt * (1.0 - float(crossing_fraction(temp0, t.temp, 2800.0)))
+            self.log_event("CORE MELTDOWN TRIGGERED", EVENT_MELTDOWN, time=at)
             self.generate_post_mortem()
         
-        if t["pressure"] > 250.0 and t["containment_integrity"] > 0:
-            t["containment_integrity"] = 0.0
-            t["health"] = 0.0
-            t["alerts"].append("CONTAINMENT BREACH")
-            t["radiation_released"] += 1000.0 * dt
+        if t.pressure > 250.0 and t.containment_integrity > 0:
+            frac = float(crossing_fraction(pressure0, t.pressure, 250.0))
+            t.containment_integrity = 0.0
+            t.health = 0.0
+            t.alerts.append("CONTAINMENT BREACH")
+            t.radiation_released += 1000.0 * (1.0 - frac) * dt
             self.failure_cause = "Containment Vessel Rupture (Overpressure)"
-            self.log_event("CONTAINMENT BREACHED")
+            self.log_event("CONTAINMENT BREACHED", EVENT_CONTAINMENT, time=self.time_seconds - dt * (1.0 - frac))
             self.generate_post_mortem()
 
-        # Warning Logic (Pre-Alarm)
-        t["warnings"] = []
-        if t["health"] > 0: # Only warn if alive
-             # Type Specific Thresholds
-            warn_temp = 350.0 if self.type == ReactorType.PWR else 300.0
-            warn_press = 170.0 if self.type == ReactorType.PWR else 90.0
-            
-            if t["temp"] > warn_temp:
-                t["warnings"].append(f"HIGH TEMP (> {warn_temp:.0f}C)")
-            
-            if t["pressure"] > warn_press:
-                t["warnings"].append(f"HIGH PRESSURE (> {warn_press:.0f} Bar)")
-                
-            if t["flow_rate_core"] < 50.0 and t["power_mw"] > 100:
-                t["warnings"].append("LOW FLOW")
-                
-            if self.type == ReactorType.RBMK and t["void_fraction"] > 0.4:
-                 t["warnings"].append("HIGH VOID FRACTION")
-
-            if t["radiation_released"] > 0.001:
-                 t["warnings"].append(f"RADIATION LEAK ({t['radiation_released']:.3f} Sv)")
-
+        # Warning Logic (Pre-Alarm): the "warning" rules of rules.RULES, re-run
+        # only when one of their inputs changed
+        warnings = t.warnings
+        warnings.clear()
+        warnings.extend(self.rules.update(t, c, "warning").messages("warning"))
 
         # Precursor Logging
-        if t["temp"] > 2000 and not any("Fuel Temperature Critical" in e["event"] for e in self.event_log[-3:]):
-            self.log_event(f"Fuel Temperature Critical: {t['temp']:.1f}C")
-        if t["void_fraction"] > 0.8 and self.type == ReactorType.RBMK:
-             self.log_event(f"Void Fraction Critical: {t['void_fraction']*100:.1f}%")
-        if t["xenon"] > 2.0:
-             self.log_event(f"Xenon Pit Depth Maximum: {t['xenon']:.2f}")
+        if t.temp > 2000 and not self.event_log.seen_within(EVENT_FUEL_TEMP, entries=3):
+            self.log_event(f"Fuel Temperature Critical: {t.temp:.1f}C", EVENT_FUEL_TEMP)
+        if t.void_fraction > 0.8 and self.type == ReactorType.RBMK:
+             self.log_event(f"Void Fraction Critical: {t.void_fraction*100:.1f}%", EVENT_VOID)
+        if t.xenon > 2.0:
+             self.log_event(f"Xenon Pit Depth Maximum: {t.xenon:.2f}", EVENT_XENON)
 
         self._record_history()
         
@@ -694,12 +780,74 @@ class ReactorUnit:
             self.config.cooling_penalty = 0.8
             self.telemetry["health"] = 80.0
 
+    def use_multirate(self, **periods):
+        """
+        Switches to multi-rate integration: each subsystem steps at its own
+        interval (multirate.DEFAULT_PERIODS, overridable per name, e.g.
+        xenon=30.0). The explicit flux update sub-cycles at the "kinetics"
+        step, so coarse ticks keep the fine-tick flux response.
+        """
+        self.multirate = MultiRateScheduler(periods)
+        self.physics.max_step = self.multirate.periods["kinetics"]
+
+    def use_integrator(self, name):
+        """
+        Selects the flux integrator: "explicit" (tuned fine-tick update),
+        "adaptive" (flux and core temperature integrated together with their
+        feedback, accurate at coarse dt) or "delayed" (use_delayed_neutrons).
+        """
+        if name == "delayed":
+            self.use_delayed_neutrons()
+        elif name in ("explicit", "adaptive"):
+            self.physics.integrator = name
+        else:
+            raise ValueError(f"Unknown integrator: {name}")
+
+    def use_delayed_neutrons(self):
+        """
+        Switches the flux update to six-group point kinetics with this type's
+        delayed-neutron data (layers.kinetics.PointKinetics): reactivity steps
+        give a prompt jump/drop and then a slower stable period.
+        """
+        self.physics.use_delayed_neutrons(self.type.value)
+
+    def use_nodal_core(self, geometry="axial", nodes=None, **thresholds):
+        """
+        Adds a two-group nodal diffusion model (layers.nodal.NodalCore) on a
+        1-D axial column or a 2-D radial plane, started critical at the
+        current state. Each tick it resolves the power shape (telemetry
+        "peaking_factor", "axial_offset") around the point model's power.
+        Keyword thresholds (rod_threshold, temp_threshold, xenon_threshold)
+        set how far the state may drift before the cached factorization is rebuilt.
+        """
+        from .layers.nodal import NodalCore # SciPy is only needed when the nodal model is used
+        self.nodal = NodalCore(self.type.value, geometry, nodes, **thresholds)
+        self._initialize_nodal()
+
+    def _initialize_nodal(self):
+        t = self.telemetry
+        self.nodal.initialize(self.control_state.rods_pos, t.temp, getattr(t, "t_inlet", None), power_level=t.flux)
+        t["peaking_factor"] = self.nodal.peaking_factor()
+        if self.nodal.geometry == "axial":
+            t["axial_offset"] = self.nodal.axial_offset()
+
+    def balance(self, power_mw=None, temp=None, pressure=None, pump_speed=None, xenon=None):
+        """
+        Solves rods, boron, turbine load and feedwater jointly so the unit sits
+        in steady state at the given targets (current values where None).
+        Returns False (unit untouched) when no such state exists.
+        """
+        from .equilibrium import balance
+        return bool(balance([self], power_mw=power_mw, temp=temp, pressure=pressure,
+                            pump_speed=pump_speed, xenon=xenon)[0])
+
     def set_state_override(self, telemetry_override):
         self.telemetry.update(telemetry_override)
         
-        # Try to infer control state for better 'Take Control' continuity
-        # e.g. if power is high, rods are probably out
-        if "power_mw" in telemetry_override:
+        # Solve the controls that hold this state so 'Take Control' starts balanced
+        if "power_mw" in telemetry_override and self.balance():
+            self.telemetry.update(telemetry_override) # Keep the recorded values exactly
+        elif "power_mw" in telemetry_override:
             # Simple inverse rod logic: Power 3200 -> R0, Power 0 -> R100
             # (Just a guess to prevent immediate jump on handover)
             p_ratio = telemetry_override["power_mw"] / 3200.0
@@ -708,40 +856,55 @@ class ReactorUnit:
         self._record_history()
 
     def _record_history(self):
-        if len(self.history) == 0 or self.time_seconds - self.history[-1]["time_seconds"] >= 1.0:
-            comps = self.telemetry.get("reactivity_components", {})
-            self.history.append({
-                "time_seconds": self.time_seconds,
-                "power_mw": self.telemetry["power_mw"],
-                "temp": self.telemetry["temp"],
-                "reactivity": self.telemetry["reactivity"] * 10000,
-                "rho_rods": comps.get("rods", 0.0) * 10000,
-                "rho_void": comps.get("void", 0.0) * 10000,
-                "rho_doppler": comps.get("doppler", 0.0) * 10000,
-                "rho_xenon": comps.get("xenon", 0.0) * 10000
-            })
-            if len(self.history) > 100: self.history.pop(0)
+        h = self.history
+        if len(h) == 0 or self.time_seconds - h.last("time_seconds") >= self.history_interval:
+            t = self.telemetry
+            comps = t.get("reactivity_components", {})
+            h.append((
+                self.time_seconds,
+                t["power_mw"],
+                t["temp"],
+                t["reactivity"] * 10000,
+                comps.get("rods", 0.0) * 10000,
+                comps.get("void", 0.0) * 10000,
+                comps.get("doppler", 0.0) * 10000,
+                comps.get("xenon", 0.0) * 10000,
+                comps.get("boron", 0.0) * 10000,
+                comps.get("total", 0.0) * 10000,
+            ))
 
     def get_full_state(self):
         return {
             "id": self.id,
             "name": self.name,
             "type": self.type.value,
-            "telemetry": self.telemetry,
-            "controls": self.control_state,
+            "telemetry": StateView(self.telemetry),
+            "controls": StateView(self.control_state),
             "history": self.history
         }
 
 class ReactorEngine:
+    """
+    The interactive plant: a few scalar ReactorUnits with scenarios, the input
+    journal and rewind. Batch runs use fleet.FleetEngine instead (see there
+    for why the two paths are kept separate).
+    """
+
     def __init__(self):
+        self.journal = None # InputJournal while recording (start_journal)
+        self.rewind = None # RewindBuffer keyframes (start_rewind)
+        self.lag = 0.0 # Plant seconds the last advance() fell short by
         self.reinitialize_fleet()
         self.global_time = 0
         self.active_scenario = None
         self.scenario_time = 0.0
         self.current_phase = None
+        self.phase_index = None
         
     def reinitialize_fleet(self):
         """Restores the standard training units (A=PWR, B=BWR, C=RBMK)."""
+        if self.journal is not None:
+            self.journal.record("reinitialize")
         self.units = {
             "A": ReactorUnit("A", "UNIT-1 (PWR)", ReactorType.PWR),
             "B": ReactorUnit("B", "UNIT-2 (BWR)", ReactorType.BWR),
@@ -750,6 +913,8 @@ class ReactorEngine:
         
     def load_scenario(self, scenario_id):
         if scenario_id in SCENARIOS:
+            if self.journal is not None:
+                self.journal.record("scenario", scenario_id)
             self.active_scenario = SCENARIOS[scenario_id]
             self.scenario_time = 0.0
             # Unit A becomes the Replay Actor
@@ -760,47 +925,93 @@ class ReactorEngine:
             # Set Initial State
             initial_phase = self.active_scenario.phases[0]
             self.current_phase = initial_phase
+            self.phase_index = 0
             self.units["A"].set_state_override(initial_phase["telemetry"])
-            self.units["A"].history = []
+            self.units["A"].history.clear()
             
     def unload_scenario(self):
+        if self.journal is not None:
+            self.journal.record("scenario", None)
         self.active_scenario = None
         self.units["A"] = ReactorUnit("A", "UNIT-1 (PWR)", ReactorType.PWR)
 
     def tick(self, dt=1.0):
+        if self.journal is not None:
+            self.journal.tick(dt)
         if self.active_scenario:
             self.tick_scenario(dt)
         else:
             self.global_time += dt
             for u in self.units.values():
                 u.tick(dt)
+        if self.rewind is not None:
+            self.rewind.on_tick(self)
             
+    def advance(self, plant_seconds, max_dt=1.0, budget=None, history_interval=None):
+        """
+        Accelerated time: advances up to `plant_seconds` in ticks of at most
+        `max_dt`, stopping early once `budget` seconds of wall time are spent.
+        History is decimated to one sample per `history_interval` plant seconds
+        (default: ~10 samples per call, never finer than 1 Hz).
+        Returns the plant seconds actually advanced; the shortfall is kept in
+        self.lag for the caller to report.
+        Ticks coarser than EXPLICIT_MAX_DT run explicit units on the "adaptive"
+        integrator for the duration of the call (journaled both ways).
+        """
+        interval = history_interval if history_interval is not None else max(1.0, plant_seconds / 10.0)
+        self.set_history_interval(interval)
+        coarse = [] if max_dt <= EXPLICIT_MAX_DT else \
+            [uid for uid, u in self.units.items() if u.physics.integrator == "explicit"]
+        for uid in coarse:
+            self.use_integrator(uid, "adaptive")
+        start = time.perf_counter()
+        done = 0.0
+        try:
+            while done < plant_seconds - 1e-9:
+                dt = min(max_dt, plant_seconds - done)
+                self.tick(dt)
+                done += dt
+                if budget is not None and time.perf_counter() - start >= budget:
+                    break
+        finally:
+            for uid in coarse:
+                self.use_integrator(uid, "explicit")
+        self.lag = plant_seconds - done
+        return done
+
     def tick_scenario(self, dt):
         self.scenario_time += dt
-        self.units["A"].time_seconds = self.scenario_time
+        unit = self.units["A"]
+        unit.time_seconds = self.scenario_time
         
-        # 1. Determine Phase
-        active_p = self.active_scenario.phases[0]
-        for p in self.active_scenario.phases:
-            if self.scenario_time >= p["time"]:
-                active_p = p
-        
-        self.current_phase = active_p
+        # 1. Determine Phase (binary search on the compiled phase times)
+        phase_index = self.active_scenario.table.index_at(self.scenario_time)
         
         # 2. Apply State
-        # In scenario mode, we override physics significantly
-        target = active_p["telemetry"]
-        self.units["A"].set_state_override(target)
+        # In scenario mode, we override physics significantly, but only when the phase changes
+        if phase_index != self.phase_index:
+            self.phase_index = phase_index
+            self.current_phase = self.active_scenario.phases[phase_index]
+            unit.set_state_override(self.current_phase["telemetry"])
+        else:
+            unit._record_history()
             
     def update_controls(self, unit_id, controls):
         if self.active_scenario and unit_id == "A":
             return 
             
         if unit_id in self.units:
-            self.units[unit_id].control_state.update(controls)
+            c = self.units[unit_id].control_state
+            if self.journal is not None:
+                changes = {k: v for k, v in controls.items() if k not in c or c[k] != v}
+                if changes:
+                    self.journal.record("controls", unit_id, changes)
+            c.update(controls)
 
     def update_config(self, unit_id, config_dict):
         if unit_id in self.units:
+            if self.journal is not None:
+                self.journal.record("config", unit_id, dict(config_dict))
             u_conf = self.units[unit_id].config
             for k, v in config_dict.items():
                 if hasattr(u_conf, k):
@@ -808,14 +1019,93 @@ class ReactorEngine:
     
     def inject_disturbance(self, unit_id, type="SPIKE"):
         if unit_id in self.units:
-            u_conf = self.units[unit_id].config
-            if type == "SPIKE":
-                u_conf.disturbance_flux = 0.5 
-            elif type == "COOLING_FAIL":
-                u_conf.cooling_penalty = 0.2
-            elif type == "RESET":
-                u_conf.disturbance_flux = 0
-                u_conf.cooling_penalty = 1.0
+            if self.journal is not None:
+                self.journal.record("disturbance", unit_id, type)
+            apply_disturbance(self.units[unit_id].config, type)
+
+    def apply_preset(self, unit_id, preset_name):
+        if unit_id in self.units:
+            if self.journal is not None:
+                self.journal.record("preset", unit_id, preset_name)
+            self.units[unit_id].apply_preset(preset_name)
+
+    def reset_unit(self, unit_id):
+        if unit_id in self.units:
+            if self.journal is not None:
+                self.journal.record("reset", unit_id)
+            self.units[unit_id].reset()
+
+    def set_history_interval(self, interval):
+        """Plant seconds between history samples for every unit, journaled when it changes."""
+        if all(u.history_interval == interval for u in self.units.values()):
+            return
+        if self.journal is not None:
+            self.journal.record("history", interval)
+        for u in self.units.values():
+            u.history_interval = interval
+
+    def use_integrator(self, unit_id, name):
+        """Selects a unit's flux integrator (ReactorUnit.use_integrator), journaled."""
+        if unit_id in self.units:
+            if self.journal is not None:
+                self.journal.record("integrator", unit_id, name)
+            self.units[unit_id].use_integrator(name)
+
+    def use_delayed_neutrons(self, unit_id):
+        """Switches a unit to delayed-neutron kinetics (ReactorUnit.use_delayed_neutrons), journaled."""
+        if unit_id in self.units:
+            if self.journal is not None:
+                self.journal.record("delayed", unit_id)
+            self.units[unit_id].use_delayed_neutrons()
+
+    def use_nodal_core(self, unit_id, geometry="axial", nodes=None, **thresholds):
+        """Adds the nodal diffusion model to a unit (ReactorUnit.use_nodal_core), journaled."""
+        if unit_id in self.units:
+            if self.journal is not None:
+                self.journal.record("nodal", unit_id, geometry, nodes, dict(thresholds))
+            self.units[unit_id].use_nodal_core(geometry, nodes, **thresholds)
+
+    def log_event(self, unit_id, message, code=EVENT_NOTE):
+        """Operator-facing log entry (journaled, so re-simulated logs match)."""
+        if unit_id in self.units:
+            if self.journal is not None:
+                self.journal.record("event", unit_id, message, code)
+            self.units[unit_id].log_event(message, code)
+
+    def start_journal(self):
+        """Starts a fresh input journal based on the current state; returns it."""
+        from .journal import InputJournal
+        from .snapshot import dumps
+        self.journal = InputJournal(dumps(self))
+        if self.rewind is not None:
+            # Older keyframes point into the previous journal
+            self.rewind.clear()
+            self.rewind.capture(self)
+        return self.journal
+
+    def stop_journal(self):
+        journal, self.journal = self.journal, None
+        self.rewind = None
+        return journal
+
+    def start_rewind(self, **kwargs):
+        """Keeps in-memory keyframes (RewindBuffer: interval, max_keyframes) so the session can be rewound."""
+        from .rewind import RewindBuffer
+        if self.journal is None:
+            self.start_journal()
+        self.rewind = RewindBuffer(**kwargs)
+        self.rewind.capture(self)
+        return self.rewind
+
+    def rewind_to(self, t):
+        """Rewinds the whole plant in place to session (journal) time t; returns the time reached."""
+        if self.rewind is None:
+            raise ValueError("Rewind is not enabled (start_rewind)")
+        return self.rewind.restore(self, t)
+
+    def branch(self, unit_id, variants, horizon=120.0, dt=0.1, **kwargs):
+        """Forks one unit into what-if variants without advancing the session."""
+        return self.units[unit_id].branch(variants, horizon=horizon, dt=dt, **kwargs)
             
     def get_all_states(self):
         states = {uid: u.get_full_state() for uid, u in self.units.items()}
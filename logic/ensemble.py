@@ -0,0 +1,176 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from .engine import ReactorUnit, ReactorConfig, ReactorType
+from .fleet import FleetEngine
+
+# ReactorConfig fields the ensemble can perturb
+ENSEMBLE_FIELDS = (
+    "void_coefficient",
+    "doppler_coefficient",
+    "xenon_burnout_rate",
+    "scram_insertion_speed",
+    "cooling_penalty",
+)
+
+# Per-trajectory summary channels (NaN = event never happened within the horizon)
+SUMMARY_FIELDS = ("time_to_scram", "peak_temp", "time_to_melt", "radiation_released")
+
+
+def latin_hypercube(n, ranges, rng=None):
+    """
+    Latin-hypercube sample of n points over {field: (low, high)}.
+    Each field's range is cut into n equal strata and every stratum is hit once.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    samples = {}
+    for field, (low, high) in ranges.items():
+        strata = (rng.permutation(n) + rng.random(n)) / n
+        samples[field] = low + strata * (high - low)
+    return samples
+
+
+def simulate_batch(base_unit, configs, horizon, dt):
+    """
+    Runs one trajectory per row of `configs` ({field: array}) from base_unit's state
+    on a FleetEngine and returns the SUMMARY_FIELDS arrays. Trajectories are not kept.
+    """
+    n = len(next(iter(configs.values())))
+    fleet = FleetEngine(record_history=False)
+    fleet.add_copies(base_unit, range(n))
+    for field, values in configs.items():
+        fleet.config[field] = np.asarray(values, dtype=float).copy()
+
+    t = fleet.telemetry
+    time_to_scram = np.full(n, np.nan)
+    time_to_melt = np.full(n, np.nan)
+    peak_temp = t["temp"].copy()
+
+    steps = int(round(horizon / dt))
+    for step in range(steps):
+        fleet.tick(dt)
+        now = (step + 1) * dt
+        time_to_scram[np.isnan(time_to_scram) & t["scram"]] = now
+        time_to_melt[np.isnan(time_to_melt) & t["melted"]] = now
+        np.fmax(peak_temp, t["temp"], out=peak_temp)
+        if t["melted"].all():
+            break
+
+    return {
+        "time_to_scram": time_to_scram,
+        "peak_temp": peak_temp,
+        "time_to_melt": time_to_melt,
+        "radiation_released": t["radiation_released"].copy(),
+    }
+
+
+def map_chunks(func, bounds, chunk_args, workers):
+    """
+    Yields (start, func(*chunk_args(start, stop))) for every (start, stop) in
+    bounds, in completion order, across a process pool of `workers`.
+    """
+    if workers <= 1:
+        for start, stop in bounds:
+            yield start, func(*chunk_args(start, stop))
+        return
+
+    # Keep only a couple of chunks in flight per worker so memory stays flat
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        queue = iter(bounds)
+        for start, stop in queue:
+            pending[pool.submit(func, *chunk_args(start, stop))] = start
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                start = pending.pop(fut)
+                for next_start, next_stop in queue:
+                    pending[pool.submit(func, *chunk_args(next_start, next_stop))] = next_start
+                    break
+                yield start, fut.result()
+
+
+class EnsembleResult:
+    """Summary arrays of an ensemble run, one entry per sampled trajectory."""
+
+    def __init__(self, samples, n):
+        self.samples = samples
+        self.n = n
+        self.completed = 0
+        for field in SUMMARY_FIELDS:
+            setattr(self, field, np.full(n, np.nan))
+
+    def to_frame(self):
+        import pandas as pd
+        data = dict(self.samples)
+        data.update({field: getattr(self, field) for field in SUMMARY_FIELDS})
+        return pd.DataFrame(data)
+
+
+class EnsembleRunner:
+    """
+    Monte Carlo runner for ReactorConfig uncertainty.
+    Samples config fields with Latin-hypercube sampling, runs the trajectories in
+    vectorized chunks across a process pool and streams per-chunk summaries back.
+    """
+
+    def __init__(self, r_type=ReactorType.PWR, uncertainty=None, ranges=None,
+                 controls=None, telemetry=None, horizon=300.0, dt=0.1,
+                 chunk_size=256, workers=None, seed=None):
+        self.r_type = r_type
+        self.horizon = horizon
+        self.dt = dt
+        self.chunk_size = chunk_size
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.rng = np.random.default_rng(seed)
+
+        # Ranges: explicit (low, high) win; otherwise +/- relative uncertainty around nominal
+        nominal = ReactorConfig(r_type)
+        self.ranges = {}
+        for field, rel in (uncertainty or {}).items():
+            center = getattr(nominal, field)
+            spread = abs(center) * rel
+            self.ranges[field] = (center - spread, center + spread)
+        for field, bounds in (ranges or {}).items():
+            self.ranges[field] = tuple(bounds)
+        for field in self.ranges:
+            if field not in ENSEMBLE_FIELDS:
+                raise ValueError(f"Unsupported ensemble field: {field}")
+
+        # Initial plant state shared by every trajectory
+        self.base_unit = ReactorUnit(0, f"ENSEMBLE ({r_type.value})", r_type)
+        if telemetry:
+            self.base_unit.telemetry.update(telemetry)
+            self.base_unit._trim_to_equilibrium()
+        if controls:
+            self.base_unit.control_state.update(controls)
+
+    def sample(self, n):
+        return latin_hypercube(n, self.ranges, self.rng)
+
+    def iter_chunks(self, samples, n):
+        """Yields (start, summary) per finished chunk, in completion order."""
+        bounds = [(s, min(n, s + self.chunk_size)) for s in range(0, n, self.chunk_size)]
+
+        def chunk_args(start, stop):
+            configs = {f: v[start:stop] for f, v in samples.items()}
+            if not configs:
+                configs = {"cooling_penalty": np.full(stop - start, self.base_unit.config.cooling_penalty)}
+            return (self.base_unit, configs, self.horizon, self.dt)
+
+        yield from map_chunks(simulate_batch, bounds, chunk_args, self.workers)
+
+    def run(self, n, on_chunk=None):
+        """Runs n sampled trajectories and returns an EnsembleResult."""
+        samples = self.sample(n)
+        result = EnsembleResult(samples, n)
+        for start, summary in self.iter_chunks(samples, n):
+            stop = start + len(summary["peak_temp"])
+            for field in SUMMARY_FIELDS:
+                getattr(result, field)[start:stop] = summary[field]
+            result.completed += stop - start
+            if on_chunk:
+                on_chunk(result)
+        return result
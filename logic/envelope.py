@@ -0,0 +1,204 @@
+import os
+import threading
+from itertools import product
+import numpy as np
+from .cache import cache_key, load_or_build
+from .ensemble import map_chunks
+from .equilibrium import critical_rods
+from .fleet import FleetEngine, CONFIG_FIELDS, CONFIG_FLAGS, ALERT_TEMP, ALERT_FLUX, ALERT_FLOW, fleet_supports
+
+# Grid the envelope is tabulated over (same for every reactor type)
+ENVELOPE_AXES = {
+    "power_mw": (0.0, 500.0, 1000.0, 1500.0, 2000.0, 2500.0, 3000.0, 3500.0),
+    "temp": (250.0, 280.0, 310.0, 340.0, 370.0, 400.0, 430.0),
+    "xenon": (0.0, 1.0, 2.0, 3.0),
+    # Rods relative to critical (critical_rods) in %, > 0 = further in: the
+    # plant's fate turns on the reactivity balance, not the raw position
+    "rod_margin": (-20.0, -10.0, -5.0, -2.0, -1.0, 0.0, 1.0, 2.0, 5.0, 10.0, 20.0),
+    "pump_speed": (0.0, 25.0, 50.0, 75.0, 100.0),
+    # A runtime disturbance (LOCA 0.2, DEGRADED 0.8), so an axis rather than part of the key
+    "cooling_penalty": (0.2, 0.5, 0.8, 1.0),
+}
+ENVELOPE_HORIZON = 60.0 # Plant seconds looked ahead from each grid state
+ENVELOPE_DT = 0.5
+ENVELOPE_VERSION = 4 # Bump when the tick or the metrics change
+ENVELOPE_ARRAYS = ("time_to_trip", "recoverable", "trip_cause")
+
+TRIP_CAUSES = ((ALERT_FLUX, "flux"), (ALERT_TEMP, "temperature"), (ALERT_FLOW, "loss-of-flow"))
+
+_ENVELOPES = {}
+_BUILDING = {} # key -> background build thread (envelope_for(wait=False))
+
+
+def simulate_states(base_unit, states, horizon, dt):
+    """
+    Runs every row of `states` ({axis: array}) twice from base_unit's plant:
+    left alone, and with a manual SCRAM at t=0. Returns time_to_trip (capped
+    at horizon), trip_cause (alert bits at the trip) and recoverable (1.0 if
+    the scrammed run ends without melting or losing > 5 % health).
+    """
+    if base_unit.physics.integrator != "explicit" or not fleet_supports(base_unit):
+        # Rows are re-seeded with their own flux below, which only the explicit update follows
+        raise ValueError("Envelope states run on a FleetEngine and need an explicit-integrator base unit")
+    n = len(states["power_mw"])
+    fleet = FleetEngine(record_history=False)
+    fleet.add_copies(base_unit, range(2 * n))
+    t, c = fleet.telemetry, fleet.controls
+    rods = critical_rods(base_unit.config, states["power_mw"], states["temp"], states["xenon"],
+                         base_unit.telemetry.get("boron_ppm", 0.0)) + states["rod_margin"]
+    power = np.tile(states["power_mw"], 2)
+    t["power_mw"][:] = power
+    t["flux"][:] = power / 3200.0
+    fleet.neutron_flux[:] = power / 3200.0
+    t["temp"][:] = np.tile(states["temp"], 2)
+    t["xenon"][:] = np.tile(states["xenon"], 2)
+    c["rods_pos"][:] = np.clip(np.tile(rods, 2), 0.0, 100.0)
+    c["pump_speed"][:] = np.tile(states["pump_speed"], 2)
+    fleet.config["cooling_penalty"][:] = np.tile(states["cooling_penalty"], 2)
+    c["flow_rate_core"][:] = c["pump_speed"] * fleet.config["cooling_penalty"]
+    c["manual_scram"][n:] = True
+    health0 = t["health"].copy()
+
+    time_to_trip = np.full(n, horizon)
+    trip_cause = np.zeros(n, dtype=np.uint8)
+    steps = int(round(horizon / dt))
+    for step in range(steps):
+        fleet.tick(dt)
+        tripped = (time_to_trip >= horizon) & fleet.telemetry["scram"][:n]
+        time_to_trip[tripped] = (step + 1) * dt
+        trip_cause[tripped] = fleet.alert_bits[:n][tripped]
+
+    t = fleet.telemetry
+    ok = ~t["melted"][n:] & (t["health"][n:] >= health0[n:] - 5.0)
+    return {"time_to_trip": time_to_trip, "trip_cause": trip_cause, "recoverable": ok.astype(float)}
+
+
+class SafetyEnvelope:
+    """
+    Tabulated look-ahead over ENVELOPE_AXES for one reactor type and config:
+    seconds until the automatic trip if nothing changes, and whether a SCRAM
+    right now still saves the core. query() interpolates multilinearly
+    between the 64 surrounding grid states, so it costs the same anywhere.
+    """
+
+    def __init__(self, axes, arrays, horizon):
+        self.axes = {name: np.asarray(values, dtype=float) for name, values in axes.items()}
+        self.arrays = arrays
+        self.horizon = horizon
+
+    def _cell(self, state):
+        """Per-axis (lower index, weight) of the grid cell containing state."""
+        cell = []
+        for name, values in self.axes.items():
+            v = min(max(float(state[name]), values[0]), values[-1])
+            i = min(int(np.searchsorted(values, v, side="right")) - 1, len(values) - 2)
+            cell.append((i, (v - values[i]) / (values[i + 1] - values[i])))
+        return cell
+
+    def query(self, unit):
+        """
+        {"time_to_trip": seconds or None (no trip within the horizon),
+         "cause": "flux" | "temperature" | "loss-of-flow" | None,
+         "recoverable": 0..1} at the unit's current state.
+        """
+        t, c = unit.telemetry, unit.control_state
+        xenon = t.get("xenon", 1.0)
+        critical = critical_rods(unit.config, t["power_mw"], t["temp"], xenon, t.get("boron_ppm", 0.0))
+        state = {"power_mw": t["power_mw"], "temp": t["temp"], "xenon": xenon,
+                 "rod_margin": c["rods_pos"] - float(critical), "pump_speed": c["pump_speed"],
+                 "cooling_penalty": unit.config.cooling_penalty}
+        cell = self._cell(state)
+        ttt = self.arrays["time_to_trip"]
+        rec = self.arrays["recoverable"]
+        time_to_trip = recoverable = 0.0
+        for corner in product((0, 1), repeat=len(cell)):
+            w = 1.0
+            index = []
+            for (i, f), bit in zip(cell, corner):
+                w *= f if bit else 1.0 - f
+                index.append(i + bit)
+            if w:
+                index = tuple(index)
+                time_to_trip += w * ttt[index]
+                recoverable += w * rec[index]
+
+        nearest = tuple(i + (f >= 0.5) for i, f in cell)
+        bits = int(self.arrays["trip_cause"][nearest])
+        cause = next((name for bit, name in TRIP_CAUSES if bits & bit), None)
+        if time_to_trip >= self.horizon - 1e-6:
+            return {"time_to_trip": None, "cause": None, "recoverable": float(recoverable)}
+        return {"time_to_trip": float(time_to_trip), "cause": cause, "recoverable": float(recoverable)}
+
+
+def _base_unit(unit):
+    """Fresh unit of the same type carrying the config the envelope depends on."""
+    from .engine import ReactorUnit
+    base = ReactorUnit(0, "ENVELOPE", unit.type)
+    for k in CONFIG_FIELDS + CONFIG_FLAGS:
+        setattr(base.config, k, getattr(unit.config, k))
+    base.config.disturbance_flux = 0.0
+    base.config.cooling_penalty = 1.0 # Set per grid state (ENVELOPE_AXES)
+    return base
+
+
+def _build(base, workers, chunk_size=512):
+    grids = np.meshgrid(*ENVELOPE_AXES.values(), indexing="ij")
+    states = {name: g.ravel() for name, g in zip(ENVELOPE_AXES, grids)}
+    shape = grids[0].shape
+    n = grids[0].size
+    out = {"time_to_trip": np.empty(n), "recoverable": np.empty(n), "trip_cause": np.empty(n, dtype=np.uint8)}
+    bounds = [(s, min(n, s + chunk_size)) for s in range(0, n, chunk_size)]
+
+    def chunk_args(start, stop):
+        return (base, {k: v[start:stop] for k, v in states.items()}, ENVELOPE_HORIZON, ENVELOPE_DT)
+
+    for start, arrays in map_chunks(simulate_states, bounds, chunk_args, workers):
+        for k, v in arrays.items():
+            out[k][start:start + len(v)] = v
+    return {k: v.reshape(shape) for k, v in out.items()}
+
+
+def _tabulate(key, base, workers):
+    try:
+        arrays = load_or_build("envelope", key, ENVELOPE_ARRAYS, lambda: _build(base, workers))
+        _ENVELOPES[key] = SafetyEnvelope(ENVELOPE_AXES, arrays, ENVELOPE_HORIZON)
+    finally:
+        _BUILDING.pop(key, None)
+    return _ENVELOPES[key]
+
+
+def envelope_for(unit, workers=None, wait=True):
+    """
+    SafetyEnvelope for the unit's reactor type, config and trip setpoints.
+    Memoized, and persisted under cache.CACHE_DIR keyed by a hash of all of
+    them, so it is built (across `workers` processes) only when they change.
+    Runtime disturbances (disturbance_flux, cooling_penalty) are not part of
+    the key. With wait=False a missing envelope is built on a background
+    thread and None (no look-ahead yet) is returned meanwhile.
+    """
+    conf, safety = unit.config, unit.safety
+    fields = {k: getattr(conf, k) for k in CONFIG_FIELDS + CONFIG_FLAGS
+              if k not in ("disturbance_flux", "cooling_penalty")}
+    fields.update({
+        "version": ENVELOPE_VERSION, "type": unit.type.value,
+        "axes": ENVELOPE_AXES, "horizon": ENVELOPE_HORIZON, "dt": ENVELOPE_DT,
+        "max_temp": safety.max_temp, "max_flux": safety.max_flux, "min_flow": safety.min_flow,
+    })
+    key = cache_key(fields)
+    envelope = _ENVELOPES.get(key)
+    if envelope is not None:
+        return envelope
+    building = _BUILDING.get(key)
+    if building is not None:
+        if not wait:
+            return None
+        building.join()
+        return _ENVELOPES.get(key)
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    base = _base_unit(unit) # Config captured now: the caller keeps mutating the unit
+    if wait:
+        return _tabulate(key, base, workers)
+    thread = _BUILDING[key] = threading.Thread(target=_tabulate, args=(key, base, workers), daemon=True)
+    thread.start()
+    return None
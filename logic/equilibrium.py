@@ -0,0 +1,287 @@
+from bisect import bisect_right
+import numpy as np
+from .cache import cache_key, load_or_build
+
+# Unknowns solved per unit, in Jacobian column order
+UNKNOWNS = ("rods_pos", "boron_ppm", "temp", "turbine_load_mw", "feedwater_flow")
+
+MAX_POWER_MW = 3200.0 # power_mw = flux * 3200 in the tick
+
+# Precomputed tables (see table_for): steady states over a power grid at
+# fixed temperature, boron and xenon, cached on disk by coefficient hash.
+TABLE_VERSION = 1 # Bump when the residual equations change
+TABLE_POWERS = tuple(float(p) for p in range(100, 3201, 100))
+TABLE_COLUMNS = ("rods_pos", "boron_ppm", "turbine_load_mw", "feedwater_flow")
+_TABLES = {}
+
+_LOWER = np.array([0.0, 0.0, 20.0, 0.0, 0.0])
+_UPPER = np.array([100.0, np.inf, np.inf, np.inf, np.inf])
+
+
+def _residuals(x, p):
+    """
+    Steady-state residuals of ReactorUnit._tick_simulation (no disturbance, no
+    ECCS/vent, rods not moving), each scaled to order one:
+      net reactivity, rods/boron split, temperature or pressure target,
+      heat balance, drum level balance.
+    """
+    rods, boron, temp, load, feed = np.moveaxis(x, -1, 0)
+    power = p["power_mw"]
+    pwr = p["pwr"]
+
+    void = np.where(temp > 280.0, np.minimum(1.0, np.minimum(1.0, (temp - 280.0) * 0.01) * (power / MAX_POWER_MW)), 0.0)
+    rho = ((50.0 - rods) * 0.002
+           + void * p["void_coefficient"]
+           + (temp - 300.0) * 0.0001 * p["doppler_coefficient"]
+           + (p["xenon"] - 1.0) * -0.01
+           + np.where(pwr, -boron / 20000.0, 0.0))
+
+    # PWR: rods parked at rods_ref and boron (chemical shim) takes the rest, unless
+    # boron_ref pins the boron instead. Others carry no boron (boron_ref = 0).
+    free_boron = np.isnan(p["boron_ref"])
+    split = np.where(free_boron, (rods - p["rods_ref"]) / 100.0, (boron - np.nan_to_num(p["boron_ref"])) / 1000.0)
+
+    # PWR pressure relaxes to T/300*150 (+/-20 with heaters/sprays)
+    p_steady = temp / 300.0 * 150.0 + p["pressure_offset"]
+    target = np.where(p["use_pressure"], (p_steady - p["pressure"]) / 150.0, (temp - p["temp"]) / 300.0)
+
+    # Core flow settles at pump_speed * cooling_penalty; cooling scales with flow * penalty again
+    cooling = p["pump_speed"] * p["cooling_penalty"] / 100.0 * p["cooling_penalty"]
+    physical = (temp - 20.0) * 10.0 * cooling
+    sink = np.where(p["msiv_open"], load, 0.0) + p["turbine_bypass"] * 32.0
+    removed = np.maximum(np.minimum(physical, sink), physical * 0.05)
+    heat = (power - removed) / MAX_POWER_MW
+
+    level = (feed / 100.0 * 160.0 - power / 20.0) / 160.0
+
+    return np.stack([rho * 100.0, split, target, heat, level], axis=-1)
+
+
+def critical_rods(config, power_mw, temp, xenon=1.0, boron_ppm=0.0):
+    """
+    Rod position (%) at which net reactivity is zero for the given state, as in
+    _trim_to_equilibrium but with xenon and array inputs; may fall outside 0-100.
+    """
+    temp = np.asarray(temp, dtype=float)
+    void = np.where(temp > 280.0, np.minimum(1.0, np.minimum(1.0, (temp - 280.0) * 0.01) * (np.asarray(power_mw) / MAX_POWER_MW)), 0.0)
+    feedback = (void * config.void_coefficient
+                + (temp - 300.0) * 0.0001 * config.doppler_coefficient
+                + (np.asarray(xenon) - 1.0) * -0.01
+                - np.asarray(boron_ppm) / 20000.0)
+    return 50.0 + feedback / 0.002
+
+
+def solve(params, x0, tol=1e-10, max_iter=25):
+    """
+    Vectorized damped Newton solve of the steady-state equations for N units.
+    `params` maps names to (N,) arrays (see _residuals); x0 is (N, 5) in
+    UNKNOWNS order. Returns (x, converged, residual_norm).
+    """
+    x = np.clip(np.array(x0, dtype=float), _LOWER, _UPPER)
+    n, m = x.shape
+    r = _residuals(x, params)
+    stalled = np.zeros(n, dtype=bool)
+    for _ in range(max_iter):
+        norm = np.abs(r).max(axis=1)
+        active = (norm > tol) & ~stalled
+        if not active.any():
+            break
+        # Forward-difference Jacobian, one column per unknown for every unit at once
+        J = np.empty((n, m, m))
+        for j in range(m):
+            h = 1e-6 * (1.0 + np.abs(x[:, j]))
+            xh = x.copy()
+            xh[:, j] += h
+            J[:, :, j] = (_residuals(xh, params) - r) / h[:, None]
+        step = -np.einsum("nij,nj->ni", np.linalg.pinv(J), r)
+        step[~active] = 0.0
+
+        # Halve the step until the residual stops growing (the heat balance has kinks)
+        scale = np.ones(n)
+        for _ in range(8):
+            trial = np.clip(x + step * scale[:, None], _LOWER, _UPPER)
+            r_trial = _residuals(trial, params)
+            worse = np.abs(r_trial).max(axis=1) > norm
+            if not (worse & active).any():
+                break
+            scale = np.where(worse, scale * 0.5, scale)
+        x, r = trial, r_trial
+        # No progress: the targets are infeasible for this unit, stop iterating it
+        stalled |= active & (np.abs(r).max(axis=1) > norm * 0.999)
+    norm = np.abs(r).max(axis=1)
+    return x, norm <= tol * 10, norm
+
+
+def unit_params(units, power_mw=None, temp=None, pressure=None, pump_speed=None, xenon=None, rods_ref=None,
+                boron_ref=None):
+    """
+    Solver inputs for a list of units. Targets left as None keep each unit's
+    current value; a pressure target (PWR only) replaces the temperature target.
+    A PWR solves for boron at rods_ref unless boron_ref is given.
+    """
+    from .engine import ReactorType
+
+    def column(value, current):
+        if value is None:
+            return np.array([float(current(u)) for u in units])
+        return np.broadcast_to(np.asarray(value, dtype=float), (len(units),)).copy()
+
+    pwr = np.array([u.type == ReactorType.PWR for u in units])
+    c = [u.control_state for u in units]
+    params = {
+        "pwr": pwr,
+        "power_mw": column(power_mw, lambda u: u.telemetry["power_mw"]),
+        "temp": column(temp, lambda u: u.telemetry["temp"]),
+        "pressure": column(pressure, lambda u: u.telemetry.get("pressure", 0.0)),
+        "use_pressure": pwr & (pressure is not None) & (temp is None),
+        "pump_speed": column(pump_speed, lambda u: u.control_state["pump_speed"]),
+        "xenon": column(xenon, lambda u: u.telemetry.get("xenon", 1.0)),
+        "rods_ref": column(rods_ref, lambda u: u.control_state["rods_pos"]),
+        "boron_ref": np.where(pwr, np.nan if boron_ref is None else boron_ref, 0.0),
+        "void_coefficient": np.array([u.config.void_coefficient for u in units]),
+        "doppler_coefficient": np.array([u.config.doppler_coefficient for u in units]),
+        "cooling_penalty": np.array([u.config.cooling_penalty for u in units]),
+        "xenon_burnout_rate": np.array([u.config.xenon_burnout_rate for u in units]),
+        "msiv_open": np.array([bool(cs.get("msiv_open", True)) for cs in c]),
+        "turbine_bypass": np.array([cs.get("turbine_bypass", 0.0) for cs in c]),
+        "pressure_offset": np.array([20.0 * bool(cs.get("pressurizer_heaters")) - 20.0 * bool(cs.get("pressurizer_sprays"))
+                                     for cs in c]),
+    }
+    x0 = np.array([[cs["rods_pos"], u.telemetry.get("boron_ppm", 0.0), u.telemetry["temp"],
+                    cs.get("turbine_load_mw", 1000.0), cs.get("feedwater_flow", 100.0)] for u, cs in zip(units, c)])
+    return params, x0
+
+
+def balance(units, **targets):
+    """
+    Puts each unit into the steady state matching `targets` (power_mw, temp,
+    pressure, pump_speed, xenon, rods_ref, boron_ref; see unit_params). Units whose
+    equations cannot be satisfied (e.g. not enough cooling for the requested
+    power) are left untouched. Returns the per-unit converged mask.
+
+    Xenon in this model has no equilibrium except at flux = 0.5 / burnout rate,
+    so it is held at the requested level (see xenon_drift).
+    """
+    params, x0 = unit_params(units, **targets)
+    x, converged, _ = solve(params, x0)
+    for i, u in enumerate(units):
+        if not converged[i]:
+            continue
+        rods, boron, temp, load, feed = x[i]
+        power = params["power_mw"][i]
+        t, c = u.telemetry, u.control_state
+
+        c["rods_pos"] = rods
+        c["turbine_load_mw"] = load
+        c["feedwater_flow"] = feed
+        c["pump_speed"] = params["pump_speed"][i]
+        c["flow_rate_core"] = params["pump_speed"][i] * params["cooling_penalty"][i]
+        if params["pwr"][i]:
+            c["boron_concentration"] = boron
+            t["boron_ppm"] = boron
+            t["pressure"] = temp / 300.0 * 150.0 + params["pressure_offset"][i]
+
+        t["power_mw"] = power
+        t["flux"] = power / MAX_POWER_MW
+        t["temp"] = temp
+        t["xenon"] = params["xenon"][i]
+        t["void_fraction"] = min(1.0, min(1.0, (temp - 280.0) * 0.01) * (power / MAX_POWER_MW)) if temp > 280.0 else 0.0
+        t["steam_flow"] = power / 20.0
+        t["reactivity"] = 0.0
+
+        u.physics.reactivity = 0.0
+        u.physics.neutron_flux = t["flux"]
+    return converged
+
+
+def xenon_drift(unit):
+    """d(xenon)/dt at the unit's current flux; zero only at flux = 0.5 / xenon_burnout_rate."""
+    return 0.001 - unit.telemetry["flux"] * 0.002 * unit.config.xenon_burnout_rate
+
+
+class EquilibriumTable:
+    """
+    Steady-state controls over TABLE_POWERS for one set of physics
+    coefficients. Every column is linear in power at fixed temperature, so
+    interpolating between grid points is exact. Infeasible rows (not enough
+    cooling, or natural losses above the power) hold NaN.
+    """
+
+    def __init__(self, powers, columns):
+        self.powers = [float(p) for p in powers]
+        self.columns = {name: [float(v) for v in values] for name, values in columns.items()}
+
+    def lookup(self, power_mw):
+        """{column: value} at power_mw, or None outside the feasible grid."""
+        p = self.powers
+        k = min(max(bisect_right(p, power_mw) - 1, 0), len(p) - 2)
+        if not p[0] <= power_mw <= p[-1]:
+            return None
+        w = (power_mw - p[k]) / (p[k + 1] - p[k])
+        out = {}
+        for name, values in self.columns.items():
+            v = values[k] + (values[k + 1] - values[k]) * w
+            if v != v: # NaN: outside the feasible range
+                return None
+            out[name] = v
+        return out
+
+
+def _table_key(r_type, config, temp, boron):
+    fields = {
+        "version": TABLE_VERSION, "type": r_type, "temp": temp, "boron": boron,
+        "powers": TABLE_POWERS,
+        "void": config.void_coefficient, "doppler": config.doppler_coefficient,
+        "cooling": config.cooling_penalty, "xenon_burnout": config.xenon_burnout_rate,
+    }
+    return cache_key(fields)
+
+
+def _build_table(pwr, config, temp, boron):
+    n = len(TABLE_POWERS)
+    full = lambda v: np.full(n, float(v))
+    params = {
+        "pwr": np.full(n, pwr),
+        "power_mw": np.array(TABLE_POWERS),
+        "temp": full(temp),
+        "pressure": full(0.0),
+        "use_pressure": np.zeros(n, dtype=bool),
+        "pump_speed": full(100.0),
+        "xenon": full(1.0),
+        "rods_ref": full(50.0), # Unused: boron is pinned
+        "boron_ref": full(boron),
+        "void_coefficient": full(config.void_coefficient),
+        "doppler_coefficient": full(config.doppler_coefficient),
+        "cooling_penalty": full(config.cooling_penalty),
+        "xenon_burnout_rate": full(config.xenon_burnout_rate),
+        "msiv_open": np.ones(n, dtype=bool),
+        "turbine_bypass": full(0.0),
+        "pressure_offset": full(0.0),
+    }
+    x0 = np.column_stack([full(50.0), full(boron), full(temp), params["power_mw"], params["power_mw"] / 32.0])
+    x, converged, _ = solve(params, x0)
+    x[~converged] = np.nan
+    return {name: x[:, UNKNOWNS.index(name)] for name in TABLE_COLUMNS}
+
+
+def table_for(unit):
+    """
+    Equilibrium table for the unit's reactor type and physics coefficients at
+    its current temperature and boron (nominal 100% pumps, xenon 1.0, MSIV
+    open). Memoized, and persisted under cache.CACHE_DIR so a changed coefficient
+    just hashes to a new table that gets built on first use.
+    """
+    from .engine import ReactorType
+    pwr = unit.type == ReactorType.PWR
+    t = unit.telemetry
+    args = (float(t["temp"]), float(t.get("boron_ppm", 0.0)) if pwr else 0.0)
+    c = unit.config
+    memo = (unit.type, c.void_coefficient, c.doppler_coefficient, c.cooling_penalty, c.xenon_burnout_rate, *args)
+    table = _TABLES.get(memo)
+    if table is not None:
+        return table
+
+    key = _table_key(unit.type.value, c, *args)
+    columns = load_or_build("equilibrium", key, TABLE_COLUMNS, lambda: _build_table(pwr, c, *args))
+    table = _TABLES[memo] = EquilibriumTable(TABLE_POWERS, columns)
+    return table
@@ -0,0 +1,196 @@
+import json
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Structured event codes
+EVENT_NOTE = "NOTE"
+EVENT_USER = "USER"
+EVENT_HISTORICAL = "HISTORICAL"
+EVENT_MELTDOWN = "MELTDOWN"
+EVENT_CONTAINMENT = "CONTAINMENT_BREACH"
+EVENT_FUEL_TEMP = "FUEL_TEMP_CRITICAL"
+EVENT_VOID = "VOID_CRITICAL"
+EVENT_XENON = "XENON_PIT"
+
+DEFAULT_CAPACITY = 1000 # Events kept in memory per unit
+DEBOUNCE_SECONDS = 5.0
+
+
+class EventLog:
+    """
+    Per-unit event store.
+
+    Entries are {"time", "event", "code"[, "key"]} dicts, so the log still reads like the
+    old list (len, [-5:], iteration). A last-seen index per code (and per
+    (code, key)) makes debounce and "already logged" checks constant time.
+    Only the newest `capacity` events stay in memory; older ones are spilled to
+    a JSON-lines file and read back on demand. Times and file offsets are kept
+    in compact arrays so time-range and per-code queries never scan the file.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, spill_path=None, debounce=DEBOUNCE_SECONDS):
+        self.capacity = max(2, int(capacity))
+        self.spill_path = spill_path
+        self.debounce = debounce
+        self._spill = None # Opened on first spill
+        self._memory = [] # Newest events
+        self._spilled = 0 # Events moved to the spill file
+        self._offsets = array("q") # Spill file offset per spilled event
+        self._times = array("d") # Time of every event, in order
+        self._by_code = {} # code -> array of event indices
+        self._last = {} # code or (code, key) -> index of latest event
+        self._shared = False # Index structures shared with a share() clone
+        self._spill_shared = False # Spill file shared with a share() clone (append-only, so never copied)
+
+    def __len__(self):
+        return self._spilled + len(self._memory)
+
+    # --- writing ---
+
+    def log(self, time, message, code=EVENT_NOTE, key=None):
+        """Appends an event unless it repeats the previous message within the debounce window."""
+        if self._shared:
+            self._unshare()
+        if self._memory:
+            last = self._memory[-1]
+            if last["event"] == message and time - last["time"] < self.debounce:
+                return False
+        index = len(self)
+        entry = {"time": time, "event": message, "code": code}
+        if key is not None:
+            entry["key"] = key
+        self._memory.append(entry)
+        self._times.append(time)
+        self._by_code.setdefault(code, array("q")).append(index)
+        self._last[code] = index
+        if key is not None:
+            self._last[(code, key)] = index
+        if len(self._memory) > self.capacity:
+            self._spill_oldest(len(self._memory) - self.capacity // 2)
+        return True
+
+    def _spill_oldest(self, n):
+        if self._spill is None:
+            if self.spill_path:
+                self._spill = open(self.spill_path, "w+", encoding="utf-8")
+            else:
+                self._spill = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._spill.seek(0, 2)
+        for e in self._memory[:n]:
+            self._offsets.append(self._spill.tell())
+            self._spill.write(json.dumps(e) + "\n")
+        self._spill.flush()
+        del self._memory[:n]
+        self._spilled += n
+
+    def clear(self):
+        if self._spill is not None and not self._spill_shared:
+            self._spill.close()
+            self._spill = None
+        self.__init__(self.capacity, self.spill_path, self.debounce)
+
+    # --- index lookups ---
+
+    def last_seen(self, code, key=None):
+        """Time of the latest event with this code (and key), or None."""
+        index = self._last.get(code if key is None else (code, key))
+        return None if index is None else self._times[index]
+
+    def seen_within(self, code, entries=None, seconds=None, now=None, key=None):
+        """True if the latest `code` event is among the last `entries` events and/or within `seconds` of `now`."""
+        index = self._last.get(code if key is None else (code, key))
+        if index is None:
+            return False
+        if entries is not None and len(self) - index > entries:
+            return False
+        if seconds is not None and now - self._times[index] > seconds:
+            return False
+        return True
+
+    def counts(self):
+        return {code: len(rows) for code, rows in self._by_code.items()}
+
+    # --- reading ---
+
+    def _read(self, index):
+        if index >= self._spilled:
+            return self._memory[index - self._spilled]
+        self._spill.seek(self._offsets[index])
+        return json.loads(self._spill.readline())
+
+    def __getitem__(self, key):
+        n = len(self)
+        if isinstance(key, slice):
+            return [self._read(i) for i in range(*key.indices(n))]
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError("event index out of range")
+        return self._read(key)
+
+    def __iter__(self):
+        for i in range(self._spilled):
+            yield self._read(i)
+        yield from list(self._memory)
+
+    def tail(self, n):
+        return self[-n:] if n else []
+
+    def between(self, start=None, end=None):
+        """Events with start <= time <= end (times must be non-decreasing, as plant time is)."""
+        lo = 0 if start is None else bisect_left(self._times, start)
+        hi = len(self) if end is None else bisect_right(self._times, end)
+        return [self._read(i) for i in range(lo, hi)]
+
+    def by_code(self, code, start=None, end=None):
+        """Events with the given code, optionally limited to a time range."""
+        rows = self._by_code.get(code, ())
+        time_of = self._times.__getitem__
+        lo = 0 if start is None else bisect_left(rows, start, key=time_of)
+        hi = len(rows) if end is None else bisect_right(rows, end, key=time_of)
+        return [self._read(rows[i]) for i in range(lo, hi)]
+
+    def copy(self):
+        other = EventLog(self.capacity, None, self.debounce)
+        for e in self:
+            other.log(e["time"], e["event"], e.get("code", EVENT_NOTE), e.get("key"))
+        return other
+
+    def share(self):
+        """
+        Copy-on-write clone. Both logs read the same entries until either logs
+        again; the spill file is append-only, so it stays shared for good.
+        """
+        other = EventLog(self.capacity, None, self.debounce)
+        other.__dict__.update({k: v for k, v in self.__dict__.items() if k != "spill_path"})
+        self._shared = other._shared = True
+        if self._spill is not None:
+            self._spill_shared = other._spill_shared = True
+        return other
+
+    def _unshare(self):
+        self._memory = list(self._memory)
+        self._offsets = array("q", self._offsets)
+        self._times = array("d", self._times)
+        self._by_code = {code: array("q", rows) for code, rows in self._by_code.items()}
+        self._last = dict(self._last)
+        self._shared = False
+
+    def __getstate__(self):
+        state = {k: v for k, v in self.__dict__.items() if k != "_spill"}
+        state["_memory"] = list(self)
+        state["_shared"] = state["_spill_shared"] = False
+        state["_spilled"] = 0
+        state["_offsets"] = array("q")
+        state["spill_path"] = None # A restored copy must not truncate the original's file
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._spill = None
+        if len(self._memory) > self.capacity:
+            self._spill_oldest(len(self._memory) - self.capacity // 2)
+
+    def __repr__(self):
+        return f"EventLog({len(self)} events, {self._spilled} spilled)"
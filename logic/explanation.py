@@ -1,29 +1,23 @@
+from .rules import RULESET
+
+
 class ExplanationEngine:
     @staticmethod
-    def analyze(state):
+    def analyze(state, rules=None):
+        # Cause/effect cards: the "explanation" rules of rules.RULES, on the
+        # unit's own evaluator (unit.rules) when given, else evaluated statelessly
         explanations = []
-        
-        temp = state.get('temp', 300)
-        flux = state.get('flux', 0.0)
-        
-        # 1. Thermal Analysis
-        if temp > 450:
-             explanations.append({
-                "type": "Critical",
-                "title": "Fuel Cladding Failure Risk",
-                "cause": f"Core temp ({temp:.0f}C) exceeds zirconium limits.",
-                "effect": "Release of fission products into coolant loop.",
-                "action": "SCRAM reactor immediately and maximize cooling."
+        if rules is not None:
+            rules.update(state, None, "explanation")
+            values, firing = rules.values("explanation"), rules.active("explanation")
+        else:
+            values, firing = RULESET.evaluate("explanation", state)
+        for rule in firing:
+            explanations.append({
+                "type": rule.severity,
+                "title": rule.text,
+                "cause": rule.format(values, key="cause"),
+                "effect": rule.extra["effect"],
+                "action": rule.extra["action"],
             })
-            
-        # 2. Reactivity Analysis
-        if flux > 1.1:
-             explanations.append({
-                "type": "Warning",
-                "title": "Overpower Transient",
-                "cause": "Reactivity insertion exceeds delayed neutron fraction.",
-                "effect": "Rapid power excursion (Prompt Critical risk).",
-                "action": "Insert control rods to reduce flux."
-            })
-            
         return explanations
@@ -0,0 +1,662 @@
+import numpy as np
+from collections.abc import MutableMapping
+from .engine import ReactorUnit, ReactorType, apply_disturbance
+from .layers.kinetics import PointKinetics
+from .layers.safety import crossing_fraction
+from .recorder import FlightRecorder
+from .rules import RULESET
+from .events import EventLog, EVENT_MELTDOWN, EVENT_CONTAINMENT, EVENT_FUEL_TEMP, EVENT_VOID, EVENT_XENON
+
+# Struct-of-arrays layout. Every unit in the fleet is one row; each field below
+# is one contiguous float64 (or bool) array shared by the whole fleet.
+TELEMETRY_FIELDS = (
+    "flux", "power_mw", "temp", "pressure", "reactivity", "period",
+    "stability_margin", "health", "xenon", "iodine", "void_fraction",
+    "water_level", "steam_flow", "boron_ppm", "graphite_tip_position",
+    "containment_integrity", "radiation_released",
+    "t_inlet", "t_outlet", "mass_flow", "flow_rate_core", "dnbr",
+)
+TELEMETRY_FLAGS = ("scram", "melted")
+
+CONTROL_FIELDS = (
+    "rods_pos", "pump_speed", "flow_rate_core", "boron_concentration",
+    "feedwater_flow", "turbine_bypass", "turbine_load_mw",
+)
+CONTROL_FLAGS = (
+    "manual_scram", "safety_enabled", "pressurizer_heaters", "pressurizer_sprays",
+    "manual_vent", "eccs_active", "msiv_open", "auto_rod_control",
+)
+
+CONFIG_FIELDS = (
+    "responsiveness", "thermal_inertia", "feedback_strength",
+    "void_coefficient", "doppler_coefficient", "xenon_burnout_rate",
+    "scram_insertion_speed", "disturbance_flux", "cooling_penalty",
+    "non_linearity", "coupling_strength", "safety_bias",
+)
+CONFIG_FLAGS = ("scram_tip_effect",)
+
+# reactivity_components keys
+COMPONENT_KEYS = ("void", "doppler", "xenon", "rods", "boron", "total")
+
+# Telemetry keys that are derived from the arrays rather than stored
+DERIVED_TELEMETRY = ("alerts", "warnings", "reactivity_components")
+
+# Per-row layer state and bookkeeping outside the field dicts (order used by add_unit)
+ROW_ARRAYS = ("neutron_flux", "scram_latch", "max_temp", "max_flux", "min_flow", "type_code",
+              "time_seconds", "last_history_time", "alert_bits", "alert_temp", "alert_flux", "warning_bits")
+
+TYPE_CODES = {ReactorType.PWR: 0, ReactorType.BWR: 1, ReactorType.RBMK: 2}
+TYPES_BY_CODE = {v: k for k, v in TYPE_CODES.items()}
+
+# Alert bits (mirrors the messages SafetyLayer.check and the tick produce)
+ALERT_MANUAL = 1
+ALERT_TEMP = 2
+ALERT_FLUX = 4
+ALERT_FLOW = 8
+ALERT_CONTAINMENT = 16
+
+# Warning bits: bit k is the k-th "warning" rule of rules.RULES, the same
+# rules the pre-alarm block at the end of _tick_simulation runs
+WARNING_RULES = [RULESET.rules[i] for i in RULESET.groups["warning"]]
+TYPE_NAMES = np.array([TYPES_BY_CODE[code].value for code in sorted(TYPES_BY_CODE)])
+
+
+class _RowMapping(MutableMapping):
+    """Dict-compatible view over one row of a group of fleet arrays."""
+
+    def __init__(self, fleet, row, fields, flags, kind):
+        self._fleet = fleet
+        self._row = row
+        self._fields = fields
+        self._flags = flags
+        self._kind = kind
+        self._extra = {}
+
+    def _arrays(self):
+        return getattr(self._fleet, self._kind)
+
+    def _derived(self, key):
+        if self._kind == "telemetry" and key in DERIVED_TELEMETRY:
+            return self._fleet._derived_telemetry(self._row, key)
+        raise KeyError(key)
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return float(self._arrays()[key][self._row])
+        if key in self._flags:
+            return bool(self._arrays()[key][self._row])
+        if key in self._extra:
+            return self._extra[key]
+        return self._derived(key)
+
+    def __setitem__(self, key, value):
+        if key in self._fields or key in self._flags:
+            self._arrays()[key][self._row] = value
+        elif self._kind == "telemetry" and key in DERIVED_TELEMETRY:
+            raise KeyError(f"'{key}' is derived from fleet state and is read-only")
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        del self._extra[key]
+
+    def __iter__(self):
+        yield from self._fields
+        yield from self._flags
+        if self._kind == "telemetry":
+            yield from DERIVED_TELEMETRY
+        yield from self._extra
+
+    def __len__(self):
+        n = len(self._fields) + len(self._flags) + len(self._extra)
+        if self._kind == "telemetry":
+            n += len(DERIVED_TELEMETRY)
+        return n
+
+    def copy(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class _RowConfig:
+    """ReactorConfig-compatible attribute view over one fleet row."""
+
+    def __init__(self, fleet, row, r_type):
+        object.__setattr__(self, "_fleet", fleet)
+        object.__setattr__(self, "_row", row)
+        object.__setattr__(self, "type", r_type)
+
+    def __getattr__(self, name):
+        cfg = self._fleet.config
+        if name in CONFIG_FIELDS:
+            return float(cfg[name][self._row])
+        if name in CONFIG_FLAGS:
+            return bool(cfg[name][self._row])
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in CONFIG_FIELDS or name in CONFIG_FLAGS:
+            self._fleet.config[name][self._row] = value
+        else:
+            object.__setattr__(self, name, value)
+
+
+class FleetUnit:
+    """
+    Thin ReactorUnit view over one row of a FleetEngine.
+    Physics state lives in the fleet arrays; the view only owns the per-unit
+    Python objects (event log, history, post-mortem).
+    """
+
+    # Reuse the scalar unit's bookkeeping so both paths log and report identically
+    log_event = ReactorUnit.log_event
+    generate_post_mortem = ReactorUnit.generate_post_mortem
+    apply_preset = ReactorUnit.apply_preset
+    _record_history = ReactorUnit._record_history
+    get_full_state = ReactorUnit.get_full_state
+
+    def __init__(self, fleet, row, id, name, r_type):
+        self.fleet = fleet
+        self.row = row
+        self.id = id
+        self.name = name
+        self.type = r_type
+        self.config = _RowConfig(fleet, row, r_type)
+        self.telemetry = _RowMapping(fleet, row, TELEMETRY_FIELDS, TELEMETRY_FLAGS, "telemetry")
+        self.control_state = _RowMapping(fleet, row, CONTROL_FIELDS, CONTROL_FLAGS, "controls")
+        self.history = FlightRecorder()
+        self.history_interval = 1.0
+        self.event_log = EventLog()
+        self.failure_cause = None
+        self.post_mortem_report = None
+
+    @property
+    def time_seconds(self):
+        return float(self.fleet.time_seconds[self.row])
+
+    @time_seconds.setter
+    def time_seconds(self, value):
+        self.fleet.time_seconds[self.row] = value
+
+
+def fleet_supports(unit):
+    """
+    True when FleetEngine rows reproduce the unit's tick: the explicit or delayed
+    integrator with no sub-cycling, and no multi-rate scheduler or nodal core.
+    """
+    physics = unit.physics
+    return (physics.integrator in ("explicit", "delayed") and physics.max_step is None
+            and getattr(unit, "multirate", None) is None and getattr(unit, "nodal", None) is None)
+
+
+class FleetEngine:
+    """
+    Struct-of-arrays reactor fleet.
+    Holds every unit's state in contiguous NumPy arrays and advances the whole
+    fleet with one vectorized step that mirrors ReactorUnit._tick_simulation.
+
+    This is the batch path (ensembles, sweeps, the safety envelope, what-if
+    branches). The interactive ReactorEngine keeps scalar ReactorUnits on
+    purpose: scenarios, the nodal core, multi-rate integration and the input
+    journal are per-unit features with no fleet equivalent, and three units
+    gain nothing from vectorizing. The two paths must stay numerically
+    identical (verify_fleet.py).
+    """
+
+    def __init__(self, record_history=True):
+        self.record_history = record_history
+        self.units = {}
+        self.rows = [] # Row index -> FleetUnit
+        self.global_time = 0
+        self.n = 0
+        self._spare = {} # Column name -> buffer with spare rows (see _grow)
+
+        self.telemetry = {k: np.zeros(0) for k in TELEMETRY_FIELDS}
+        self.telemetry.update({k: np.zeros(0, dtype=bool) for k in TELEMETRY_FLAGS})
+        self.controls = {k: np.zeros(0) for k in CONTROL_FIELDS}
+        self.controls.update({k: np.zeros(0, dtype=bool) for k in CONTROL_FLAGS})
+        self.config = {k: np.zeros(0) for k in CONFIG_FIELDS}
+        self.config.update({k: np.zeros(0, dtype=bool) for k in CONFIG_FLAGS})
+        self.components = {k: np.zeros(0) for k in COMPONENT_KEYS}
+
+        # Physics / Safety layer state
+        self.kinetics = None # Batched six-group PointKinetics (see use_delayed_neutrons)
+        self.neutron_flux = np.zeros(0)
+        self.scram_latch = np.zeros(0, dtype=bool)
+        self.max_temp = np.zeros(0)
+        self.max_flux = np.zeros(0)
+        self.min_flow = np.zeros(0)
+
+        # Bookkeeping
+        self.type_code = np.zeros(0, dtype=np.int8)
+        self.time_seconds = np.zeros(0)
+        self.last_history_time = np.zeros(0)
+        self.alert_bits = np.zeros(0, dtype=np.uint8)
+        self.alert_temp = np.zeros(0)
+        self.alert_flux = np.zeros(0)
+        self.warning_bits = np.zeros(0, dtype=np.uint8)
+
+    # --- Fleet Construction ---
+
+    def add_reactor(self, id, name, r_type=ReactorType.PWR):
+        """Adds a freshly reset unit (same optimal state as ReactorUnit.reset)."""
+        return self.add_unit(ReactorUnit(id, name, r_type))
+
+    def add_unit(self, unit, id=None):
+        """Copies a ReactorUnit's current state into a new row and returns its view."""
+        row = self.n
+        id = unit.id if id is None else id
+        t = unit.telemetry
+        c = unit.control_state
+        conf = unit.config
+
+        def grow(group, key, value):
+            arrays = getattr(self, group)
+            arrays[key] = self._grow(f"{group}.{key}", arrays[key], [value])
+
+        for k in TELEMETRY_FIELDS:
+            grow("telemetry", k, t.get(k, 0.0))
+        for k in TELEMETRY_FLAGS:
+            grow("telemetry", k, bool(t.get(k, False)))
+        for k in CONTROL_FIELDS:
+            grow("controls", k, c.get(k, 0.0))
+        for k in CONTROL_FLAGS:
+            grow("controls", k, bool(c.get(k, False)))
+        for k in CONFIG_FIELDS:
+            grow("config", k, getattr(conf, k))
+        for k in CONFIG_FLAGS:
+            grow("config", k, bool(getattr(conf, k)))
+        comps = t.get("reactivity_components", {})
+        for k in COMPONENT_KEYS:
+            grow("components", k, comps.get(k, 0.0))
+
+        if self.kinetics is not None:
+            self.kinetics.append([unit.type.value], [unit.physics.neutron_flux])
+        last = unit.history.last("time_seconds") if unit.history else -np.inf
+        row_values = (unit.physics.neutron_flux, unit.safety.scram_status, unit.safety.max_temp,
+                      unit.safety.max_flux, unit.safety.min_flow, TYPE_CODES[unit.type],
+                      float(unit.time_seconds), last, 0, 0.0, 0.0, 0)
+        for k, value in zip(ROW_ARRAYS, row_values):
+            setattr(self, k, self._grow(k, getattr(self, k), [value]))
+        self.n += 1
+
+        view = FleetUnit(self, row, id, unit.name, unit.type)
+        view.history = unit.history.copy()
+        view.event_log = unit.event_log.copy()
+        view.failure_cause = unit.failure_cause
+        view.post_mortem_report = unit.post_mortem_report
+        # Keys the arrays don't cover (e.g. scenario "rods") ride along as extras
+        for k, v in t.items():
+            if k not in TELEMETRY_FIELDS and k not in TELEMETRY_FLAGS and k not in DERIVED_TELEMETRY:
+                view.telemetry[k] = v
+        self.units[id] = view
+        self.rows.append(view)
+        return view
+
+    def _grow(self, name, a, values):
+        """
+        Column `a` with `values` (a sequence) appended. Columns are views into
+        buffers with spare rows that double when full, so adding units one by
+        one costs amortized O(1) per field instead of a full copy each time.
+        A column the tick has since rebound simply gets a fresh buffer.
+        """
+        n, m = len(a), len(values)
+        buf = self._spare.get(name)
+        if buf is None or a.base is not buf or len(buf) < n + m:
+            buf = self._spare[name] = np.empty((max(n + m, 2 * n, 8),) + a.shape[1:], dtype=a.dtype)
+            buf[:n] = a
+        if m == 1:
+            buf[n] = values[0]
+        else:
+            buf[n:n + m] = values
+        return buf[:n + m]
+
+    def add_copies(self, unit, ids):
+        """
+        Adds one row per id, all copies of the unit's current state, and returns
+        their views. Same result as add_unit per id, but grows every array once.
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        first = self.add_unit(unit, id=ids[0])
+        m = len(ids) - 1
+        if not m:
+            return [first]
+
+        def repeat(name, a):
+            return self._grow(name, a, np.repeat(a[-1:], m, axis=0))
+
+        for group in ("telemetry", "controls", "config", "components"):
+            arrays = getattr(self, group)
+            for k, a in arrays.items():
+                arrays[k] = repeat(f"{group}.{k}", a)
+        for k in ROW_ARRAYS:
+            setattr(self, k, repeat(k, getattr(self, k)))
+        if self.kinetics is not None:
+            self.kinetics.append([unit.type.value] * m, np.full(m, unit.physics.neutron_flux))
+
+        extras = {k: v for k, v in unit.telemetry.items()
+                  if k not in TELEMETRY_FIELDS and k not in TELEMETRY_FLAGS and k not in DERIVED_TELEMETRY}
+        views = [first]
+        for id in ids[1:]:
+            view = FleetUnit(self, self.n, id, unit.name, unit.type)
+            view.history = first.history.share()
+            view.event_log = first.event_log.share()
+            view.failure_cause = first.failure_cause
+            view.post_mortem_report = first.post_mortem_report
+            for k, v in extras.items():
+                view.telemetry[k] = v
+            self.units[id] = view
+            self.rows.append(view)
+            views.append(view)
+            self.n += 1
+        return views
+
+    def use_delayed_neutrons(self, rho_threshold=1e-5):
+        """Switches the whole fleet to batched six-group point kinetics."""
+        types = [TYPES_BY_CODE[int(code)].value for code in self.type_code]
+        self.kinetics = PointKinetics(types, self.neutron_flux, rho_threshold=rho_threshold)
+
+    # --- Derived Telemetry ---
+
+    def _derived_telemetry(self, row, key):
+        if key == "reactivity_components":
+            return {k: float(self.components[k][row]) for k in COMPONENT_KEYS}
+        if key == "alerts":
+            bits = self.alert_bits[row]
+            alerts = []
+            if bits & ALERT_MANUAL: alerts.append("MANUAL SCRAM INITIATED")
+            if bits & ALERT_TEMP: alerts.append(f"TEMP HIGH TRIP ({self.alert_temp[row]:.0f}C)")
+            if bits & ALERT_FLUX: alerts.append(f"FLUX HIGH TRIP ({self.alert_flux[row]*100:.0f}%)")
+            if bits & ALERT_FLOW: alerts.append("LOSS OF FLOW TRIP")
+            if bits & ALERT_CONTAINMENT: alerts.append("CONTAINMENT BREACH")
+            return alerts
+        # warnings
+        bits = int(self.warning_bits[row])
+        r_type = TYPE_NAMES[self.type_code[row]]
+        warnings = []
+        for k, rule in enumerate(WARNING_RULES):
+            if bits & (1 << k):
+                values = {f: self.telemetry[f][row] for f in rule.inputs}
+                warnings.append(rule.format(values, rule.limit_for(r_type)))
+        return warnings
+
+    # --- Simulation ---
+
+    def tick(self, dt=1.0):
+        """Advances every unit in the fleet by dt with one vectorized step."""
+        self.global_time += dt
+        if self.n == 0:
+            return
+        self._spare.clear() # The step rebinds most columns: stop holding their old buffers
+        # Runaway units overflow to inf exactly like the scalar float path does
+        with np.errstate(over="ignore", invalid="ignore"):
+            self._tick_simulation(dt)
+
+    def _tick_simulation(self, dt):
+        t = self.telemetry
+        c = self.controls
+        conf = self.config
+        self.time_seconds += dt
+        # Step-start values for locating limit crossings inside the step
+        flux0, temp0, pressure0 = t["flux"].copy(), t["temp"].copy(), t["pressure"].copy()
+        flow0 = c["flow_rate_core"].copy()
+
+        is_pwr = self.type_code == TYPE_CODES[ReactorType.PWR]
+        is_rbmk = self.type_code == TYPE_CODES[ReactorType.RBMK]
+        not_pwr = ~is_pwr
+
+        # --- 0. Control Response & Mechanics ---
+
+        # A. Auto-Rod Control (PID Lite)
+        auto = c["auto_rod_control"] & ~c["manual_scram"]
+        if auto.any():
+            err = c["turbine_load_mw"] - t["power_mw"]
+            c["rods_pos"] = np.where(auto, np.clip(c["rods_pos"] - 0.01 * err * dt, 0.0, 100.0), c["rods_pos"])
+
+        # Flow Logic & Water Inventory (open loop for BWR/RBMK)
+        steam_production = t["power_mw"] / 20.0
+        t["steam_flow"] = steam_production
+        feedwater_in = c["feedwater_flow"] / 100.0 * 160.0
+        level = np.maximum(0.0, t["water_level"] + (feedwater_in - steam_production) * 0.01 * dt)
+        t["water_level"] = np.where(not_pwr, level, t["water_level"])
+        health = t["health"] - np.where(not_pwr & (t["water_level"] < 2.0), 1.0 * dt, 0.0)
+
+        # Flow inertia
+        target_flow = c["pump_speed"] * conf["cooling_penalty"]
+        c["flow_rate_core"] = c["flow_rate_core"] + (target_flow - c["flow_rate_core"]) * 0.1 * dt
+
+        # PWR Pressure Logic
+        pressure = t["pressure"]
+        p_target = (t["temp"] / 300.0) * 150.0 + 20.0 * c["pressurizer_heaters"] - 20.0 * c["pressurizer_sprays"]
+        pressure = np.where(is_pwr, pressure + (p_target - pressure) * 0.1 * dt, pressure)
+
+        # MSIV & Pressure buildup
+        isolated = ~c["msiv_open"] & (c["turbine_bypass"] < 1.0)
+        pressure = pressure + np.where(isolated, 2.0 * dt, 0.0)
+        health = health - np.where(isolated & (pressure > 300), 1.0 * dt, 0.0)
+
+        # Emergency Venting
+        venting = c["manual_vent"] & (pressure > 5.0)
+        pressure = np.where(venting, np.maximum(1.0, pressure - 50.0 * dt), pressure)
+        t["water_level"] = t["water_level"] - np.where(venting, 0.1 * dt, 0.0)
+        radiation = t["radiation_released"] + np.where(venting, 5.0 * dt, 0.0)
+
+        # ECCS Injection
+        temp = t["temp"]
+        eccs = c["eccs_active"]
+        if eccs.any():
+            t["water_level"] = t["water_level"] + np.where(eccs, 0.5 * dt, 0.0)
+            temp = temp - np.where(eccs, 50.0 * dt, 0.0)
+            t["boron_ppm"] = t["boron_ppm"] + np.where(eccs, 100.0 * dt, 0.0)
+            health = health - np.where(eccs & (temp > 800), 2.0 * dt, 0.0)
+
+        # Boron Logic (PWR)
+        boron_mixed = t["boron_ppm"] + (c["boron_concentration"] - t["boron_ppm"]) * 0.05 * dt
+        t["boron_ppm"] = np.where(is_pwr, boron_mixed, t["boron_ppm"])
+        boron_reactivity = np.where(is_pwr, -(t["boron_ppm"] / 20000.0), 0.0)
+
+        # --- 1. Safety Check (Scram Override) ---
+        flux = t["flux"]
+        interlocks = c["safety_enabled"]
+        manual = c["manual_scram"]
+        trip_temp = interlocks & (temp > self.max_temp)
+        trip_flux = interlocks & (flux > self.max_flux)
+        trip_flow = interlocks & (flow0 < self.min_flow) & (flux > 0.1)
+        self.alert_bits = (manual * ALERT_MANUAL | trip_temp * ALERT_TEMP |
+                           trip_flux * ALERT_FLUX | trip_flow * ALERT_FLOW).astype(np.uint8)
+        self.alert_temp = temp.copy()
+        self.alert_flux = flux.copy()
+        self.scram_latch = self.scram_latch | manual | trip_temp | trip_flux | trip_flow
+        is_scrammed = self.scram_latch
+
+        speed = conf["scram_insertion_speed"] * 10.0
+        c["rods_pos"] = np.where(is_scrammed, np.minimum(100.0, c["rods_pos"] + speed * dt), c["rods_pos"])
+        c["manual_scram"] = manual & ~is_scrammed
+
+        # --- 2. Advanced Physics Loop ---
+
+        # A. Rod Worth & Tip Effect
+        raw_rod_pos = c["rods_pos"] / 100.0
+        tip_active = conf["scram_tip_effect"] & is_scrammed & (raw_rod_pos < 0.3) & (raw_rod_pos >= 0.0)
+        tip_reactivity = np.where(tip_active, 0.005, 0.0)
+
+        # B. Reactivity Feedbacks
+        void_fraction = np.where(temp > 280, np.minimum(1.0, np.minimum(1.0, (temp - 280) * 0.01) * (t["power_mw"] / 3200.0)), 0.0)
+        t["void_fraction"] = void_fraction
+        feedback_void = void_fraction * conf["void_coefficient"]
+        feedback_doppler = ((temp - 300) * 0.0001) * conf["doppler_coefficient"]
+
+        xenon_burnout = flux * 0.002 * conf["xenon_burnout_rate"]
+        t["xenon"] = np.maximum(0.0, t["xenon"] + (0.001 - xenon_burnout) * dt)
+        feedback_xenon = (t["xenon"] - 1.0) * -0.01
+
+        disturbances = conf["disturbance_flux"]
+        total_feedback = feedback_void + feedback_doppler + feedback_xenon + tip_reactivity + disturbances + boron_reactivity
+
+        # ReactivityLayer.update (vectorized)
+        rho = (50.0 - c["rods_pos"]) * 0.002 + total_feedback
+        period = np.full(self.n, 9999.0)
+        if self.kinetics is not None:
+            old_flux = self.neutron_flux
+            overridden = self.kinetics.flux != old_flux
+            if overridden.any():
+                self.kinetics.set_flux(np.flatnonzero(overridden), old_flux[overridden])
+            self.neutron_flux = self.kinetics.step(rho, dt).copy()
+            # Real period from the actual flux change
+            ratio = np.divide(self.neutron_flux, old_flux, out=np.ones(self.n), where=old_flux > 0)
+            changing = (ratio > 0) & (ratio != 1.0) & (dt > 0)
+            np.divide(dt, np.log(ratio, out=np.ones(self.n), where=changing), out=period, where=changing)
+        else:
+            tiny = np.abs(rho) < 0.00001
+            np.divide(0.08, rho, out=period, where=~tiny)
+            # fmax: a NaN flux clamps to 0 like the scalar max(0.0, flux)
+            self.neutron_flux = np.fmax(0.0, self.neutron_flux * (1.0 + rho * dt * 5.0))
+
+        t["period"] = period
+        t["reactivity"] = rho
+        comps = self.components
+        comps["void"] = feedback_void
+        comps["doppler"] = feedback_doppler
+        comps["xenon"] = feedback_xenon
+        comps["boron"] = boron_reactivity
+        comps["total"] = total_feedback
+        comps["rods"] = rho - total_feedback
+        t["flux"] = self.neutron_flux.copy()
+
+        # --- 3. Thermal Update ---
+        cooling_factor = (c["flow_rate_core"] / 100.0) * conf["cooling_penalty"]
+        power = t["flux"] * 3200.0
+        t["power_mw"] = power
+
+        sink_mw = np.where(c["msiv_open"], c["turbine_load_mw"], 0.0) + c["turbine_bypass"] * 32.0
+        q_removed_physical = (temp - 20) * 10.0 * cooling_factor
+        q_removed = np.maximum(np.minimum(q_removed_physical, sink_mw), q_removed_physical * 0.05)
+        temp = temp + (power - q_removed) * 0.05 * (dt / conf["thermal_inertia"])
+        t["temp"] = temp
+
+        # Advanced Thermal Hydraulics
+        flow_max = 18000.0
+        mass_flow = flow_max * np.maximum(0.05, c["pump_speed"] / 100.0)
+        delta_t_core = np.where(power > 0, (power * 1e6) / (mass_flow * 4200.0), 0.0)
+        t["t_inlet"] = temp - (delta_t_core / 2.0)
+        t["t_outlet"] = temp + (delta_t_core / 2.0)
+        t["mass_flow"] = mass_flow
+        t["flow_rate_core"] = (mass_flow / flow_max) * 100.0
+
+        power_ratio = np.maximum(0.01, power / 3200.0)
+        pressure_factor = np.clip(pressure / 155.0, 0.5, 1.5)
+        t["dnbr"] = np.minimum(99.9, 3.5 * ((mass_flow / flow_max) / power_ratio) * pressure_factor)
+
+        # --- 3b. Event Location (see ReactorUnit._tick_simulation) ---
+        armed = interlocks & ~is_scrammed
+        cross_temp = armed & (temp0 <= self.max_temp) & (temp > self.max_temp)
+        cross_flux = armed & (flux0 <= self.max_flux) & (t["flux"] > self.max_flux)
+        flow = c["flow_rate_core"]
+        cross_flow = armed & (flow0 >= self.min_flow) & (flow < self.min_flow) & (t["flux"] > 0.1)
+        if cross_temp.any() or cross_flux.any() or cross_flow.any():
+            f_temp = np.where(cross_temp, crossing_fraction(temp0, temp, self.max_temp), np.inf)
+            f_flux = np.where(cross_flux, crossing_fraction(flux0, t["flux"], self.max_flux,
+                                                            log=self.kinetics is not None), np.inf)
+            f_flow = np.where(cross_flow, crossing_fraction(flow0, flow, self.min_flow), np.inf)
+            frac = np.minimum(np.minimum(f_temp, f_flux), f_flow)
+            located = np.isfinite(frac)
+            hit_temp = located & (f_temp == frac)
+            hit_flux = located & (f_flux == frac)
+            hit_flow = located & (f_flow == frac)
+            self.alert_bits |= (hit_temp * ALERT_TEMP | hit_flux * ALERT_FLUX | hit_flow * ALERT_FLOW).astype(np.uint8)
+            self.alert_temp = np.where(hit_temp, self.max_temp, self.alert_temp)
+            self.alert_flux = np.where(hit_flux, self.max_flux, self.alert_flux)
+            self.scram_latch = self.scram_latch | located
+            is_scrammed = self.scram_latch
+            catch_up = c["rods_pos"] + speed * np.where(located, 1.0 - frac, 0.0) * dt
+            c["rods_pos"] = np.where(located, np.minimum(100.0, catch_up), c["rods_pos"])
+
+        # --- 4. Health & Safety ---
+        t["scram"] = is_scrammed.copy()
+        t["stability_margin"] = np.maximum(0, 100 - (np.abs(rho) * 50000) - ((temp / 1000) * 50))
+        health = health - np.where(temp > 900, 1.5 * dt, 0.0)
+
+        new_melt = (temp > 2800.0) & ~t["melted"]
+        t["melted"] = t["melted"] | new_melt
+        health = np.where(new_melt, 0.0, health)
+
+        breach = (pressure > 250.0) & (t["containment_integrity"] > 0)
+        t["containment_integrity"] = np.where(breach, 0.0, t["containment_integrity"])
+        health = np.where(breach, 0.0, health)
+        breach_frac = np.where(breach, crossing_fraction(pressure0, pressure, 250.0), 1.0)
+        radiation = radiation + np.where(breach, 1000.0 * (1.0 - breach_frac) * dt, 0.0)
+        self.alert_bits |= (breach * ALERT_CONTAINMENT).astype(np.uint8)
+
+        t["health"] = health
+        t["pressure"] = pressure
+        t["radiation_released"] = radiation
+
+        # Catastrophic events are rare; only those rows go through Python
+        views = self.rows
+        # (timed at the crossing inside the step, see crossing_fraction)
+        for row in np.flatnonzero(new_melt):
+            u = views[row]
+            u.failure_cause = "Core Meltdown (Fuel Liquefaction)"
+            at = self.time_seconds[row] - dt * (1.0 - float(crossing_fraction(temp0[row], temp[row], 2800.0)))
+            u.log_event("CORE MELTDOWN TRIGGERED", EVENT_MELTDOWN, time=at)
+            u.generate_post_mortem()
+        for row in np.flatnonzero(breach):
+            u = views[row]
+            u.failure_cause = "Containment Vessel Rupture (Overpressure)"
+            u.log_event("CONTAINMENT BREACHED", EVENT_CONTAINMENT, time=self.time_seconds[row] - dt * (1.0 - breach_frac[row]))
+            u.generate_post_mortem()
+
+        # Warning Logic (Pre-Alarm)
+        columns = {"temp": temp, "pressure": pressure, "flow_rate_core": t["flow_rate_core"], "power_mw": power,
+                   "void_fraction": void_fraction, "radiation_released": radiation, "health": health}
+        fired = RULESET.evaluate_arrays(columns, TYPE_NAMES[self.type_code], group="warning")
+        bits = np.zeros(len(temp), dtype=np.uint8)
+        for k, rule in enumerate(WARNING_RULES):
+            bits |= fired[rule.id].astype(np.uint8) << k
+        self.warning_bits = bits
+
+        # Precursor Logging
+        for row in np.flatnonzero(temp > 2000):
+            u = views[row]
+            if not u.event_log.seen_within(EVENT_FUEL_TEMP, entries=3):
+                u.log_event(f"Fuel Temperature Critical: {temp[row]:.1f}C", EVENT_FUEL_TEMP)
+        for row in np.flatnonzero(is_rbmk & (void_fraction > 0.8)):
+            views[row].log_event(f"Void Fraction Critical: {void_fraction[row]*100:.1f}%", EVENT_VOID)
+        for row in np.flatnonzero(t["xenon"] > 2.0):
+            views[row].log_event(f"Xenon Pit Depth Maximum: {t['xenon'][row]:.2f}", EVENT_XENON)
+
+        if self.record_history:
+            due = (self.time_seconds - self.last_history_time) >= 1.0
+            for row in np.flatnonzero(due):
+                views[row]._record_history()
+            self.last_history_time = np.where(due, self.time_seconds, self.last_history_time)
+
+        # Decay disturbance
+        dist = conf["disturbance_flux"]
+        conf["disturbance_flux"] = np.where(dist > 0, dist * 0.9, dist)
+
+    # --- ReactorEngine-compatible Controls ---
+
+    def update_controls(self, unit_id, controls):
+        if unit_id in self.units:
+            self.units[unit_id].control_state.update(controls)
+
+    def update_config(self, unit_id, config_dict):
+        if unit_id in self.units:
+            u_conf = self.units[unit_id].config
+            for k, v in config_dict.items():
+                if k in CONFIG_FIELDS or k in CONFIG_FLAGS:
+                    setattr(u_conf, k, v)
+
+    def inject_disturbance(self, unit_id, type="SPIKE"):
+        if unit_id in self.units:
+            apply_disturbance(self.units[unit_id].config, type)
+
+    def get_all_states(self):
+        states = {uid: u.get_full_state() for uid, u in self.units.items()}
+        states["scenario_meta"] = {"active": False}
+        return states
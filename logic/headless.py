@@ -0,0 +1,146 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from .engine import ReactorUnit, ReactorType, apply_disturbance, EXPLICIT_MAX_DT
+from .scenarios.historical import SCENARIOS
+
+# Columns recorded every sample (telemetry first, then control state)
+TELEMETRY_COLUMNS = (
+    "flux", "power_mw", "temp", "pressure", "reactivity", "period",
+    "xenon", "void_fraction", "water_level", "steam_flow", "boron_ppm",
+    "dnbr", "health", "containment_integrity", "radiation_released",
+    "scram", "melted",
+)
+CONTROL_COLUMNS = ("rods_pos", "pump_speed", "flow_rate_core", "feedwater_flow", "turbine_load_mw")
+
+
+class _Columns:
+    """Preallocated columnar buffer for one run."""
+
+    def __init__(self, size):
+        self.size = size
+        self.count = 0
+        self.data = {"time_seconds": np.zeros(size)}
+        for k in TELEMETRY_COLUMNS + CONTROL_COLUMNS:
+            self.data[k] = np.full(size, np.nan)
+
+    def record(self, unit):
+        i = self.count
+        t = unit.telemetry
+        c = unit.control_state
+        self.data["time_seconds"][i] = unit.time_seconds
+        for k in TELEMETRY_COLUMNS:
+            v = t.get(k)
+            if v is not None:
+                self.data[k][i] = v
+        for k in CONTROL_COLUMNS:
+            v = c.get(k)
+            if v is not None:
+                self.data[k][i] = v
+        self.count += 1
+
+    def result(self, unit):
+        columns = {k: v[:self.count] for k, v in self.data.items()}
+        columns["event_time"] = np.array([e["time"] for e in unit.event_log], dtype=float)
+        columns["event_text"] = np.array([str(e["event"]) for e in unit.event_log], dtype=str)
+        columns["event_code"] = np.array([e.get("code", "") for e in unit.event_log], dtype=str)
+        return columns
+
+
+def apply_action(unit, action):
+    """Applies one schedule entry: controls, config, disturbance and/or preset."""
+    if "controls" in action:
+        unit.control_state.update(action["controls"])
+    for k, v in action.get("config", {}).items():
+        if hasattr(unit.config, k):
+            setattr(unit.config, k, v)
+    if "disturbance" in action:
+        apply_disturbance(unit.config, action["disturbance"])
+    if "preset" in action:
+        unit.apply_preset(action["preset"])
+
+
+def run_unit(r_type, duration, dt=0.1, schedule=None, record_every=1, integrator=None):
+    """
+    Simulates one reactor type for `duration` seconds at step `dt`.
+    `schedule` is a list of actions ({"time": t, "controls": {...}, ...}) applied
+    once plant time reaches t. Returns {column: array} sampled every `record_every` ticks.
+    `integrator` is "explicit", "adaptive" or "delayed" (ReactorUnit.use_integrator);
+    None picks "adaptive" for steps coarser than EXPLICIT_MAX_DT, else "explicit".
+    """
+    if isinstance(r_type, str):
+        r_type = ReactorType[r_type.upper()]
+    unit = ReactorUnit("CLI", f"HEADLESS ({r_type.value})", r_type)
+    unit.use_integrator(integrator or ("adaptive" if dt > EXPLICIT_MAX_DT else "explicit"))
+    actions = sorted(schedule or [], key=lambda a: a.get("time", 0.0))
+    steps = int(round(duration / dt))
+    cols = _Columns(steps // record_every + 1)
+    cols.record(unit)
+
+    next_action = 0
+    for step in range(steps):
+        while next_action < len(actions) and actions[next_action].get("time", 0.0) <= unit.time_seconds + 1e-9:
+            apply_action(unit, actions[next_action])
+            next_action += 1
+        unit.tick(dt)
+        if (step + 1) % record_every == 0:
+            cols.record(unit)
+    return cols.result(unit)
+
+
+def replay_scenario(scenario_id, dt=0.1, duration=None, record_every=1):
+    """Plays a historical scenario through ReactorUnit._tick_replay as fast as possible."""
+    scenario = SCENARIOS[scenario_id]
+    r_type = ReactorType.RBMK if "RBMK" in scenario.details[0] else \
+             ReactorType.PWR if "PWR" in scenario.details[0] else \
+             ReactorType.BWR
+    unit = ReactorUnit("REPLAY", scenario.title, r_type)
+    unit.replay_scenario = scenario
+    unit.is_replay = True
+    unit.time_seconds = 0
+
+    # Run one second past the final phase so its label is logged
+    duration = duration if duration is not None else scenario.phases[-1]["time"] + 1.0
+    steps = int(round(duration / dt))
+    cols = _Columns(steps // record_every + 1)
+    cols.record(unit)
+    for step in range(steps):
+        unit.tick(dt)
+        if (step + 1) % record_every == 0:
+            cols.record(unit)
+    return cols.result(unit)
+
+
+def run_spec(spec):
+    """Runs one manifest entry ({"mode": "run"|"replay", ...}) and returns its columns."""
+    spec = dict(spec)
+    spec.pop("name", None)
+    mode = spec.pop("mode", "run")
+    if mode == "replay":
+        return replay_scenario(spec.pop("scenario"), **spec)
+    return run_unit(spec.pop("type", "PWR"), **spec)
+
+
+def run_manifest(specs, workers=None):
+    """Runs manifest entries across a process pool, yielding (name, columns) in manifest order."""
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    names = [s.get("name", f"run_{i:04d}") for i, s in enumerate(specs)]
+    if workers <= 1:
+        for name, spec in zip(names, specs):
+            yield name, run_spec(spec)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for name, columns in zip(names, pool.map(run_spec, specs)):
+            yield name, columns
+
+
+def write_columns(path, columns):
+    """Writes a run to .npz (everything) or .csv (samples, plus <stem>_events.csv)."""
+    if str(path).endswith(".csv"):
+        import pandas as pd
+        samples = {k: v for k, v in columns.items() if not k.startswith("event_")}
+        pd.DataFrame(samples).to_csv(path, index=False)
+        events = pd.DataFrame({"time": columns["event_time"], "code": columns["event_code"], "event": columns["event_text"]})
+        events.to_csv(str(path)[:-4] + "_events.csv", index=False)
+    else:
+        np.savez_compressed(path, **columns)
@@ -1,57 +1,46 @@
+from .rules import RULESET
+
+
 class Instructor:
     """
     The Instructor analyzes the reactor state and provides educational feedback,
     warnings, and context to the user, mimicking a senior operator or trainer.
     """
     
+    # Look-ahead advice only inside this window (the envelope sees 60s ahead)
+    TRIP_WARNING_SECONDS = 30.0
+
     @staticmethod
-    def analyze(unit):
+    def analyze(unit, envelope=None):
         """
         Returns a list of messages (tips/warnings) based on current state.
         Each message is a dict: {"type": "info"|"warning"|"danger", "msg": str}
+        With a SafetyEnvelope (logic.envelope.envelope_for) it also warns ahead
+        of the automatic trip, from a table lookup rather than a simulation.
         """
         messages = []
         t = unit.telemetry
         c = unit.control_state
-        r_type = unit.type.value
         
-        # 1. Xenon Pit Analysis
-        # If Power is low but Xenon is high, explain the "Xenon Pit"
-        if t["power_mw"] < 500 and t.get("xenon", 1.0) > 1.5:
-             messages.append({
-                 "type": "warning",
-                 "msg": "🛑 **XENON PIT DETECTED**: Power is low, but Xenon poison is high. The reactor is 'poisoned out'. Attempting to raise power now is difficult and dangerous (potential for instability)."
-             })
-
-        # 2. Startup Rate (Period)
-        period = t.get("period", 999)
-        if 0 < period < 20:
-            messages.append({
-                "type": "danger",
-                "msg": "⚠️ **FAST STARTUP**: Reactor period is under 20s. Power is rising exponentially fast. Insert rods immediately to stabilize."
-            })
-            
-        # 3. DNBR (To be implemented in engine, but we check here)
-        dnbr = t.get("dnbr", 3.0)
-        if dnbr < 1.3:
-            messages.append({
-                "type": "danger",
-                "msg": "🔥 **DNBR CRITICAL**: Departure from Nucleate Boiling Ratio is < 1.3. Fuel cladding is overheating. Increase Flow or Scram."
-            })
-
-        # 4. RBMK Specifics
-        if r_type == "RBMK":
-            if c["rods_pos"] < 10 and t["power_mw"] > 1000:
+        # 0. Safety Envelope Look-ahead
+        if envelope is not None and not t.get("scram") and not t.get("melted"):
+            ahead = envelope.query(unit)
+            if ahead["recoverable"] < 0.5:
                 messages.append({
-                    "type": "warning",
-                    "msg": "⚠️ **OPERATING MARGIN LOW**: Operational Reactivity Margin (ORM) is critical. Too many rods are withdrawn. SCRAM effectiveness is reduced."
+                    "type": "danger",
+                    "msg": "☢️ **BEYOND RECOVERY**: From this state even an immediate SCRAM is unlikely to prevent fuel damage. SCRAM and start ECCS now."
                 })
-        
-        # 5. Pressure / MSIV
-        if not c.get("msiv_open", True) and t["pressure"] > 160:
-             messages.append({
-                 "type": "info",
-                 "msg": "💡 **SYSTEM KNOWLEDGE**: With MSIV closed, steam has nowhere to go. Pressure rises until safety valves open. Open the Turbine Bypass or condenser."
-             })
+            elif ahead["time_to_trip"] is not None and ahead["time_to_trip"] <= Instructor.TRIP_WARNING_SECONDS:
+                cause = f"{ahead['cause']} " if ahead["cause"] else ""
+                messages.append({
+                    "type": "danger" if ahead["time_to_trip"] < 10 else "warning",
+                    "msg": f"⏱️ **~{ahead['time_to_trip']:.0f} s TO {cause.upper()}TRIP**: On the current trajectory the automatic {cause}trip fires in about {ahead['time_to_trip']:.0f} s. Insert rods or restore flow now to stay online."
+                })
+
+        # 1. Plant-state remarks (xenon pit, period, DNBR, RBMK margin, MSIV):
+        # the "instructor" rules of rules.RULES
+        rules = getattr(unit, "rules", None) or RULESET.evaluator(unit.type)
+        for rule in rules.update(t, c, "instructor").active("instructor"):
+            messages.append({"type": rule.severity, "msg": rule.text})
 
         return messages
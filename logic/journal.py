@@ -0,0 +1,190 @@
+import json
+from . import snapshot
+
+# Journal entries are short lists, oldest first; `t` is journal time (seconds
+# ticked since the base state):
+#   ["tick", t, dt, n]                  n consecutive engine.tick(dt) calls
+#   ["controls", t, unit_id, {changes}] only the keys that actually changed
+#   ["config", t, unit_id, {fields}]
+#   ["disturbance", t, unit_id, type]
+#   ["preset", t, unit_id, name]
+#   ["reset", t, unit_id]
+#   ["event", t, unit_id, message, code]
+#   ["nodal", t, unit_id, geometry, nodes, {thresholds}]
+#   ["delayed", t, unit_id]
+#   ["integrator", t, unit_id, name]
+#   ["history", t, interval]            history sampling interval of every unit
+#   ["reinitialize", t]
+#   ["scenario", t, scenario_id or None]
+JOURNAL_VERSION = 4
+
+
+class InputJournal:
+    """
+    Append-only record of everything that reaches a ReactorEngine from outside:
+    operator inputs plus run-length encoded ticks. Together with the base
+    snapshot it reproduces the session exactly (see resimulate), so a long
+    session costs kilobytes instead of full-rate telemetry.
+    """
+
+    def __init__(self, base):
+        self.base = base # snapshot.dumps() of the engine when recording started
+        self.entries = []
+        self.time = 0.0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def tick(self, dt):
+        last = self.entries[-1] if self.entries else None
+        if last is not None and last[0] == "tick" and last[2] == dt:
+            last[3] += 1
+        else:
+            self.entries.append(["tick", self.time, dt, 1])
+        self.time += dt
+
+    def record(self, op, *args):
+        self.entries.append([op, self.time, *args])
+
+    def position(self):
+        """Cursor (entry index, ticks into that entry) just past everything recorded so far."""
+        if self.entries and self.entries[-1][0] == "tick":
+            return (len(self.entries) - 1, self.entries[-1][3])
+        return (len(self.entries), 0)
+
+    def dumps(self):
+        """Whole journal (base snapshot, header and entries) as bytes."""
+        body = json.dumps({"journal": JOURNAL_VERSION, "entries": self.entries},
+                          separators=(",", ":")).encode("utf-8")
+        return len(self.base).to_bytes(8, "little") + self.base + body
+
+    @classmethod
+    def loads(cls, data):
+        size = int.from_bytes(data[:8], "little")
+        meta = json.loads(data[8 + size:])
+        if meta["journal"] > JOURNAL_VERSION:
+            raise ValueError(f"Journal format v{meta['journal']} is newer than this build (v{JOURNAL_VERSION})")
+        journal = cls(bytes(data[8:8 + size]))
+        journal.entries = meta["entries"]
+        journal.time = journal._end_time()
+        return journal
+
+    def _end_time(self):
+        if not self.entries:
+            return 0.0
+        e = self.entries[-1]
+        return e[1] + (e[2] * e[3] if e[0] == "tick" else 0.0)
+
+    def truncate(self, cursor):
+        """Drops everything after cursor (entry index, ticks into that entry), e.g. after a rewind."""
+        index, done = cursor
+        del self.entries[index + (1 if done else 0):]
+        if done:
+            self.entries[index][3] = done
+        self.time = self._end_time()
+
+    def save(self, path):
+        data = self.dumps()
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.loads(f.read())
+
+    def apply(self, engine, start=(0, 0), until=None, on_tick=None):
+        """
+        Replays entries from cursor `start` onto `engine` and returns the cursor
+        reached. Stops before any tick that would pass journal time `until`.
+        The engine's own journal is detached meanwhile so nothing is re-recorded.
+        """
+        own, engine.journal = engine.journal, None
+        try:
+            return self._apply(engine, start, until, on_tick)
+        finally:
+            engine.journal = own
+
+    def _apply(self, engine, start, until, on_tick):
+        index, done = start
+        while index < len(self.entries):
+            e = self.entries[index]
+            op, t = e[0], e[1]
+            if op == "tick":
+                dt, n = e[2], e[3]
+                while done < n:
+                    now = t + (done + 1) * dt
+                    if until is not None and now > until + 1e-9:
+                        return (index, done)
+                    engine.tick(dt)
+                    done += 1
+                    if on_tick:
+                        on_tick(engine, now)
+                index, done = index + 1, 0
+                continue
+            if until is not None and t > until + 1e-9:
+                break
+            _apply_entry(engine, e)
+            index += 1
+        return (index, done)
+
+
+def _apply_entry(engine, e):
+    op, args = e[0], e[2:]
+    if op == "controls":
+        engine.update_controls(*args)
+    elif op == "config":
+        engine.update_config(*args)
+    elif op == "disturbance":
+        engine.inject_disturbance(*args)
+    elif op == "preset":
+        engine.apply_preset(*args)
+    elif op == "reset":
+        engine.reset_unit(*args)
+    elif op == "event":
+        engine.log_event(*args)
+    elif op == "nodal":
+        unit_id, geometry, nodes, thresholds = args
+        engine.use_nodal_core(unit_id, geometry, nodes, **thresholds)
+    elif op == "delayed":
+        engine.use_delayed_neutrons(*args)
+    elif op == "integrator":
+        engine.use_integrator(*args)
+    elif op == "history":
+        engine.set_history_interval(*args)
+    elif op == "reinitialize":
+        engine.reinitialize_fleet()
+    elif op == "scenario":
+        if args[0] is None:
+            engine.unload_scenario()
+        else:
+            engine.load_scenario(args[0])
+    else:
+        raise ValueError(f"Unknown journal entry: {op}")
+
+
+def resimulate(journal, until=None, on_tick=None):
+    """Rebuilds the session headlessly from the base snapshot; returns the engine at `until` (default: the end)."""
+    engine = snapshot.loads(journal.base)
+    journal.apply(engine, until=until, on_tick=on_tick)
+    return engine
+
+
+def regenerate_history(journal, unit_id, every=1.0, until=None):
+    """Re-simulates and samples one unit every `every` seconds of journal time; returns {column: array}."""
+    from .headless import _Columns
+    total = sum(e[3] for e in journal.entries if e[0] == "tick")
+    cols = _Columns(total + 1)
+    next_sample = every
+
+    def sample(engine, now):
+        nonlocal next_sample
+        if now >= next_sample - 1e-9:
+            cols.record(engine.units[unit_id])
+            next_sample += every
+
+    engine = snapshot.loads(journal.base)
+    cols.record(engine.units[unit_id])
+    journal.apply(engine, until=until, on_tick=sample)
+    return cols.result(engine.units[unit_id])
@@ -0,0 +1,73 @@
+import numpy as np
+from bisect import bisect_right
+
+# Seconds of scenario time between stored telemetry keyframes
+KEYFRAME_INTERVAL = 1.0
+
+# Tick used to build the reference trace (the live reconstruction plays at 0.1 s)
+KEYFRAME_DT = 0.1
+
+_CACHE = {}
+
+
+def _copy_state(state):
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in state.items()}
+
+
+class ReplayKeyframes:
+    """
+    Reference playback of one scenario for one reactor type, recorded once.
+    Keeps telemetry keyframes every KEYFRAME_INTERVAL seconds plus the full
+    event list and 1 Hz history, so any time can be restored with a binary
+    search and a single phase-table interpolation.
+    """
+
+    def __init__(self, scenario, make_unit, dt=KEYFRAME_DT, interval=KEYFRAME_INTERVAL):
+        self.scenario = scenario
+        self.end = scenario.phases[-1]["time"] + 1.0
+
+        unit = make_unit()
+        unit.replay_scenario = scenario
+        unit.is_replay = True
+        unit.time_seconds = 0
+
+        self.times = [0.0]
+        self.telemetry = [_copy_state(unit.telemetry)]
+        next_keyframe = interval
+        for _ in range(int(round(self.end / dt))):
+            unit.tick(dt)
+            if unit.time_seconds >= next_keyframe - 1e-9:
+                self.times.append(unit.time_seconds)
+                self.telemetry.append(_copy_state(unit.telemetry))
+                next_keyframe += interval
+
+        self.events = list(unit.event_log)
+        self.event_times = [e["time"] for e in self.events]
+        self.history = unit.history.window().copy()
+
+    def restore(self, unit, t):
+        """Puts a replay unit into the state it would have at scenario time t."""
+        t = max(0.0, float(t))
+        k = bisect_right(self.times, t + 1e-9) - 1
+
+        unit.telemetry.update(_copy_state(self.telemetry[k]))
+        unit.time_seconds = t
+        if t > self.times[k] + 1e-9:
+            self.scenario.table.apply(unit.telemetry, t)
+            if unit.telemetry.get("health", 100) <= 0:
+                unit.telemetry["melted"] = True
+
+        unit.event_log.clear()
+        for e in self.events[:bisect_right(self.event_times, t + 1e-9)]:
+            unit.event_log.log(e["time"], e["event"], e.get("code"), e.get("key"))
+
+        rows = int(np.searchsorted(self.history[:, 0], t + 1e-9, side="right"))
+        unit.history.load(self.history[:rows])
+
+
+def keyframes_for(scenario, r_type, make_unit):
+    """Cached ReplayKeyframes per (scenario, reactor type)."""
+    key = (scenario.id, r_type)
+    if key not in _CACHE:
+        _CACHE[key] = ReplayKeyframes(scenario, make_unit)
+    return _CACHE[key]
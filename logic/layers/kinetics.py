@@ -0,0 +1,160 @@
+import numpy as np
+
+# Six-group delayed neutron data per reactor type.
+# beta_i: delayed fractions, lambda_i: precursor decay constants (1/s),
+# generation_time: prompt neutron generation time Lambda (s).
+# LWRs use Keepin's U-235 thermal groups; the RBMK runs a harder, Pu-rich
+# spectrum (lower beta) with graphite moderation (much longer Lambda).
+DELAYED_NEUTRON_DATA = {
+    "PWR": {
+        "beta": (0.000215, 0.001424, 0.001274, 0.002568, 0.000748, 0.000273),
+        "lambda": (0.0124, 0.0305, 0.111, 0.301, 1.14, 3.01),
+        "generation_time": 2.0e-5,
+    },
+    "BWR": {
+        "beta": (0.000215, 0.001424, 0.001274, 0.002568, 0.000748, 0.000273),
+        "lambda": (0.0124, 0.0305, 0.111, 0.301, 1.14, 3.01),
+        "generation_time": 4.0e-5,
+    },
+    "RBMK": {
+        "beta": (0.000160, 0.001060, 0.000950, 0.001910, 0.000560, 0.000200),
+        "lambda": (0.0128, 0.0318, 0.119, 0.318, 1.40, 3.87),
+        "generation_time": 1.0e-3,
+    },
+}
+
+GROUPS = 6
+
+# exp() argument cap; past this the core has long since disassembled
+MAX_EXPONENT = 80.0
+
+# The engine's reactivity is a playability scale, not delta-k/k: the explicit
+# update grows flux at ENGINE_GROWTH_RATE * rho per second. With delayed
+# neutrons a step of reactivity gives a prompt jump of about omega * tau (tau
+# the mean precursor lifetime, ~13 s) on top of a stable period 1/omega, so
+# matching the explicit period would deliver ~13 s of its growth at once and
+# run the RBMK void loop far ahead of the explicit plant. reactivity() instead
+# picks omega so the prompt jump is PROMPT_JUMP_SECONDS of explicit growth:
+# the stable period is then tau times slower than explicit, never faster.
+# It maps omega through the inhour equation for positive reactivity and the
+# slope at zero for negative (SCRAM: prompt drop, then the precursor tail).
+ENGINE_GROWTH_RATE = 5.0
+PROMPT_JUMP_SECONDS = 1.0
+
+# Mapped reactivity is held just below prompt critical (as a fraction of beta).
+# A prompt-critical burst runs on the generation time, far inside one tick,
+# and the engine's feedback (void, Doppler, SCRAM) only acts between ticks, so
+# nothing could turn it over before the flux overflows.
+PROMPT_CRITICAL_MARGIN = 0.99
+
+
+class PointKinetics:
+    """
+    Batched six-group point kinetics.
+    State per unit is [n, C1..C6]. step() takes reactivity in engine units
+    (see ENGINE_GROWTH_RATE). Each unit advances by a cached matrix
+    exponential exp(A(rho) * dt), rebuilt only when that unit's reactivity has
+    drifted more than `rho_threshold` from the cached value (or dt changes), so
+    a normal step is one 7x7 matrix-vector product per unit.
+    """
+
+    def __init__(self, reactor_types=(), flux=None, rho_threshold=1e-5):
+        self.rho_threshold = rho_threshold
+        self.beta = np.zeros((0, GROUPS))
+        self.lam = np.zeros((0, GROUPS))
+        self.gen_time = np.zeros(0)
+        self.state = np.zeros((0, GROUPS + 1))
+        self.rho_cached = np.zeros(0)
+        self.dt_cached = np.zeros(0)
+        self.propagator = np.zeros((0, GROUPS + 1, GROUPS + 1))
+        self.rebuilds = 0 # Matrix exponentials computed (diagnostics)
+        if len(reactor_types):
+            self.append(reactor_types, flux if flux is not None else np.ones(len(reactor_types)))
+
+    @property
+    def n(self):
+        return len(self.gen_time)
+
+    @property
+    def flux(self):
+        return self.state[:, 0]
+
+    def append(self, reactor_types, flux):
+        """Adds units (by type name) at critical equilibrium with the given flux."""
+        flux = np.asarray(flux, dtype=float)
+        beta = np.array([DELAYED_NEUTRON_DATA[t]["beta"] for t in reactor_types], dtype=float)
+        lam = np.array([DELAYED_NEUTRON_DATA[t]["lambda"] for t in reactor_types], dtype=float)
+        gen = np.array([DELAYED_NEUTRON_DATA[t]["generation_time"] for t in reactor_types], dtype=float)
+
+        # Precursor equilibrium: C_i = beta_i * n / (Lambda * lambda_i)
+        state = np.empty((len(flux), GROUPS + 1))
+        state[:, 0] = flux
+        state[:, 1:] = beta * flux[:, None] / (gen[:, None] * lam)
+
+        self.beta = np.vstack([self.beta, beta])
+        self.lam = np.vstack([self.lam, lam])
+        self.gen_time = np.concatenate([self.gen_time, gen])
+        self.state = np.vstack([self.state, state])
+        self.rho_cached = np.concatenate([self.rho_cached, np.full(len(flux), np.nan)])
+        self.dt_cached = np.concatenate([self.dt_cached, np.full(len(flux), np.nan)])
+        self.propagator = np.concatenate([self.propagator, np.zeros((len(flux), GROUPS + 1, GROUPS + 1))])
+
+    def set_flux(self, rows, flux):
+        """Overrides flux for rows, resetting their precursors to equilibrium."""
+        rows = np.atleast_1d(rows)
+        flux = np.broadcast_to(np.asarray(flux, dtype=float), rows.shape)
+        self.state[rows, 0] = flux
+        self.state[rows, 1:] = self.beta[rows] * flux[:, None] / (self.gen_time[rows, None] * self.lam[rows])
+
+    def _matrix(self, rows, rho):
+        """Point-kinetics system matrices A for the given rows."""
+        beta = self.beta[rows]
+        lam = self.lam[rows]
+        gen = self.gen_time[rows]
+        A = np.zeros((len(rows), GROUPS + 1, GROUPS + 1))
+        A[:, 0, 0] = (rho - beta.sum(axis=1)) / gen
+        A[:, 0, 1:] = lam
+        A[:, 1:, 0] = beta / gen[:, None]
+        idx = np.arange(1, GROUPS + 1)
+        A[:, idx, idx] = -lam
+        return A
+
+    def _rebuild(self, rows, rho, dt):
+        """exp(A*dt) via batched eigendecomposition (A has real, distinct inhour roots)."""
+        A = self._matrix(rows, rho) * dt
+        w, V = np.linalg.eig(A)
+        expw = np.exp(np.minimum(w.real, MAX_EXPONENT) + 1j * w.imag)
+        M = (V * expw[:, None, :]) @ np.linalg.inv(V)
+        self.propagator[rows] = M.real
+        self.rho_cached[rows] = rho
+        self.dt_cached[rows] = dt
+        self.rebuilds += len(rows)
+
+    def reactivity(self, rho):
+        """Engine reactivity (array, one per unit) as delta-k/k for these units."""
+        slope = self.gen_time + np.sum(self.beta / self.lam, axis=1) # d(rho)/d(omega) at 0
+        lifetime = slope / self.beta.sum(axis=1) # Mean neutron lifetime incl. precursors
+        omega = ENGINE_GROWTH_RATE * PROMPT_JUMP_SECONDS / lifetime * np.asarray(rho, dtype=float)
+        growth = np.maximum(omega, 0.0)[:, None]
+        inhour = growth[:, 0] * self.gen_time + np.sum(self.beta * growth / (growth + self.lam), axis=1)
+        rho = np.where(omega > 0.0, inhour, omega * slope)
+        return np.minimum(rho, PROMPT_CRITICAL_MARGIN * self.beta.sum(axis=1))
+
+    def step(self, rho, dt):
+        """
+        Advances every unit by dt at engine reactivity rho (array, one per
+        unit). Returns flux. A unit whose reactivity or state is no longer
+        finite (a runaway that already overflowed) is held where it is.
+        """
+        rho = self.reactivity(rho)
+        live = np.isfinite(rho) & np.isfinite(self.state).all(axis=1)
+        stale = live & (~(np.abs(rho - self.rho_cached) <= self.rho_threshold) | (self.dt_cached != dt))
+        if stale.any():
+            rows = np.flatnonzero(stale)
+            self._rebuild(rows, rho[rows], dt)
+        if live.all():
+            self.state = np.einsum("nij,nj->ni", self.propagator, self.state)
+        else:
+            self.state[live] = np.einsum("nij,nj->ni", self.propagator[live], self.state[live])
+        np.maximum(self.state, 0.0, out=self.state)
+        return self.state[:, 0]
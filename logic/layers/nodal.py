@@ -0,0 +1,413 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+from .kinetics import DELAYED_NEUTRON_DATA
+
+# Two-group homogenized core data per reactor type (cm, 1/cm).
+# Group 1 = fast, group 2 = thermal; all fission neutrons are born fast.
+# rod_xs: extra thermal absorption of a fully rodded node. water_xs: RBMK
+# water column below the graphite displacer (see _rod_map). doppler /
+# moderator: fractional change of the fast / thermal absorption per degree C.
+NODAL_DATA = {
+    "PWR": {
+        "height": 366.0, "radius": 170.0,
+        "D": (1.40, 0.40), "absorption": (0.0100, 0.0800), "scatter": 0.0180, "nu_fission": (0.0060, 0.1100),
+        "rod_xs": 0.0030, "water_xs": 0.0, "doppler": 1.5e-4, "moderator": 1.0e-4,
+    },
+    "BWR": {
+        "height": 376.0, "radius": 240.0,
+        "D": (1.45, 0.42), "absorption": (0.0105, 0.0780), "scatter": 0.0170, "nu_fission": (0.0062, 0.1080),
+        "rod_xs": 0.0033, "water_xs": 0.0, "doppler": 1.5e-4, "moderator": 2.0e-4,
+    },
+    "RBMK": {
+        "height": 700.0, "radius": 590.0,
+        "D": (1.30, 0.90), "absorption": (0.0030, 0.0180), "scatter": 0.0045, "nu_fission": (0.0016, 0.0260),
+        "rod_xs": 0.0009, "water_xs": 0.0015, "doppler": 1.0e-4, "moderator": -2.0e-4,
+    },
+}
+
+SPEEDS = (1.0e7, 2.2e5) # Group neutron speeds (cm/s)
+NOMINAL_THERMAL_FLUX = 3.0e13 # n/cm2/s at full power (sets the xenon burn-out rate)
+MIN_POWER, MAX_POWER = 1e-6, 1e3 # Fractions of nominal the flux scale is held within (runaways leave the model's range)
+
+# I-135 / Xe-135 chain
+IODINE_YIELD = 0.061
+XENON_YIELD = 0.003
+IODINE_DECAY = 2.87e-5 # 1/s
+XENON_DECAY = 2.09e-5 # 1/s
+XENON_MICRO_XS = 2.6e-18 # cm2
+NU = 2.43 # Neutrons per fission (converts nu-fission to fission)
+
+FEEDBACK_RANGE = 1500.0 # Degrees above 300 C the temperature feedback is fitted for (clipped beyond)
+RECENTER_TOLERANCE = 1.0e-3 # Shape-only mode: k drift (relative) that re-normalizes the fission operator
+
+# RBMK rods: a graphite displacer hangs below the absorber and leaves a water
+# gap at the bottom of the core when the rod is fully withdrawn
+BOTTOM_WATER_GAP = 0.18 # Fraction of core height
+
+
+class NodalCore:
+    """
+    Two-group nodal diffusion model of one core, on a 1-D axial column
+    (`geometry="axial"`, nodes bottom to top) or a 2-D radial plane
+    (`geometry="radial"`, nodes x nodes). Resolves what the point model
+    cannot: the power shape under rods, xenon and (RBMK) the displacer tips.
+
+    Each step is one implicit (backward Euler) transient solve with a single
+    lumped delayed group. The sparse LU factorization of the step matrix is
+    cached and reused, with defect correction against the current matrix,
+    until rods, node temperatures or xenon drift more than `rod_threshold` /
+    `temp_threshold` / `xenon_threshold` from the factorized state (one
+    factorization is kept per dt). A normal step is a few triangular solves
+    and sparse products.
+    """
+
+    def __init__(self, reactor_type="PWR", geometry="axial", nodes=None,
+                 rod_threshold=1.0, temp_threshold=5.0, xenon_threshold=0.02):
+        if geometry not in ("axial", "radial"):
+            raise ValueError(f"Unknown nodal geometry: {geometry}")
+        self.reactor_type = reactor_type
+        self.geometry = geometry
+        self.side = nodes if nodes is not None else (100 if geometry == "axial" else 32)
+        self.rod_threshold = rod_threshold
+        self.temp_threshold = temp_threshold
+        self.xenon_threshold = xenon_threshold
+        self.factorizations = 0 # LU factorizations computed (diagnostics)
+        self.corrections = 0 # Defect-correction sweeps run (diagnostics)
+
+        data = NODAL_DATA[reactor_type]
+        dnd = DELAYED_NEUTRON_DATA[reactor_type]
+        beta = np.asarray(dnd["beta"])
+        self.beta = float(beta.sum())
+        self.decay = float(self.beta / np.sum(beta / np.asarray(dnd["lambda"]))) # One-group lambda
+        self.data = data
+        self._build_geometry()
+
+        n = self.n
+        self.rods_pos = 50.0
+        self.temps = np.full(n, 300.0)
+        self.phi = np.ones(2 * n) # [fast..., thermal...]
+        self.precursors = np.zeros(n)
+        self.iodine = np.zeros(n)
+        self.xenon = np.zeros(n)
+        self.k0 = 1.0 # Eigenvalue the fission operator is normalized by (critical at initialize)
+        self.power_level = 1.0 # Fraction of nominal power the flux is scaled to
+        self._templates = {} # dt (None = eigenvalue problem) -> state-independent system matrix
+        self._cache = {} # dt -> (state at factorization, LU)
+
+    def __getstate__(self):
+        # SuperLU factorizations do not pickle (process pools): rebuilt on the next step
+        return dict(vars(self), _cache={})
+
+    # --- Geometry & cross sections ---
+
+    def _build_geometry(self):
+        d = self.data
+        m = self.side
+        if self.geometry == "axial":
+            self.n = m
+            self.h = d["height"] / m
+            self.shape = (m,)
+            lap = sp.diags([np.ones(m - 1), np.full(m, -2.0), np.ones(m - 1)], [-1, 0, 1])
+            self.buckling = (2.405 / d["radius"]) ** 2 # Radial leakage of the column
+        else:
+            self.n = m * m
+            self.h = 2.0 * d["radius"] / m
+            self.shape = (m, m)
+            line = sp.diags([np.ones(m - 1), np.full(m, -2.0), np.ones(m - 1)], [-1, 0, 1])
+            eye = sp.identity(m)
+            lap = sp.kron(eye, line) + sp.kron(line, eye)
+            self.buckling = (np.pi / d["height"]) ** 2 # Axial leakage of the plane
+        # Zero-flux boundary one node beyond the edge
+        self.laplacian = (lap / self.h ** 2).tocsr()
+        self.rod_nodes = self._rod_pattern()
+
+    def _rod_pattern(self):
+        """Radial geometry: fraction of each node's channels that hold control rods."""
+        if self.geometry == "axial":
+            return np.ones(self.n)
+        m = self.side
+        i, j = np.meshgrid(np.arange(m), np.arange(m), indexing="ij")
+        r = np.hypot(i - (m - 1) / 2.0, j - (m - 1) / 2.0) / (m / 2.0)
+        banks = ((i % 4 == 1) & (j % 4 == 1)) | ((i % 4 == 3) & (j % 4 == 3))
+        return np.where(banks & (r <= 1.0), 1.0, 0.0).ravel()
+
+    def _rod_map(self, rods_pos):
+        """Extra thermal absorption per node for a rod position (0 out .. 100 in)."""
+        d = self.data
+        inserted = min(max(rods_pos, 0.0), 100.0) / 100.0
+        if self.geometry == "radial":
+            # Axially averaged: the rodded fraction of the height
+            return self.rod_nodes * d["rod_xs"] * inserted
+        m = self.n
+        bottom = np.arange(m) / m # Node edges as fractions of height, from the bottom
+        top = bottom + 1.0 / m
+
+        def overlap(lo, hi):
+            return np.clip(np.minimum(top, hi) - np.maximum(bottom, lo), 0.0, None) * m
+
+        # Absorber enters from the top
+        extra = d["rod_xs"] * overlap(1.0 - inserted, 1.0)
+        if d["water_xs"]:
+            # Below the displacer sits water; the displacer moving down pushes it out
+            # (the bottom-of-core positive reactivity of an RBMK scram)
+            displacer_bottom = max(0.0, BOTTOM_WATER_GAP - inserted)
+            extra = extra + d["water_xs"] * overlap(0.0, displacer_bottom)
+        return extra
+
+    def _absorption(self):
+        """State-dependent (fast, thermal) absorption per node: temperatures, rods, xenon."""
+        d = self.data
+        dt_ref = np.clip(self.temps - 300.0, -300.0, FEEDBACK_RANGE) # Linear feedback saturates past the fitted range
+        a1 = d["absorption"][0] * (1.0 + d["doppler"] * dt_ref)
+        a2 = (d["absorption"][1] * (1.0 + d["moderator"] * dt_ref)
+              + self._rod_map(self.rods_pos) + XENON_MICRO_XS * self.xenon)
+        return np.concatenate([a1, a2])
+
+    def _fission(self, phi):
+        """Fast-group fission source (k0-normalized) of a flux vector."""
+        f1, f2 = self.data["nu_fission"]
+        return (f1 * phi[:self.n] + f2 * phi[self.n:]) / self.k0
+
+    def _template(self, dt):
+        """
+        The state-independent part of the system matrix (loss operator for
+        dt=None, backward-Euler transient matrix otherwise) in CSC, with the
+        positions in its data of the diagonal and of the thermal-to-fast
+        fission coupling, which _matrix fills in per state.
+        """
+        if dt in self._templates:
+            return self._templates[dt]
+        d = self.data
+        n = self.n
+        D1, D2 = d["D"]
+        s12 = d["scatter"]
+        lap = self.laplacian
+        eye = sp.identity(n, format="csr")
+        L11 = -D1 * lap + (s12 + D1 * self.buckling) * eye
+        L22 = -D2 * lap + (D2 * self.buckling) * eye
+        if dt is None:
+            A = sp.bmat([[L11, None], [-s12 * eye, L22]])
+            prompt = 0.0
+        else:
+            v1, v2 = SPEEDS
+            A = sp.bmat([[L11 + (1.0 / (v1 * dt)) * eye, eye],
+                         [-s12 * eye, L22 + (1.0 / (v2 * dt)) * eye]])
+            # Prompt fission plus the precursors born and decaying within the step
+            prompt = 1.0 - self.beta + self.beta * self.decay * dt / (1.0 + self.decay * dt)
+        A = A.tocsc()
+        A.sort_indices()
+
+        def positions(rows, cols):
+            return np.array([A.indptr[j] + np.searchsorted(A.indices[A.indptr[j]:A.indptr[j + 1]], i)
+                             for i, j in zip(rows, cols)], dtype=np.int64)
+
+        nodes = np.arange(n)
+        diag = positions(np.arange(2 * n), np.arange(2 * n))
+        coupling = positions(nodes, nodes + n) if prompt else None
+        base = A.data.copy()
+        if coupling is not None:
+            base[coupling] = 0.0
+        self._templates[dt] = (A, base, diag, coupling, prompt)
+        return self._templates[dt]
+
+    def _matrix(self, dt):
+        """System matrix for dt at the current state: template + absorption (+ prompt fission)."""
+        A, base, diag, coupling, prompt = self._template(dt)
+        data = base.copy()
+        data[diag] += self._absorption()
+        if prompt:
+            f1, f2 = self.data["nu_fission"]
+            data[diag[:self.n]] -= prompt * f1 / self.k0
+            data[coupling] -= prompt * f2 / self.k0
+        return sp.csc_matrix((data, A.indices, A.indptr), shape=A.shape)
+
+    # --- Solvers ---
+
+    def _state_key(self):
+        return self.rods_pos, self.temps.copy(), self.xenon.copy()
+
+    def _stale(self, dt):
+        if dt not in self._cache:
+            return True
+        (rods, temps, xenon), _ = self._cache[dt]
+        if abs(self.rods_pos - rods) > self.rod_threshold:
+            return True
+        if np.max(np.abs(self.temps - temps)) > self.temp_threshold:
+            return True
+        scale = max(float(np.max(xenon)), 1.0)
+        return np.max(np.abs(self.xenon - xenon)) > self.xenon_threshold * scale
+
+    def _solve(self, dt, rhs, tol=1e-9, sweeps=8):
+        """
+        Solves the dt system (see _template) at the current state. The cached
+        factorization is reused while the state stays within the thresholds,
+        with defect correction against the current matrix iterating to the
+        exact solution; a correction that stops converging forces a refactorization.
+        """
+        matrix = self._matrix(dt)
+        if self._stale(dt):
+            if len(self._cache) >= 4: # dt varies (accelerated time): keep only recent ones
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[dt] = (self._state_key(), splu(matrix))
+            self.factorizations += 1
+            return self._cache[dt][1].solve(rhs)
+
+        lu = self._cache[dt][1]
+        x = lu.solve(rhs)
+        norm = np.linalg.norm(rhs) or 1.0
+        last = np.inf
+        for _ in range(sweeps):
+            r = rhs - matrix @ x
+            res = np.linalg.norm(r) / norm
+            if res < tol:
+                return x
+            if not res <= 0.5 * last: # Stalled (or diverged to NaN)
+                break
+            last = res
+            x += lu.solve(r)
+            self.corrections += 1
+        self._cache[dt] = (self._state_key(), splu(matrix))
+        self.factorizations += 1
+        return self._cache[dt][1].solve(rhs)
+
+    def eigenvalue(self, iterations=1000, tol=1e-7):
+        """
+        k-effective and fundamental mode by power iteration (L phi = F phi / k)
+        on the current state. Returns k relative to the normalization k0.
+        """
+        n = self.n
+        phi = self.phi / (np.linalg.norm(self.phi) or 1.0)
+        k = 1.0
+        source = self._fission(phi)
+        rhs = np.zeros(2 * n)
+        for _ in range(iterations):
+            rhs[:n] = source / k
+            phi = self._solve(None, rhs)
+            new_source = self._fission(phi)
+            k_new = k * new_source.sum() / source.sum()
+            # Tall cores have a dominance ratio near 1: k settles long before the shape does
+            shift = np.max(np.abs(new_source / k_new - source / k)) / np.max(np.abs(source / k))
+            source = new_source
+            k = k_new
+            if shift < tol:
+                break
+        self.phi = phi
+        self._scale_flux()
+        return k
+
+    def initialize(self, rods_pos, temp, t_inlet=None, power_level=1.0, xenon_iterations=4):
+        """
+        Sets a critical steady state: solves the fundamental mode with the
+        equilibrium xenon it produces, and normalizes the fission operator so
+        that this state has k = 1.
+        """
+        self.rods_pos = rods_pos
+        self.power_level = min(max(power_level, MIN_POWER), MAX_POWER)
+        self.k0 = 1.0
+        self.xenon[:] = 0.0
+        self.precursors[:] = 0.0
+        for _ in range(xenon_iterations):
+            self._set_temps(temp, t_inlet)
+            self.k0 *= self.eigenvalue()
+            self._equilibrium_xenon()
+        self._set_temps(temp, t_inlet)
+        self.k0 *= self.eigenvalue()
+        self.precursors = self.beta * self._fission(self.phi) / self.decay
+        self._cache = {}
+        return self
+
+    def _scale_flux(self):
+        """Scales phi (and the precursors with it) so the mean thermal flux matches power_level."""
+        mean = self.phi[self.n:].mean()
+        if not mean > 0:
+            return
+        factor = self.power_level * NOMINAL_THERMAL_FLUX / mean
+        self.phi *= factor
+        self.precursors *= factor
+
+    def _set_temps(self, temp, t_inlet=None):
+        """Node temperatures: uniform, or following the local power from t_inlet up (mean = temp)."""
+        if t_inlet is None:
+            self.temps = np.full(self.n, float(temp))
+        else:
+            self.temps = t_inlet + (temp - t_inlet) * self.power_shape()
+
+    def _equilibrium_xenon(self):
+        fission = self.data["nu_fission"][1] / NU * self.phi[self.n:]
+        self.iodine = IODINE_YIELD * fission / IODINE_DECAY
+        self.xenon = ((IODINE_YIELD + XENON_YIELD) * fission
+                      / (XENON_DECAY + XENON_MICRO_XS * self.phi[self.n:]))
+
+    def step(self, dt, rods_pos, temp, t_inlet=None, power_level=None):
+        """
+        Advances the flux, precursors and I/Xe chain by dt at the given rod
+        position and core-average temperature (node temperatures follow the
+        local power between t_inlet and the core). With `power_level` the
+        flux is rescaled to it afterwards (shape-only use beside the point
+        model, which then owns the amplitude). Returns the relative power.
+        """
+        n = self.n
+        self.rods_pos = rods_pos
+        self._set_temps(temp, t_inlet)
+        if power_level is not None:
+            # Shape-only: keep the model near critical. Reactivity is the point
+            # model's business; a mismatch between the two models would
+            # otherwise run the shape away (or drive it prompt critical)
+            balance = self._fission(self.phi).sum() / (self._matrix(None) @ self.phi).sum()
+            if balance > 0 and abs(balance - 1.0) > RECENTER_TOLERANCE:
+                self.k0 *= balance # Cached factorizations absorb this through defect correction
+
+        v1, v2 = SPEEDS
+        rhs = np.concatenate([self.phi[:n] / (v1 * dt), self.phi[n:] / (v2 * dt)])
+        rhs[:n] += self.decay * self.precursors / (1.0 + self.decay * dt)
+        try:
+            phi = self._solve(dt, rhs)
+        except RuntimeError: # Singular step matrix
+            phi = None
+        if phi is None or not phi.min() >= 0.0:
+            # Prompt critical inside the step: the implicit solve has no physical
+            # answer, so fall back to the fundamental mode of the new state
+            self.k0 *= self.eigenvalue()
+            self.precursors = self.beta * self._fission(self.phi) / self.decay
+            self._cache = {}
+            phi = self.phi.copy()
+        else:
+            self.precursors = (self.precursors + dt * self.beta * self._fission(phi)) / (1.0 + self.decay * dt)
+
+        relative = phi[n:].mean() / (self.phi[n:].mean() or 1.0)
+        self.phi = phi
+        if power_level is not None:
+            self.power_level = min(max(power_level, MIN_POWER), MAX_POWER)
+            self._scale_flux()
+        else:
+            self.power_level *= relative
+
+        # I-135 / Xe-135 (backward Euler, stable at any dt)
+        thermal = self.phi[n:]
+        fission = self.data["nu_fission"][1] / NU * thermal
+        self.iodine = (self.iodine + dt * IODINE_YIELD * fission) / (1.0 + IODINE_DECAY * dt)
+        self.xenon = ((self.xenon + dt * (XENON_YIELD * fission + IODINE_DECAY * self.iodine))
+                      / (1.0 + dt * (XENON_DECAY + XENON_MICRO_XS * thermal)))
+        return relative
+
+    # --- Results ---
+
+    def power_shape(self):
+        """Node power relative to the core average (flat = 1.0), in node order."""
+        f1, f2 = self.data["nu_fission"]
+        power = f1 * self.phi[:self.n] + f2 * self.phi[self.n:]
+        mean = power.mean()
+        return power / mean if mean > 0 else np.ones(self.n)
+
+    def peaking_factor(self):
+        return float(self.power_shape().max())
+
+    def axial_offset(self):
+        """(top - bottom) / total power in %, axial geometry only (None for radial)."""
+        if self.geometry != "axial":
+            return None
+        shape = self.power_shape()
+        half = self.n // 2
+        bottom, top = shape[:half].sum(), shape[half:].sum()
+        return float(100.0 * (top - bottom) / (top + bottom))
@@ -1,3 +1,6 @@
+import math
+from .kinetics import PointKinetics
+
 class ReactivityLayer:
     def __init__(self):
         self.reactivity = 0.0 # Delta K/K (0 = Critical)
@@ -8,11 +11,27 @@ class ReactivityLayer:
         # Initial State
         self.control_rod_insertion = 50.0 # % (0 = Out, 100 = In)
         
-    def update(self, rods_pos, temp, extra_k=0.0, dt=1.0):
+        # Integrator
+        # "explicit": single tuned Euler step (original playable behaviour)
+        # "adaptive": error-controlled RK23 sub-steps of flux and core temperature with
+        #             feedback re-evaluated inside the tick, accurate at coarse dt
+        # "delayed": six-group point kinetics (see use_delayed_neutrons)
+        self.integrator = "explicit"
+        self.kinetics = None
+        self.rtol = 1e-4
+        self.max_substeps = 10000
+        self.max_step = None # "explicit" only: sub-cycle the flux update at this step (s); None = one step per update
+        self.substeps = 0 # Sub-steps taken by the last update (diagnostics)
+        self.core_temp = None # "adaptive" with feedback: core temperature at the end of the last update
+        
+    def update(self, rods_pos, temp, extra_k=0.0, dt=1.0, feedback=None):
         """
         Updates neutron flux based on reactivity sources.
         dt in seconds (simulated)
+        feedback(flux, temp) -> (extra_k, dT/dt): "adaptive" re-evaluates it inside
+        the tick and integrates the core temperature too (left in self.core_temp).
         """
+        self.core_temp = None
         # 1. Control Rod Worth
         # Simple linear worth for now, can be cosine later
         # 0% rods = +0.05 reactivity (Supercritical)
@@ -35,7 +54,8 @@ class ReactivityLayer:
         self.reactivity = rho_rods + rho_temp - self.xenon_poisoning + extra_k
         
         # Point Kinetics (Simplified)
-        # dN/dt = (rho - beta)/L * N ... ignoring delayed for now for simpler UX
+        # dN/dt = (rho - beta)/L * N; "explicit"/"adaptive" ignore delayed neutrons
+        # for a snappier UX, "delayed" carries the precursors (use_delayed_neutrons)
         # Exponential Period equation: P = P0 * e^(t/T)
         # Period T approx l / rho (simplified)
         
@@ -45,11 +65,93 @@ class ReactivityLayer:
             self.period = 0.08 / self.reactivity # 0.08 generation time approx
             
         # Flux Update
-        # Limit exponential growth closely
-        growth_factor = self.reactivity * dt * 5.0 # Tuned for playable speed
-        self.neutron_flux *= (1.0 + growth_factor)
+        if self.integrator == "delayed":
+            old_flux = self.neutron_flux
+            if self.kinetics.flux[0] != old_flux:
+                # Flux was overridden externally (trim / state override)
+                self.kinetics.set_flux(0, old_flux)
+            self.neutron_flux = float(self.kinetics.step([self.reactivity], dt)[0])
+            self.substeps = 1
+            # Real period from the actual flux change (prompt jump included)
+            if old_flux > 0 and self.neutron_flux > 0 and self.neutron_flux != old_flux and dt > 0:
+                self.period = dt / math.log(self.neutron_flux / old_flux)
+            else:
+                self.period = 9999.0
+        elif self.integrator == "adaptive":
+            if feedback is None:
+                # Nothing to re-evaluate inside the tick: frozen reactivity has the exact solution
+                exponent = self.reactivity * 5.0 * dt
+                self.neutron_flux *= math.exp(exponent) if exponent < 700.0 else math.inf
+                self.substeps = 1
+            else:
+                self.neutron_flux, self.core_temp = self._integrate_adaptive(
+                    self.neutron_flux, temp, self.reactivity - extra_k, dt, feedback)
+        else:
+            # Limit exponential growth closely
+            steps = max(1, math.ceil(dt / self.max_step - 1e-9)) if self.max_step else 1
+            growth_factor = self.reactivity * (dt / steps) * 5.0 # Tuned for playable speed
+            # Sub-cycles at frozen reactivity compound in closed form
+            self.neutron_flux *= max(0.0, 1.0 + growth_factor) ** steps
+            self.substeps = steps
         
         # Clamp
         self.neutron_flux = max(0.0, self.neutron_flux)
         
         return self.neutron_flux
+
+    def use_delayed_neutrons(self, reactor_type):
+        """Switches flux updates to six-group point kinetics for "PWR", "BWR" or "RBMK"."""
+        self.kinetics = PointKinetics([reactor_type], [self.neutron_flux])
+        self.integrator = "delayed"
+
+    def _integrate_adaptive(self, flux, temp, rho_held, dt, feedback):
+        """
+        Integrates flux and core temperature together over dt with error-controlled
+        Bogacki-Shampine 3(2) sub-steps. feedback(flux, temp) -> (extra_k, dT/dt)
+        is re-evaluated at every stage, so void/Doppler feedback follows the
+        heat-up inside the tick instead of being frozen at its start. The flux is
+        carried as its logarithm: a SCRAM's fast decay is then a bounded rate
+        rather than a stiff one, and the flux can never be driven negative.
+        """
+        if dt <= 0.0:
+            self.substeps = 0
+            return flux, temp
+
+        def rates(log_flux, temp):
+            extra_k, temp_rate = feedback(math.exp(min(log_flux, 700.0)), temp)
+            return (rho_held + extra_k) * 5.0, temp_rate
+
+        u = math.log(flux) if flux > 0.0 else -math.inf
+        k1 = rates(u, temp)
+        t = 0.0
+        h = dt
+        steps = 0
+        while t < dt and steps < self.max_substeps:
+            h = min(h, dt - t)
+            steps += 1
+            u_new, temp_new, k4, err = self._bs23_step(rates, u, temp, k1, h)
+            # Error per component: relative in flux (log space), relative in temperature
+            err = max(err[0] / self.rtol, err[1] / (self.rtol * max(1.0, abs(temp))))
+            if err <= 1.0:
+                t += h
+                u, temp, k1 = u_new, temp_new, k4
+            # Standard step-size controller (a non-finite error just shrinks the step)
+            scale = 0.9 * err ** (-1.0 / 3.0) if err > 0 else 5.0
+            h *= min(5.0, max(0.2, scale)) if math.isfinite(scale) else 0.2
+
+        if t < dt:
+            # Out of sub-steps: finish the tick with one unchecked step rather than dropping it
+            u, temp, _, _ = self._bs23_step(rates, u, temp, k1, dt - t)
+        self.substeps = steps
+        return math.exp(min(u, 700.0)), temp
+
+    @staticmethod
+    def _bs23_step(rates, u, temp, k1, h):
+        """One Bogacki-Shampine 3(2) step of (log flux, temp); returns the new state, its rates and the error pair."""
+        k2 = rates(u + 0.5 * h * k1[0], temp + 0.5 * h * k1[1])
+        k3 = rates(u + 0.75 * h * k2[0], temp + 0.75 * h * k2[1])
+        u_new = u + h * (2.0 * k1[0] + 3.0 * k2[0] + 4.0 * k3[0]) / 9.0
+        temp_new = temp + h * (2.0 * k1[1] + 3.0 * k2[1] + 4.0 * k3[1]) / 9.0
+        k4 = rates(u_new, temp_new)
+        err = tuple(h * abs(-5.0 * a / 72.0 + b / 12.0 + c / 9.0 - d / 8.0) for a, b, c, d in zip(k1, k2, k3, k4))
+        return u_new, temp_new, k4, err
@@ -0,0 +1,54 @@
+# Step size (plant seconds) each subsystem advances with under multi-rate
+# integration. Kinetics sub-cycles inside a tick; the others collect ticks
+# and update once their interval has passed. Boron and xenon feed reactivity,
+# so their steps stay short enough that the update is not felt as a kick.
+DEFAULT_PERIODS = {
+    "kinetics": 0.05, # Prompt flux response: fastest time constant in the tick
+    "flow": 0.5,      # Pump coast-down / spin-up (~10 s)
+    "pressure": 0.5,  # Pressurizer relaxation (~10 s)
+    "boron": 1.0,     # Boron mixing (~20 s)
+    "xenon": 2.0,     # Xenon build-up / burn-out (hours; integrated exactly from the mean flux)
+}
+
+
+class MultiRateScheduler:
+    """
+    Per-subsystem step sizes for ReactorUnit._tick_simulation (see
+    ReactorUnit.use_multirate). A slow subsystem is skipped on most ticks and
+    then integrated once over all the time it skipped, so a tick only pays
+    for the subsystems that are due.
+    """
+
+    def __init__(self, periods=None):
+        self.periods = dict(DEFAULT_PERIODS, **(periods or {}))
+        # Kinetics sub-cycles inside ReactivityLayer.update (max_step); the rest are scheduled here
+        slow = [name for name in self.periods if name != "kinetics"]
+        self.pending = {name: 0.0 for name in slow} # Plant seconds not yet integrated
+        self.integral = {name: 0.0 for name in slow} # Sum of value * dt over the pending time
+        self.updates = {name: 0 for name in slow} # Updates run (diagnostics)
+
+    def take(self, name, dt):
+        """
+        Adds dt to the subsystem's pending time. Returns the pending time once
+        it reaches the subsystem's period (and starts over), else 0.0.
+        """
+        pending = self.pending[name] + dt
+        if pending < self.periods[name] - 1e-9:
+            self.pending[name] = pending
+            return 0.0
+        self.pending[name] = 0.0
+        self.updates[name] += 1
+        return pending
+
+    def take_mean(self, name, dt, value):
+        """
+        take() for a subsystem driven by `value` (e.g. xenon by flux): also
+        returns value's time-average over the span being integrated.
+        """
+        self.integral[name] += value * dt
+        elapsed = self.take(name, dt)
+        if not elapsed:
+            return 0.0, value
+        mean = self.integral[name] / elapsed
+        self.integral[name] = 0.0
+        return elapsed, mean
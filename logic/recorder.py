@@ -0,0 +1,393 @@
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+import numpy as np
+
+# Channels sampled by ReactorUnit._record_history (reactivity terms in pcm)
+HISTORY_CHANNELS = (
+    "time_seconds", "power_mw", "temp", "reactivity",
+    "rho_rods", "rho_void", "rho_doppler", "rho_xenon", "rho_boron", "rho_total",
+)
+
+# One hour at the 1 Hz recording rate. Units that need whole-shift or
+# multi-day traces pass a larger capacity (millions of samples are fine;
+# storage grows on demand and is only reserved up to what was recorded).
+DEFAULT_CAPACITY = 3600
+
+_INITIAL_SIZE = 256
+
+
+class FlightRecorder:
+    """
+    Preallocated columnar ring buffer, one float64 column per channel.
+
+    Every sample is written twice, at slot i and i + size, so the newest
+    `len(self)` samples always sit in one contiguous block. window(), column
+    access and to_frame() are therefore views into the buffer, never copies.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, channels=HISTORY_CHANNELS):
+        self.capacity = int(capacity)
+        self.channels = tuple(channels)
+        self._index = {c: i for i, c in enumerate(self.channels)}
+        self._data = None # (2 * size, channels), allocated on first append
+        self._size = 0
+        self._count = 0 # Samples held (<= size)
+        self._head = 0 # Next write slot in [0, size)
+        self._shared = False # Buffer shared with a share() clone; copied before the next write
+
+    def __len__(self):
+        return self._count
+
+    def _grow(self):
+        """Doubles storage (up to capacity) while the buffer has not wrapped yet."""
+        size = min(self.capacity, max(_INITIAL_SIZE, self._size * 2))
+        data = np.empty((2 * size, len(self.channels)))
+        if self._count:
+            window = self.window()
+            data[:self._count] = window
+            data[size:size + self._count] = window
+        self._data = data
+        self._size = size
+        self._head = self._count % size
+
+    def append(self, values):
+        """Records one sample (a sequence in channel order)."""
+        if self._shared:
+            self._unshare()
+        if self._count == self._size and self._size < self.capacity:
+            self._grow()
+        h = self._head
+        self._data[h] = values
+        self._data[h + self._size] = values
+        self._head = (h + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+
+    def clear(self):
+        self._count = 0
+        self._head = 0
+
+    def load(self, rows):
+        """Replaces the contents with `rows` ((n, channels), oldest first; keeps the newest capacity)."""
+        rows = np.asarray(rows, dtype=float)[-self.capacity:]
+        self.clear()
+        if self._shared:
+            self._data, self._size, self._shared = None, 0, False
+        n = len(rows)
+        if n == 0:
+            return
+        size = max(_INITIAL_SIZE, self._size)
+        while size < n:
+            size *= 2
+        size = min(size, self.capacity)
+        if size != self._size:
+            self._data = np.empty((2 * size, len(self.channels)))
+            self._size = size
+        self._data[:n] = rows
+        self._data[size:size + n] = rows
+        self._count = n
+        self._head = n % size
+
+    def window(self):
+        """(n, channels) view of the recorded samples, oldest first."""
+        if self._data is None:
+            return np.empty((0, len(self.channels)))
+        start = self._head if self._count == self._size else 0
+        return self._data[start:start + self._count]
+
+    def last(self, channel):
+        """Most recent value of one channel."""
+        return self._data[(self._head - 1) % self._size, self._index[channel]]
+
+    def __getitem__(self, key):
+        """recorder["temp"] -> column view; recorder[-1] -> sample dict; recorder[-5:] -> list of dicts."""
+        if isinstance(key, str):
+            return self.window()[:, self._index[key]]
+        if isinstance(key, slice):
+            return [dict(zip(self.channels, row)) for row in self.window()[key].tolist()]
+        return dict(zip(self.channels, self.window()[key].tolist()))
+
+    def __iter__(self):
+        for row in self.window().tolist():
+            yield dict(zip(self.channels, row))
+
+    def columns(self):
+        return {c: self.window()[:, i] for i, c in enumerate(self.channels)}
+
+    def to_frame(self):
+        """DataFrame backed by the ring buffer (no copy)."""
+        import pandas as pd
+        return pd.DataFrame(self.window(), columns=list(self.channels), copy=False)
+
+    def copy(self):
+        other = FlightRecorder(self.capacity, self.channels)
+        if self._count:
+            other._size = self._size
+            other._data = np.empty_like(self._data)
+            window = self.window()
+            other._data[:self._count] = window
+            other._data[self._size:self._size + self._count] = window
+            other._count = self._count
+            other._head = self._count % self._size
+        return other
+
+    def share(self):
+        """Copy-on-write clone: both recorders read one buffer until either records again."""
+        other = FlightRecorder(self.capacity, self.channels)
+        other._data, other._size, other._count, other._head = self._data, self._size, self._count, self._head
+        if self._data is not None:
+            self._shared = other._shared = True
+        return other
+
+    def _unshare(self):
+        self._data = self._data.copy()
+        self._shared = False
+
+    def __repr__(self):
+        return f"FlightRecorder({self._count}/{self.capacity} samples, channels={self.channels})"
+
+
+# --- On-disk recorder ---------------------------------------------------------
+
+# Channels persisted every tick (flags are stored as 0.0/1.0; missing values as NaN)
+DISK_TELEMETRY_CHANNELS = (
+    "flux", "power_mw", "temp", "pressure", "reactivity", "period",
+    "xenon", "void_fraction", "water_level", "steam_flow", "boron_ppm",
+    "t_inlet", "t_outlet", "mass_flow", "dnbr", "stability_margin", "health",
+    "containment_integrity", "radiation_released", "scram", "melted",
+)
+DISK_CONTROL_CHANNELS = (
+    "rods_pos", "pump_speed", "flow_rate_core", "boron_concentration",
+    "feedwater_flow", "turbine_bypass", "turbine_load_mw",
+)
+DISK_COMPONENT_CHANNELS = ("void", "doppler", "xenon", "rods", "boron", "total")
+DISK_CHANNELS = (
+    ("time_seconds",)
+    + DISK_TELEMETRY_CHANNELS
+    + tuple(f"ctl_{k}" for k in DISK_CONTROL_CHANNELS)
+    + tuple(f"rho_{k}" for k in DISK_COMPONENT_CHANNELS)
+)
+
+# File layout: [magic 8][committed rows uint64][header length uint32][JSON header]
+# padded to HEADER_SIZE, then fixed-width little-endian float64 rows.
+MAGIC = b"RXREC01\n"
+HEADER_SIZE = 4096
+FORMAT_VERSION = 1
+_COUNT_OFFSET = 8
+_JSON_OFFSET = 20
+
+BLOCK_ROWS = 4096 # Rows staged in memory per hand-off to the writer thread
+GROW_ROWS = 65536 # File growth step
+
+
+def _read_header(f):
+    f.seek(0)
+    raw = f.read(HEADER_SIZE)
+    if raw[:8] != MAGIC:
+        raise ValueError("Not a reactor flight recording")
+    count = int(np.frombuffer(raw, dtype="<u8", count=1, offset=_COUNT_OFFSET)[0])
+    length = int(np.frombuffer(raw, dtype="<u4", count=1, offset=16)[0])
+    header = json.loads(raw[_JSON_OFFSET:_JSON_OFFSET + length].decode("utf-8"))
+    return count, header
+
+
+class DiskRecorder:
+    """
+    Append-only memory-mapped recording of every tick of one unit.
+
+    The tick thread only copies one row into an in-memory block; full blocks
+    (and partial ones every `flush_interval` seconds) are handed to a writer
+    thread that appends them to the memory map, flushes, and only then bumps
+    the committed row count in the header. Readers therefore never see rows
+    that are not on disk yet, and can open the file while the run continues.
+    """
+
+    def __init__(self, path, unit=None, channels=DISK_CHANNELS, flush_interval=1.0, meta=None):
+        self.path = str(path)
+        self.channels = tuple(channels)
+        self.flush_interval = flush_interval
+        self.rows = 0 # Rows handed to the writer
+        self.committed = 0 # Rows on disk and visible to readers
+        self.error = None
+
+        header = {
+            "version": FORMAT_VERSION,
+            "dtype": "<f8",
+            "channels": list(self.channels),
+            "units": {"rho_*": "pcm", "reactivity": "dk/k"},
+            "created": datetime.now().isoformat(timespec="seconds"),
+        }
+        if unit is not None:
+            header["unit"] = {"id": str(unit.id), "name": unit.name, "type": unit.type.value}
+        header.update(meta or {})
+        encoded = json.dumps(header).encode("utf-8")
+        if _JSON_OFFSET + len(encoded) > HEADER_SIZE:
+            raise ValueError("Recording header too large")
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "w+b")
+        self._file.write(MAGIC)
+        self._file.write(np.array([0], dtype="<u8").tobytes())
+        self._file.write(np.array([len(encoded)], dtype="<u4").tobytes())
+        self._file.write(encoded)
+        self._file.truncate(HEADER_SIZE)
+        self._file.flush()
+
+        self._block = np.full((BLOCK_ROWS, len(self.channels)), np.nan)
+        self._fill = 0
+        self._last_handoff = time.monotonic()
+        self._queue = queue.Queue()
+        self._map = None
+        self._capacity = 0
+        self._writer = threading.Thread(target=self._write_loop, name=f"recorder-{os.path.basename(self.path)}", daemon=True)
+        self._writer.start()
+
+    # --- tick side ---
+
+    def record(self, unit):
+        """Stages one sample of `unit` (called once per tick; assumes DISK_CHANNELS)."""
+        t = unit.telemetry
+        c = unit.control_state
+        comps = t.get("reactivity_components", {})
+        row = self._block[self._fill]
+        row[0] = unit.time_seconds
+        i = 1
+        for k in DISK_TELEMETRY_CHANNELS:
+            v = t.get(k)
+            row[i] = np.nan if v is None else v
+            i += 1
+        for k in DISK_CONTROL_CHANNELS:
+            v = c.get(k)
+            row[i] = np.nan if v is None else v
+            i += 1
+        for k in DISK_COMPONENT_CHANNELS:
+            row[i] = comps.get(k, np.nan) * 10000 # pcm, as in the flight recorder
+            i += 1
+        self._fill += 1
+        if self._fill == BLOCK_ROWS or time.monotonic() - self._last_handoff >= self.flush_interval:
+            self._handoff()
+
+    def append(self, values):
+        """Stages one raw row (a sequence in channel order)."""
+        self._block[self._fill] = values
+        self._fill += 1
+        if self._fill == BLOCK_ROWS or time.monotonic() - self._last_handoff >= self.flush_interval:
+            self._handoff()
+
+    def _handoff(self):
+        if self._fill:
+            self._queue.put(self._block[:self._fill].copy())
+            self.rows += self._fill
+            self._fill = 0
+        self._last_handoff = time.monotonic()
+
+    def flush(self, wait=True):
+        """Hands staged rows to the writer; with wait=True, blocks until they are on disk."""
+        self._handoff()
+        if wait:
+            self._queue.join()
+
+    def close(self):
+        if self._file is None:
+            return
+        self._handoff()
+        self._queue.put(None)
+        self._writer.join()
+        self._map = None
+        self._file.truncate(HEADER_SIZE + self.committed * len(self.channels) * 8)
+        self._file.close()
+        self._file = None
+
+    # --- writer thread ---
+
+    def _ensure_capacity(self, rows):
+        if rows <= self._capacity:
+            return
+        self._map = None
+        self._capacity = max(rows, self._capacity + GROW_ROWS)
+        self._file.truncate(HEADER_SIZE + self._capacity * len(self.channels) * 8)
+        self._map = np.memmap(self._file, dtype="<f8", mode="r+", offset=HEADER_SIZE,
+                              shape=(self._capacity, len(self.channels)))
+
+    def _write_loop(self):
+        while True:
+            block = self._queue.get()
+            try:
+                if block is None:
+                    return
+                if self.error is None:
+                    start = self.committed
+                    self._ensure_capacity(start + len(block))
+                    self._map[start:start + len(block)] = block
+                    self._map.flush()
+                    self.committed = start + len(block)
+                    os.pwrite(self._file.fileno(), np.array([self.committed], dtype="<u8").tobytes(), _COUNT_OFFSET)
+            except Exception as e: # Disk full etc.: stop recording, keep the sim running
+                self.error = e
+            finally:
+                self._queue.task_done()
+
+
+class Recording:
+    """
+    Lazy read-only view of a DiskRecorder file.
+    Nothing is loaded up front; columns are memory-mapped and time ranges are
+    located with a binary search on time_seconds. Call refresh() to pick up
+    rows committed by a recorder that is still running.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.refresh()
+
+    def refresh(self):
+        with open(self.path, "rb") as f:
+            count, self.header = _read_header(f)
+        self.channels = tuple(self.header["channels"])
+        self._index = {c: i for i, c in enumerate(self.channels)}
+        self._count = count
+        if count:
+            self._map = np.memmap(self.path, dtype=self.header.get("dtype", "<f8"), mode="r",
+                                  offset=HEADER_SIZE, shape=(count, len(self.channels)))
+        else:
+            self._map = np.empty((0, len(self.channels)))
+        return self
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, channel):
+        return self._map[:, self._index[channel]]
+
+    @property
+    def time_range(self):
+        if not self._count:
+            return (0.0, 0.0)
+        t = self["time_seconds"]
+        return (float(t[0]), float(t[-1]))
+
+    def rows_between(self, start=None, end=None):
+        """Row slice covering start <= time_seconds <= end."""
+        t = self["time_seconds"]
+        lo = 0 if start is None else int(np.searchsorted(t, start, side="left"))
+        hi = self._count if end is None else int(np.searchsorted(t, end, side="right"))
+        return slice(lo, hi)
+
+    def window(self, start=None, end=None, step=1):
+        """(n, channels) memory-mapped view of a time range, optionally decimated."""
+        rows = self.rows_between(start, end)
+        return self._map[rows.start:rows.stop:step]
+
+    def to_frame(self, start=None, end=None, channels=None, step=1):
+        """DataFrame of a time range (only that range is read from disk)."""
+        import pandas as pd
+        window = self.window(start, end, step)
+        if channels is None:
+            return pd.DataFrame(np.asarray(window), columns=list(self.channels))
+        return pd.DataFrame({c: np.asarray(window[:, self._index[c]]) for c in channels})
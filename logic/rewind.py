@@ -0,0 +1,63 @@
+from bisect import bisect_right
+from .snapshot import clone
+
+DEFAULT_INTERVAL = 10.0 # Journal seconds between keyframes
+DEFAULT_MAX_KEYFRAMES = 30 # Oldest keyframes are dropped past this (5 min of rewind at the default interval)
+
+
+class RewindBuffer:
+    """
+    Bounded ring of engine keyframes (copy-on-write clones) taken every
+    `interval` seconds of journal time, each tagged with its journal cursor.
+    Rewinding restores the nearest earlier keyframe and re-simulates the
+    journal up to the requested second, so at most one interval is replayed.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, max_keyframes=DEFAULT_MAX_KEYFRAMES):
+        self.interval = float(interval)
+        self.max_keyframes = max(1, int(max_keyframes))
+        self.times = []
+        self.cursors = []
+        self.keyframes = []
+
+    def __len__(self):
+        return len(self.keyframes)
+
+    @property
+    def earliest(self):
+        return self.times[0] if self.times else None
+
+    def clear(self):
+        self.times, self.cursors, self.keyframes = [], [], []
+
+    def capture(self, engine):
+        """Stores a keyframe at the engine's current journal position."""
+        journal = engine.journal
+        self.times.append(journal.time)
+        self.cursors.append(journal.position())
+        self.keyframes.append(clone(engine))
+        if len(self.keyframes) > self.max_keyframes:
+            del self.times[0], self.cursors[0], self.keyframes[0]
+
+    def on_tick(self, engine):
+        if not self.times or engine.journal.time - self.times[-1] >= self.interval - 1e-9:
+            self.capture(engine)
+
+    def restore(self, engine, t):
+        """Rewinds `engine` in place to journal time t (clamped to the oldest keyframe); returns the time reached."""
+        if not self.keyframes:
+            raise ValueError("No keyframes recorded yet")
+        journal = engine.journal
+        t = min(max(t, self.times[0]), journal.time)
+        k = bisect_right(self.times, t + 1e-9) - 1
+
+        restored = clone(self.keyframes[k]) # Keep the keyframe itself reusable
+        cursor = journal.apply(restored, start=self.cursors[k], until=t)
+        journal.truncate(cursor)
+        del self.times[k + 1:], self.cursors[k + 1:], self.keyframes[k + 1:]
+
+        rewind = engine.rewind
+        engine.__dict__.update(restored.__dict__)
+        engine.journal = journal
+        engine.rewind = rewind
+        return journal.time
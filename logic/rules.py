@@ -0,0 +1,328 @@
+import ast
+import math
+import numpy as np
+from .state import StateRecord
+
+# Declarative alarm / advice table shared by the tick's pre-alarm warnings,
+# the annunciator panel, the Instructor and the ExplanationEngine.
+#
+# `when` is an expression over state fields (telemetry names; controls as
+# ctl_<name>) and `limit`, written with comparisons and & | only so the same
+# expression runs on scalars (live) and on arrays (fleet rows, recorded
+# history). `limit` may be per reactor type; a type missing from the dict
+# disables the rule for that type. `text` is formatted with the inputs and limit.
+
+# Value a missing field reads as (keeps a rule quiet when its input is absent)
+FIELD_DEFAULTS = {
+    "temp": 300.0, "flux": 0.0, "power_mw": 0.0, "pressure": 150.0, "health": 100.0,
+    "scram": False, "melted": False, "void_fraction": 0.0, "water_level": 5.0,
+    "flow_rate_core": 100.0, "radiation_released": 0.0, "xenon": 1.0, "period": 999.0,
+    "dnbr": 3.0, "ctl_rods_pos": 50.0, "ctl_msiv_open": True,
+}
+
+RULES = (
+    # --- Pre-alarm warnings (telemetry["warnings"], written every tick) ---
+    {"id": "warn_temp", "group": "warning", "when": "(temp > limit) & (health > 0)",
+     "limit": {"PWR": 350.0, "BWR": 300.0, "RBMK": 300.0}, "text": "HIGH TEMP (> {limit:.0f}C)"},
+    {"id": "warn_pressure", "group": "warning", "when": "(pressure > limit) & (health > 0)",
+     "limit": {"PWR": 170.0, "BWR": 90.0, "RBMK": 90.0}, "text": "HIGH PRESSURE (> {limit:.0f} Bar)"},
+    {"id": "warn_flow", "group": "warning", "when": "(flow_rate_core < 50.0) & (power_mw > 100) & (health > 0)",
+     "text": "LOW FLOW"},
+    {"id": "warn_void", "group": "warning", "when": "(void_fraction > limit) & (health > 0)",
+     "limit": {"RBMK": 0.4}, "text": "HIGH VOID FRACTION"},
+    {"id": "warn_radiation", "group": "warning", "when": "(radiation_released > 0.001) & (health > 0)",
+     "text": "RADIATION LEAK ({radiation_released:.3f} Sv)"},
+
+    # --- Annunciator lights ---
+    {"id": "ann_scram", "group": "annunciator", "when": "scram > 0", "text": "SCRAM"},
+    {"id": "ann_high_flux", "group": "annunciator", "when": "flux > 1.1", "text": "HIGH FLUX"},
+    {"id": "ann_low_pressure", "group": "annunciator", "when": "pressure < 100", "text": "LOW PRES"},
+    {"id": "ann_high_temp", "group": "annunciator", "when": "temp > 600", "text": "HIGH TEMP"},
+    {"id": "ann_core_integrity", "group": "annunciator", "when": "health < 80", "text": "CORE INTG"},
+    {"id": "ann_radiation", "group": "annunciator", "when": "flux > 0.8", "text": "RAD WARN"},
+    {"id": "ann_pump_trip", "group": "annunciator", "when": "flow_rate_core < 50", "text": "PUMP TRIP"},
+    {"id": "ann_void", "group": "annunciator", "when": "void_fraction > 0.4", "text": "VOID ALRM"},
+    {"id": "ann_low_level", "group": "annunciator", "when": "water_level < 3.0", "text": "LOW H2O"},
+    {"id": "ann_high_pressure", "group": "annunciator", "when": "pressure > 170", "text": "HI PRESS"},
+
+    # --- Instructor remarks ---
+    {"id": "xenon_pit", "group": "instructor", "when": "(power_mw < 500) & (xenon > 1.5)", "severity": "warning",
+     "text": "🛑 **XENON PIT DETECTED**: Power is low, but Xenon poison is high. The reactor is 'poisoned out'. Attempting to raise power now is difficult and dangerous (potential for instability)."},
+    {"id": "fast_startup", "group": "instructor", "when": "(period > 0) & (period < 20)", "severity": "danger",
+     "text": "⚠️ **FAST STARTUP**: Reactor period is under 20s. Power is rising exponentially fast. Insert rods immediately to stabilize."},
+    {"id": "dnbr_critical", "group": "instructor", "when": "dnbr < 1.3", "severity": "danger",
+     "text": "🔥 **DNBR CRITICAL**: Departure from Nucleate Boiling Ratio is < 1.3. Fuel cladding is overheating. Increase Flow or Scram."},
+    {"id": "orm_low", "group": "instructor", "when": "(ctl_rods_pos < limit) & (power_mw > 1000)",
+     "limit": {"RBMK": 10.0}, "severity": "warning",
+     "text": "⚠️ **OPERATING MARGIN LOW**: Operational Reactivity Margin (ORM) is critical. Too many rods are withdrawn. SCRAM effectiveness is reduced."},
+    {"id": "msiv_closed", "group": "instructor", "when": "(ctl_msiv_open == 0) & (pressure > 160)", "severity": "info",
+     "text": "💡 **SYSTEM KNOWLEDGE**: With MSIV closed, steam has nowhere to go. Pressure rises until safety valves open. Open the Turbine Bypass or condenser."},
+
+    # --- ExplanationEngine cause/effect cards ---
+    {"id": "cladding_failure", "group": "explanation", "when": "temp > 450", "severity": "Critical",
+     "text": "Fuel Cladding Failure Risk",
+     "cause": "Core temp ({temp:.0f}C) exceeds zirconium limits.",
+     "effect": "Release of fission products into coolant loop.",
+     "action": "SCRAM reactor immediately and maximize cooling."},
+    {"id": "overpower", "group": "explanation", "when": "flux > 1.1", "severity": "Warning",
+     "text": "Overpower Transient",
+     "cause": "Reactivity insertion exceeds delayed neutron fraction.",
+     "effect": "Rapid power excursion (Prompt Critical risk).",
+     "action": "Insert control rods to reduce flux."},
+)
+
+
+class Rule:
+    """One compiled RULES entry."""
+
+    __slots__ = ("id", "group", "when", "code", "inputs", "limit", "severity", "text", "extra")
+
+    def __init__(self, id, group, when, text, limit=None, severity=None, **extra):
+        self.id = id
+        self.group = group
+        self.when = when
+        self.code = compile(when, f"<rule {id}>", "eval")
+        names = {n.id for n in ast.walk(ast.parse(when, mode="eval")) if isinstance(n, ast.Name)}
+        self.inputs = tuple(sorted(names - {"limit"}))
+        self.limit = limit
+        self.severity = severity
+        self.text = text
+        self.extra = extra
+
+    def limit_for(self, r_type):
+        """Threshold for a reactor type (value string); NaN disables the rule."""
+        if isinstance(self.limit, dict):
+            return self.limit.get(r_type, math.nan)
+        return self.limit
+
+    def format(self, values, limit=None, key="text"):
+        template = self.text if key == "text" else self.extra[key]
+        return template.format(**dict(values, limit=limit))
+
+    def __reduce__(self):
+        # Code objects do not pickle (process pools): rebuild from the table entry
+        entry = dict(self.extra, id=self.id, group=self.group, when=self.when, text=self.text,
+                     limit=self.limit, severity=self.severity)
+        return _rule_from_entry, (entry,)
+
+
+def _rule_from_entry(entry):
+    return Rule(**entry)
+
+
+class RuleSet:
+    """
+    Compiled rule table. For live use every (group, reactor type) is compiled
+    into one generated function with the type's limits baked in as constants,
+    so an update is a single call rather than a walk over the table.
+    """
+
+    def __init__(self, rules):
+        self.rules = [Rule(**r) for r in rules]
+        self.by_id = {r.id: r for r in self.rules}
+        self.groups = {}
+        for i, rule in enumerate(self.rules):
+            self.groups.setdefault(rule.group, []).append(i)
+        self._compiled = {}
+
+    def compiled(self, group, r_type):
+        """
+        (input fields, step) for a group and reactor type. step(t, c, tget, cget,
+        last, fired) reads the inputs, re-runs only the conditions whose inputs
+        differ from `last` (all of them when last is None) and returns
+        (inputs, results, conditions run).
+        """
+        key = (group, r_type)
+        if key not in self._compiled:
+            rules = [self.rules[i] for i in self.groups[group]]
+            fields = sorted({f for rule in rules for f in rule.inputs})
+            reads = []
+            for f in fields:
+                if f.startswith("ctl_"):
+                    reads.append(f"cget(c, {f[4:]!r}, {FIELD_DEFAULTS.get(f)!r})")
+                else:
+                    reads.append(f"tget(t, {f!r}, {FIELD_DEFAULTS.get(f)!r})")
+            lines = [
+                "def step(t, c, tget, cget, last, fired):",
+                f"    inputs = ({', '.join(reads)},)",
+                f"    ({', '.join(fields)},) = inputs",
+                "    run = 0",
+            ]
+            for k, f in enumerate(fields):
+                lines.append(f"    d_{f} = last is None or {f} != last[{k}]")
+            for i, rule in enumerate(rules):
+                limit = rule.limit_for(r_type)
+                if limit is not None and limit != limit: # NaN: not applicable to this reactor type
+                    lines.append(f"    r{i} = False")
+                    continue
+                condition = ast.unparse(_Substitute(limit).visit(ast.parse(rule.when, mode="eval")))
+                dirty = " or ".join(f"d_{f}" for f in rule.inputs) or "last is None"
+                lines.append(f"    if {dirty}:")
+                lines.append(f"        r{i} = {condition}")
+                lines.append("        run += 1")
+                lines.append("    else:")
+                lines.append(f"        r{i} = fired[{i}]")
+            lines.append(f"    return inputs, ({', '.join(f'r{i}' for i in range(len(rules)))},), run")
+            namespace = {}
+            exec(compile("\n".join(lines) + "\n", f"<rules {group}/{r_type}>", "exec"), namespace)
+            self._compiled[key] = (fields, namespace["step"])
+        return self._compiled[key]
+
+    def evaluator(self, r_type):
+        return RuleEvaluator(self, r_type)
+
+    def evaluate(self, group, telemetry, controls=None, r_type=None):
+        """
+        One-off evaluation of a group with no state kept between calls (callers
+        without a unit's evaluator). Returns ({field: value}, firing rules in table order).
+        """
+        fields, step = self.compiled(group, r_type)
+        inputs, fired, _ = step(telemetry, controls, _getter(telemetry), _getter(controls), None, None)
+        return dict(zip(fields, inputs)), [self.rules[i] for i, on in zip(self.groups[group], fired) if on]
+
+    def __getstate__(self):
+        return dict(vars(self), _compiled={}) # Generated functions are rebuilt on demand
+
+    def evaluate_arrays(self, columns, r_types, group=None):
+        """
+        Evaluates every rule (of `group`) over whole arrays in one pass, e.g. a
+        recorded history or the fleet's rows. `columns` maps field names to
+        equal-length arrays (missing fields read as FIELD_DEFAULTS); r_types is
+        one type value or an array of them per row. Returns {rule id: bool array}.
+        """
+        n = len(next(iter(columns.values())))
+        per_row = not isinstance(r_types, str)
+        out = {}
+        for i in self.groups[group] if group else range(len(self.rules)):
+            rule = self.rules[i]
+            env = {f: np.asarray(columns[f]) if f in columns else np.full(n, FIELD_DEFAULTS.get(f, 0.0))
+                   for f in rule.inputs}
+            if isinstance(rule.limit, dict) and per_row:
+                types = np.asarray(r_types)
+                env["limit"] = np.full(n, math.nan)
+                for t in np.unique(types):
+                    env["limit"][types == t] = rule.limit_for(t)
+            else:
+                env["limit"] = rule.limit_for(r_types if not per_row else None)
+            out[rule.id] = np.broadcast_to(np.asarray(eval(rule.code, {"__builtins__": {}}, env), dtype=bool), (n,))
+        return out
+
+    def debrief(self, columns, r_type, time_key="time_seconds"):
+        """
+        Post-session summary over a recorded history: for every rule that ever
+        fired, when it first fired, how many separate times and for how long.
+        """
+        times = np.asarray(columns[time_key], dtype=float)
+        dt = np.diff(times, append=times[-1] if len(times) else 0.0)
+        rows = []
+        for rule_id, mask in self.evaluate_arrays(columns, r_type).items():
+            if not mask.any():
+                continue
+            rule = self.by_id[rule_id]
+            onsets = np.flatnonzero(mask & ~np.concatenate(([False], mask[:-1])))
+            rows.append({
+                "rule": rule_id, "group": rule.group, "first_time": float(times[onsets[0]]),
+                "episodes": len(onsets), "seconds": float(dt[mask].sum()),
+            })
+        return sorted(rows, key=lambda r: r["first_time"])
+
+
+class _Substitute(ast.NodeTransformer):
+    """Replaces the `limit` name with a constant."""
+
+    def __init__(self, limit):
+        self.limit = limit
+
+    def visit_Name(self, node):
+        if node.id == "limit":
+            return ast.copy_location(ast.Constant(self.limit), node)
+        return node
+
+
+def _map_get(mapping, key, default):
+    return mapping.get(key, default)
+
+
+def _default_get(_, key, default):
+    return default
+
+
+_GETTERS = {type(None): _default_get}
+
+
+def _getter(state):
+    """Field access for a StateRecord (attributes), a plain mapping or None."""
+    get = _GETTERS.get(type(state))
+    if get is None:
+        get = _GETTERS[type(state)] = getattr if isinstance(state, StateRecord) else _map_get
+    return get
+
+
+class RuleEvaluator:
+    """
+    Live, incremental evaluation for one unit: update() reads a group's inputs
+    and re-runs only the rules whose inputs changed since the previous update.
+    Results stay valid between updates.
+    """
+
+    def __init__(self, ruleset, r_type):
+        self.ruleset = ruleset
+        self.r_type = r_type.value if hasattr(r_type, "value") else r_type
+        self.compiled = {g: ruleset.compiled(g, self.r_type) for g in ruleset.groups}
+        self.inputs = {} # group -> input values at the last update
+        self.fired = {} # group -> per-rule results at the last update
+        self.evaluations = 0 # Conditions actually re-run (for profiling the incremental path)
+
+    def __getstate__(self):
+        # The generated step functions do not pickle; the shared RULESET
+        # travels by name so a worker process reuses its own compilations
+        state = dict(vars(self))
+        del state["compiled"]
+        if state["ruleset"] is RULESET:
+            state["ruleset"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.ruleset is None:
+            self.ruleset = RULESET
+        self.compiled = {g: self.ruleset.compiled(g, self.r_type) for g in self.ruleset.groups}
+
+    def update(self, telemetry, controls=None, group=None):
+        tget, cget = _getter(telemetry), _getter(controls)
+        for g in (group,) if group else self.ruleset.groups:
+            step = self.compiled[g][1]
+            self.inputs[g], self.fired[g], run = step(telemetry, controls, tget, cget,
+                                                      self.inputs.get(g), self.fired.get(g))
+            self.evaluations += run
+        return self
+
+    def _firing(self, group):
+        rules = self.ruleset.rules
+        fired = self.fired.get(group) or ()
+        return [rules[i] for i, on in zip(self.ruleset.groups[group], fired) if on]
+
+    def active(self, group):
+        """Rules of `group` currently firing, in table order."""
+        return self._firing(group)
+
+    def values(self, group):
+        """{field: value} the group was last evaluated on."""
+        fields = self.compiled[group][0]
+        return dict(zip(fields, self.inputs.get(group, ())))
+
+    def messages(self, group):
+        """Formatted text of the firing rules of `group`."""
+        firing = self._firing(group)
+        if not firing:
+            return []
+        values = self.values(group)
+        return [rule.format(values, rule.limit_for(self.r_type)) for rule in firing]
+
+    def states(self, group):
+        """{rule text: firing} for every rule of `group` (e.g. annunciator lights)."""
+        fired = self.fired.get(group) or (False,) * len(self.ruleset.groups[group])
+        return {self.ruleset.rules[i].text: bool(on) for i, on in zip(self.ruleset.groups[group], fired)}
+
+
+RULESET = RuleSet(RULES)
@@ -1,3 +1,5 @@
+from .table import PhaseTable
+
 class HistoricalScenario:
     def __init__(self, id, title, description, details, phases):
         self.id = id
@@ -5,6 +7,14 @@ class HistoricalScenario:
         self.description = description
         self.details = details # List of bullet points
         self.phases = phases   # List of dicts {time, label, state_overrides, analysis}
+        self._table = None
+
+    @property
+    def table(self):
+        """Phases compiled into interpolation arrays (built on first use)."""
+        if self._table is None:
+            self._table = PhaseTable(self.phases)
+        return self._table
 
 SCENARIOS = {
     "chernobyl": HistoricalScenario(
@@ -0,0 +1,126 @@
+import numpy as np
+
+
+def _numeric(v):
+    # bools count as numbers here, exactly as in the original per-key isinstance check
+    return isinstance(v, (int, float))
+
+
+class PhaseTable:
+    """
+    A scenario's phases compiled once into sorted time and per-channel value arrays.
+
+    Replay semantics match the original per-tick scan: between two phases every
+    key of the next phase is linearly interpolated when both ends are numeric
+    and otherwise jumps to the next value; keys the next phase lacks are left
+    alone. Past the last phase its telemetry is applied as-is.
+    """
+
+    def __init__(self, phases):
+        self.phases = phases
+        self.times = np.array([p["time"] for p in phases], dtype=float)
+        channels = []
+        for p in phases:
+            for k in p["telemetry"]:
+                if k not in channels:
+                    channels.append(k)
+        self.channels = tuple(channels)
+        self._col = {k: i for i, k in enumerate(self.channels)}
+
+        P, C = len(phases), len(self.channels)
+        self.values = np.full((P, C), np.nan)
+        self.present = np.zeros((P, C), dtype=bool)
+        for i, p in enumerate(phases):
+            for k, v in p["telemetry"].items():
+                self.present[i, self._col[k]] = True
+                if _numeric(v):
+                    self.values[i, self._col[k]] = v
+
+        # Per segment i -> i+1: which channels interpolate and which step to the next value
+        self.interp = np.zeros((max(P - 1, 0), C), dtype=bool)
+        self._segments = []
+        for i in range(P - 1):
+            cur, nxt = phases[i]["telemetry"], phases[i + 1]["telemetry"]
+            interp_cols, steps = [], []
+            for k, v_next in nxt.items():
+                if k in cur and _numeric(v_next) and _numeric(cur[k]):
+                    self.interp[i, self._col[k]] = True
+                    interp_cols.append(self._col[k])
+                else:
+                    steps.append((k, v_next))
+            self._segments.append((np.array(interp_cols, dtype=int), steps))
+
+    def index_at(self, t):
+        """Index of the active phase (last phase with time <= t, else 0)."""
+        return max(0, int(np.searchsorted(self.times, t, side="right")) - 1)
+
+    def phase_at(self, t):
+        return self.phases[self.index_at(t)]
+
+    def apply(self, telemetry, t):
+        """Writes the interpolated state at time t into telemetry; returns the active phase index."""
+        i = int(np.searchsorted(self.times, t, side="right")) - 1
+        if i < 0:
+            telemetry.update(self.phases[0]["telemetry"])
+            return 0
+        if i == len(self.phases) - 1:
+            telemetry.update(self.phases[i]["telemetry"])
+            return i
+
+        cols, steps = self._segments[i]
+        progress = (t - self.times[i]) / (self.times[i + 1] - self.times[i])
+        cur = self.values[i, cols]
+        values = cur + (self.values[i + 1, cols] - cur) * progress
+        for c, v in zip(cols.tolist(), values.tolist()):
+            telemetry[self.channels[c]] = v
+        for k, v in steps:
+            telemetry[k] = v
+        return i
+
+    def timeline(self, start=None, end=None, dt=1.0, times=None):
+        """
+        Whole replay trajectory in one vectorized pass.
+        Returns {"time_seconds", "phase", <channel>...} arrays; non-numeric
+        values are NaN and channels a phase leaves alone hold their last value.
+        """
+        if times is None:
+            start = self.times[0] if start is None else start
+            end = self.times[-1] if end is None else end
+            times = np.arange(start, end + dt * 0.5, dt)
+        times = np.asarray(times, dtype=float)
+        P = len(self.phases)
+
+        raw = np.searchsorted(self.times, times, side="right") - 1
+        i = np.clip(raw, 0, P - 1)
+        j = np.minimum(i + 1, P - 1)
+        in_segment = (raw >= 0) & (raw < P - 1)
+        gap = self.times[j] - self.times[i]
+        progress = np.where(in_segment, (times - self.times[i]) / np.where(gap > 0, gap, 1.0), 0.0)
+
+        cur = self.values[i]
+        nxt = self.values[j]
+        interpolated = cur + (nxt - cur) * progress[:, None]
+        interp = np.zeros((len(times), len(self.channels)), dtype=bool)
+        interp[in_segment] = self.interp[i[in_segment]]
+
+        # Outside a segment the active phase is applied as-is; inside, non-interpolated keys take the next phase
+        target = np.where(in_segment, j, i)
+        stepped = self.values[target]
+        written = self.present[target]
+        out = np.where(interp, interpolated, np.where(written, stepped, np.nan))
+
+        # Untouched channels keep their previous value
+        untouched = ~(interp | written)
+        if untouched.any():
+            idx = np.where(~untouched, np.arange(len(times))[:, None], 0)
+            np.maximum.accumulate(idx, axis=0, out=idx)
+            out = out[idx, np.arange(len(self.channels))]
+
+        columns = {"time_seconds": times, "phase": i}
+        for c, k in enumerate(self.channels):
+            columns[k] = out[:, c]
+        return columns
+
+    def frame(self, **kwargs):
+        import pandas as pd
+        return pd.DataFrame(self.timeline(**kwargs))
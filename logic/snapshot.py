@@ -0,0 +1,292 @@
+import json
+import struct
+import numpy as np
+
+from .engine import ReactorUnit, ReactorEngine, ReactorConfig, ReactorType
+from .layers.reactivity import ReactivityLayer
+from .layers.thermal import ThermalLayer
+from .layers.safety import SafetyLayer
+from .layers.kinetics import PointKinetics
+from .state import Telemetry, ControlState, ReactivityComponents
+from .recorder import FlightRecorder
+from .events import EventLog
+from .rules import RULESET
+from .multirate import MultiRateScheduler
+from .scenarios.historical import SCENARIOS
+
+# File layout: [magic 8][version uint16][JSON length uint32][JSON state][array blobs].
+# Scalars, records and the event log go in the JSON block; history and kinetics
+# arrays are stored raw (little-endian) and listed in the JSON "arrays" table.
+MAGIC = b"RXSNP01\n"
+FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<HI")
+
+_KINETICS_ARRAYS = ("beta", "lam", "gen_time", "state", "rho_cached", "dt_cached", "propagator")
+_NODAL_ARRAYS = ("temps", "phi", "precursors", "iodine", "xenon")
+_NODAL_FIELDS = ("rods_pos", "k0", "power_level", "factorizations", "corrections")
+
+
+def _plain(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict) or hasattr(value, "items"):
+        return dict(value.items())
+    raise TypeError(f"Cannot snapshot {type(value).__name__}")
+
+
+def _copy_record(record):
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in record.items()}
+
+
+def _restore_layer(layer, state):
+    layer.__dict__.update(state)
+    return layer
+
+
+# --- capture -----------------------------------------------------------------
+
+def _unit_state(unit, arrays, prefix):
+    physics = {k: v for k, v in vars(unit.physics).items() if k != "kinetics"}
+    kinetics = None
+    if unit.physics.kinetics is not None:
+        k = unit.physics.kinetics
+        kinetics = {"rho_threshold": k.rho_threshold, "rebuilds": k.rebuilds}
+        for name in _KINETICS_ARRAYS:
+            arrays[f"{prefix}kinetics.{name}"] = getattr(k, name)
+    nodal = None
+    if unit.nodal is not None:
+        n = unit.nodal
+        nodal = {"reactor_type": n.reactor_type, "geometry": n.geometry, "nodes": n.side,
+                 "rod_threshold": n.rod_threshold, "temp_threshold": n.temp_threshold,
+                 "xenon_threshold": n.xenon_threshold}
+        nodal.update({name: getattr(n, name) for name in _NODAL_FIELDS})
+        for name in _NODAL_ARRAYS:
+            arrays[f"{prefix}nodal.{name}"] = getattr(n, name)
+    arrays[f"{prefix}history"] = unit.history.window()
+
+    return {
+        "id": unit.id,
+        "name": unit.name,
+        "type": unit.type.value,
+        "time_seconds": unit.time_seconds,
+        "config": {k: v for k, v in vars(unit.config).items() if k != "type"},
+        "control_state": unit.control_state.copy(),
+        "telemetry": {k: v for k, v in unit.telemetry.items() if k != "reactivity_components"},
+        "reactivity_components": unit.reactivity_components.copy(),
+        "components_in_telemetry": "reactivity_components" in unit.telemetry,
+        "physics": physics,
+        "kinetics": kinetics,
+        "thermal": vars(unit.thermal),
+        "safety": vars(unit.safety),
+        "multirate": vars(unit.multirate) if unit.multirate is not None else None,
+        "nodal": nodal,
+        "history": {"capacity": unit.history.capacity, "channels": unit.history.channels,
+                    "interval": unit.history_interval},
+        "events": {
+            "capacity": unit.event_log.capacity,
+            "debounce": unit.event_log.debounce,
+            "entries": list(unit.event_log),
+        },
+        "failure_cause": unit.failure_cause,
+        "post_mortem_report": unit.post_mortem_report,
+        "replay_scenario": unit.replay_scenario.id if unit.replay_scenario else None,
+        "is_replay": unit.is_replay,
+        "replay_speed": unit.replay_speed,
+    }
+
+
+def dumps(obj):
+    """Serializes a ReactorUnit or ReactorEngine to snapshot bytes (disk recorder and journal are not included)."""
+    arrays = {}
+    if isinstance(obj, ReactorEngine):
+        state = {
+            "kind": "engine",
+            "global_time": obj.global_time,
+            "scenario_time": obj.scenario_time,
+            "active_scenario": obj.active_scenario.id if obj.active_scenario else None,
+            "phase_index": obj.phase_index,
+            "units": {uid: _unit_state(u, arrays, f"{uid}/") for uid, u in obj.units.items()},
+        }
+    elif isinstance(obj, ReactorUnit):
+        state = {"kind": "unit", "unit": _unit_state(obj, arrays, "")}
+    else:
+        raise TypeError(f"Cannot snapshot {type(obj).__name__}")
+
+    table, blobs, offset = {}, [], 0
+    for name, a in arrays.items():
+        raw = np.ascontiguousarray(a, dtype=a.dtype.newbyteorder("<")).tobytes()
+        table[name] = [a.dtype.newbyteorder("<").str, list(a.shape), offset, len(raw)]
+        blobs.append(raw)
+        offset += len(raw)
+    state["arrays"] = table
+
+    body = json.dumps(state, default=_plain, separators=(",", ":")).encode("utf-8")
+    return b"".join([MAGIC, _PREAMBLE.pack(FORMAT_VERSION, len(body)), body] + blobs)
+
+
+def save(obj, path):
+    data = dumps(obj)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+# --- restore -----------------------------------------------------------------
+
+def _read(data):
+    data = memoryview(data)
+    if bytes(data[:8]) != MAGIC:
+        raise ValueError("Not a reactor snapshot")
+    version, length = _PREAMBLE.unpack_from(data, 8)
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Snapshot format v{version} is newer than this build (v{FORMAT_VERSION})")
+    start = 8 + _PREAMBLE.size
+    state = json.loads(bytes(data[start:start + length]))
+    blob = start + length
+    arrays = {
+        name: np.frombuffer(data, dtype=dtype, count=int(np.prod(shape)), offset=blob + offset).reshape(shape)
+        for name, (dtype, shape, offset, _) in state["arrays"].items()
+    }
+    return state, arrays
+
+
+def _restore_unit(s, arrays, prefix):
+    unit = ReactorUnit.__new__(ReactorUnit) # Skip reset(); every field comes from the snapshot
+    unit.id = s["id"]
+    unit.name = s["name"]
+    unit.type = ReactorType(s["type"])
+    unit.time_seconds = s["time_seconds"]
+    unit.config = _restore_layer(ReactorConfig(unit.type), s["config"])
+
+    unit.physics = _restore_layer(ReactivityLayer(), s["physics"])
+    if s["kinetics"] is not None:
+        k = PointKinetics(rho_threshold=s["kinetics"]["rho_threshold"])
+        for name in _KINETICS_ARRAYS:
+            setattr(k, name, arrays[f"{prefix}kinetics.{name}"].copy())
+        k.rebuilds = s["kinetics"]["rebuilds"]
+        unit.physics.kinetics = k
+    unit.thermal = _restore_layer(ThermalLayer(), s["thermal"])
+    unit.safety = _restore_layer(SafetyLayer(), s["safety"])
+    unit.multirate = _restore_layer(MultiRateScheduler(), s["multirate"]) if s.get("multirate") else None
+    unit.nodal = None
+    if s.get("nodal"):
+        from .layers.nodal import NodalCore
+        cfg = s["nodal"]
+        n = NodalCore(cfg["reactor_type"], cfg["geometry"], cfg["nodes"], rod_threshold=cfg["rod_threshold"],
+                      temp_threshold=cfg["temp_threshold"], xenon_threshold=cfg["xenon_threshold"])
+        for name in _NODAL_FIELDS:
+            setattr(n, name, cfg[name])
+        for name in _NODAL_ARRAYS:
+            setattr(n, name, arrays[f"{prefix}nodal.{name}"].copy())
+        unit.nodal = n # Factorizations are rebuilt on the first step
+
+    unit.control_state = ControlState(s["control_state"])
+    unit.reactivity_components = ReactivityComponents(s["reactivity_components"])
+    unit.telemetry = Telemetry(s["telemetry"])
+    if s["components_in_telemetry"]:
+        unit.telemetry["reactivity_components"] = unit.reactivity_components
+
+    h = s["history"]
+    unit.history = FlightRecorder(h["capacity"], h["channels"])
+    unit.history.load(arrays[f"{prefix}history"])
+    unit.history_interval = h.get("interval", 1.0)
+    unit.disk_recorder = None
+
+    e = s["events"]
+    unit.event_log = EventLog(e["capacity"], None, e["debounce"])
+    for entry in e["entries"]:
+        unit.event_log.log(entry["time"], entry["event"], entry.get("code"), entry.get("key"))
+
+    unit.rules = RULESET.evaluator(unit.type) # Re-derived from the telemetry on the next tick
+    unit.failure_cause = s["failure_cause"]
+    unit.post_mortem_report = s["post_mortem_report"]
+    unit.replay_scenario = SCENARIOS.get(s["replay_scenario"]) if s["replay_scenario"] else None
+    unit.is_replay = s["is_replay"]
+    unit.replay_speed = s["replay_speed"]
+    return unit
+
+
+def loads(data):
+    """Rebuilds the ReactorUnit or ReactorEngine stored by dumps()."""
+    state, arrays = _read(data)
+    if state["kind"] == "unit":
+        return _restore_unit(state["unit"], arrays, "")
+
+    engine = ReactorEngine.__new__(ReactorEngine)
+    engine.units = {uid: _restore_unit(s, arrays, f"{uid}/") for uid, s in state["units"].items()}
+    engine.global_time = state["global_time"]
+    engine.scenario_time = state["scenario_time"]
+    engine.active_scenario = SCENARIOS.get(state["active_scenario"]) if state["active_scenario"] else None
+    engine.phase_index = state["phase_index"]
+    engine.journal = None
+    engine.rewind = None
+    engine.lag = 0.0
+    engine.current_phase = engine.active_scenario.phases[engine.phase_index] \
+        if engine.active_scenario and engine.phase_index is not None else None
+    return engine
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+# --- in-memory clone -----------------------------------------------------------
+
+def _clone_unit(unit):
+    other = ReactorUnit.__new__(ReactorUnit)
+    other.__dict__.update(unit.__dict__)
+    other.config = _restore_layer(ReactorConfig.__new__(ReactorConfig), dict(vars(unit.config)))
+    other.physics = _restore_layer(ReactivityLayer.__new__(ReactivityLayer), dict(vars(unit.physics)))
+    if unit.physics.kinetics is not None:
+        k = PointKinetics.__new__(PointKinetics)
+        k.__dict__.update(vars(unit.physics.kinetics))
+        for name in _KINETICS_ARRAYS:
+            setattr(k, name, getattr(k, name).copy())
+        other.physics.kinetics = k
+    other.thermal = _restore_layer(ThermalLayer.__new__(ThermalLayer), dict(vars(unit.thermal)))
+    other.safety = _restore_layer(SafetyLayer.__new__(SafetyLayer), dict(vars(unit.safety)))
+    other.safety.alerts = list(unit.safety.alerts)
+    if unit.multirate is not None:
+        other.multirate = _restore_layer(MultiRateScheduler.__new__(MultiRateScheduler),
+                                         {k: dict(v) for k, v in vars(unit.multirate).items()})
+    if unit.nodal is not None:
+        n = unit.nodal.__class__.__new__(unit.nodal.__class__)
+        n.__dict__.update(vars(unit.nodal)) # Geometry and factorizations are never modified in place: shared
+        for name in _NODAL_ARRAYS:
+            setattr(n, name, getattr(n, name).copy())
+        n._templates = dict(n._templates)
+        n._cache = dict(n._cache)
+        other.nodal = n
+
+    other.control_state = ControlState(unit.control_state)
+    other.reactivity_components = ReactivityComponents(unit.reactivity_components)
+    other.telemetry = Telemetry(_copy_record(unit.telemetry))
+    if "reactivity_components" in unit.telemetry:
+        other.telemetry["reactivity_components"] = other.reactivity_components
+
+    # The bulky parts are shared copy-on-write
+    other.history = unit.history.share()
+    other.event_log = unit.event_log.share()
+    other.disk_recorder = None
+    other.rules = RULESET.evaluator(other.type)
+    if unit.post_mortem_report is not None:
+        other.post_mortem_report = dict(unit.post_mortem_report)
+    return other
+
+
+def clone(obj):
+    """
+    Independent copy of a ReactorUnit or ReactorEngine. Scalar state is copied;
+    history buffers and event logs are shared until either side writes.
+    """
+    if isinstance(obj, ReactorUnit):
+        return _clone_unit(obj)
+    if isinstance(obj, ReactorEngine):
+        other = ReactorEngine.__new__(ReactorEngine)
+        other.__dict__.update(obj.__dict__)
+        other.units = {uid: _clone_unit(u) for uid, u in obj.units.items()}
+        other.journal = None
+        other.rewind = None
+        return other
+    raise TypeError(f"Cannot clone {type(obj).__name__}")
@@ -0,0 +1,127 @@
+from collections.abc import Mapping, MutableMapping
+
+# Fixed per-unit state fields. Each record class stores these in __slots__, so
+# the physics tick reads and writes plain attributes instead of hashing string
+# keys, and a unit carries no per-instance dict.
+TELEMETRY_FIELDS = (
+    "flux", "power_mw", "temp", "pressure", "reactivity", "period",
+    "alerts", "scram", "stability_margin", "health", "xenon", "iodine",
+    "void_fraction", "water_level", "steam_flow", "boron_ppm",
+    "graphite_tip_position", "melted", "containment_integrity",
+    "radiation_released", "warnings",
+    # Written by the first simulation tick
+    "reactivity_components", "t_inlet", "t_outlet", "mass_flow",
+    "flow_rate_core", "dnbr",
+)
+
+CONTROL_FIELDS = (
+    "rods_pos", "pump_speed", "flow_rate_core", "manual_scram", "safety_enabled",
+    "boron_concentration", "pressurizer_heaters", "pressurizer_sprays",
+    "feedwater_flow", "turbine_bypass", "manual_vent", "eccs_active",
+    "turbine_load_mw", "msiv_open", "auto_rod_control",
+)
+
+COMPONENT_FIELDS = ("void", "doppler", "xenon", "rods", "boron", "total")
+
+
+class StateRecord(MutableMapping):
+    """
+    Fixed-field record with dict-style access.
+    Fields live in slots (an unset slot reads as a missing key); any other key is
+    kept in a small side dict so scenario data such as "rods" still round-trips.
+    """
+    __slots__ = ("_extra",)
+    FIELDS = ()
+    _FIELD_SET = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, values=None):
+        self._extra = {}
+        if values:
+            self.update(values)
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET:
+            raise KeyError(f"'{key}' is a fixed state field and cannot be removed")
+        del self._extra[key]
+
+    def __iter__(self):
+        for k in self.FIELDS:
+            if hasattr(self, k):
+                yield k
+        yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.copy()!r})"
+
+
+class Telemetry(StateRecord):
+    __slots__ = TELEMETRY_FIELDS
+    FIELDS = TELEMETRY_FIELDS
+
+
+class ControlState(StateRecord):
+    __slots__ = CONTROL_FIELDS
+    FIELDS = CONTROL_FIELDS
+
+
+class ReactivityComponents(StateRecord):
+    """Per-tick reactivity breakdown; one instance per unit, overwritten in place."""
+    __slots__ = COMPONENT_FIELDS
+    FIELDS = COMPONENT_FIELDS
+
+    def __init__(self, values=None):
+        super().__init__()
+        for k in COMPONENT_FIELDS:
+            setattr(self, k, 0.0)
+        if values:
+            self.update(values)
+
+
+class StateView(Mapping):
+    """Read-only dict-compatible view for views and reports."""
+    __slots__ = ("_state",)
+
+    def __init__(self, state):
+        self._state = state
+
+    def __getitem__(self, key):
+        value = self._state[key]
+        if isinstance(value, StateRecord):
+            return StateView(value)
+        return value
+
+    def __iter__(self):
+        return iter(self._state)
+
+    def __len__(self):
+        return len(self._state)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
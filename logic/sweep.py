@@ -0,0 +1,179 @@
+import io
+import os
+import numpy as np
+from .engine import ReactorUnit, ReactorType
+from .fleet import FleetEngine, CONTROL_FIELDS, CONFIG_FIELDS, fleet_supports
+from .ensemble import map_chunks
+
+# Per-cell stability metrics (NaN = never tripped within the horizon)
+SWEEP_METRICS = ("divergence_rate", "time_to_trip", "peak_temp")
+
+SWEEP_FORMAT = 1
+
+
+def simulate_cells(base_unit, settings, horizon, dt):
+    """
+    Runs one cell per row of `settings` ({control or config field: array}) from
+    base_unit's state on a FleetEngine and returns the SWEEP_METRICS arrays:
+
+      divergence_rate  mean e-folding rate of power (1/s) up to the trip or horizon;
+                       > 0 runs away, < 0 dies out, ~0 holds
+      time_to_trip     first scram (s)
+      peak_temp        hottest core temperature seen (C)
+    """
+    if not fleet_supports(base_unit):
+        raise ValueError(f"Sweeps run on a FleetEngine, which cannot reproduce {base_unit.physics.integrator!r} "
+                         "integration, multi-rate or nodal units")
+    n = len(next(iter(settings.values())))
+    fleet = FleetEngine(record_history=False)
+    fleet.add_copies(base_unit, range(n))
+    if base_unit.physics.integrator == "delayed":
+        fleet.use_delayed_neutrons(base_unit.physics.kinetics.rho_threshold)
+    for field, values in settings.items():
+        arrays = fleet.config if field in CONFIG_FIELDS else fleet.controls
+        arrays[field] = np.asarray(values, dtype=float).copy()
+
+    t = fleet.telemetry
+    p0 = np.maximum(t["power_mw"].copy(), 1e-6)
+    last_power = p0.copy()
+    last_time = np.zeros(n)
+    time_to_trip = np.full(n, np.nan)
+    peak_temp = t["temp"].copy()
+
+    steps = int(round(horizon / dt))
+    for step in range(steps):
+        fleet.tick(dt)
+        now = (step + 1) * dt
+        tripped = np.isnan(time_to_trip) & t["scram"]
+        time_to_trip[tripped] = now
+        # Growth is measured on the free-running plant only, so freeze it at the trip
+        running = np.isnan(time_to_trip)
+        last_power[running] = t["power_mw"][running]
+        last_time[running] = now
+        np.fmax(peak_temp, t["temp"], out=peak_temp)
+        if not running.any() and t["melted"].all():
+            break
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.log(np.maximum(last_power, 1e-6) / p0) / last_time
+    return {
+        "divergence_rate": np.where(last_time > 0, rate, np.nan),
+        "time_to_trip": time_to_trip,
+        "peak_temp": peak_temp,
+    }
+
+
+class SweepResult:
+    """
+    Metrics over a full grid: `axes` maps each swept field to its values (in
+    grid order) and every metric is an array of shape (len(axis) for each axis).
+    """
+
+    def __init__(self, r_type, axes, metrics=None, horizon=0.0, dt=0.0):
+        self.r_type = r_type
+        self.axes = {field: np.asarray(values, dtype=float) for field, values in axes.items()}
+        self.shape = tuple(len(v) for v in self.axes.values())
+        self.metrics = metrics or {m: np.full(self.shape, np.nan) for m in SWEEP_METRICS}
+        self.horizon = horizon
+        self.dt = dt
+        self.completed = 0
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def section(self, metric, x, y, at=None):
+        """
+        2-D slice of `metric` with rows along `y` and columns along `x`; other
+        axes are pinned to the grid value nearest `at[field]` (default: the first).
+        """
+        at = at or {}
+        index = []
+        for field, values in self.axes.items():
+            if field in (x, y):
+                index.append(slice(None))
+            else:
+                index.append(int(np.abs(values - at.get(field, values[0])).argmin()))
+        grid = self.metrics[metric][tuple(index)]
+        free = [f for f in self.axes if f in (x, y)]
+        return grid if free == [y, x] else grid.T
+
+    def dumps(self):
+        """Compressed .npz bytes (float32 metrics)."""
+        fields = list(self.axes)
+        arrays = {f"axis_{i}": v for i, v in enumerate(self.axes.values())}
+        arrays.update({m: v.astype(np.float32) for m, v in self.metrics.items()})
+        buf = io.BytesIO()
+        np.savez_compressed(buf, format=SWEEP_FORMAT, r_type=self.r_type.value, fields=np.array(fields),
+                            horizon=self.horizon, dt=self.dt, **arrays)
+        return buf.getvalue()
+
+    def save(self, path):
+        data = self.dumps()
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data)
+
+    @classmethod
+    def load(cls, path):
+        """Reads a .npz written by save() (a path or file-like object)."""
+        with np.load(path) as data:
+            if int(data["format"]) > SWEEP_FORMAT:
+                raise ValueError(f"Sweep format v{int(data['format'])} is newer than this build (v{SWEEP_FORMAT})")
+            fields = [str(f) for f in data["fields"]]
+            axes = {f: data[f"axis_{i}"] for i, f in enumerate(fields)}
+            metrics = {m: data[m].astype(float) for m in SWEEP_METRICS}
+            result = cls(ReactorType(str(data["r_type"])), axes, metrics, float(data["horizon"]), float(data["dt"]))
+        result.completed = result.size
+        return result
+
+
+class StabilitySweep:
+    """
+    Evaluates the tick over the full grid spanned by `axes` ({control or
+    ReactorConfig field: values}), starting every cell from the same plant
+    state and stepping vectorized chunks of cells across a process pool.
+    """
+
+    def __init__(self, r_type=ReactorType.RBMK, axes=None, controls=None, telemetry=None,
+                 horizon=120.0, dt=0.1, chunk_size=256, workers=None):
+        self.r_type = r_type
+        self.axes = {field: np.asarray(values, dtype=float) for field, values in (axes or {}).items()}
+        if not self.axes:
+            raise ValueError("A sweep needs at least one axis")
+        for field in self.axes:
+            if field not in CONTROL_FIELDS and field not in CONFIG_FIELDS:
+                raise ValueError(f"Unsupported sweep field: {field}")
+        self.horizon = horizon
+        self.dt = dt
+        self.chunk_size = chunk_size
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+
+        # Initial plant state shared by every cell
+        self.base_unit = ReactorUnit(0, f"SWEEP ({r_type.value})", r_type)
+        if telemetry:
+            self.base_unit.telemetry.update(telemetry)
+            self.base_unit._trim_to_equilibrium()
+        if controls:
+            self.base_unit.control_state.update(controls)
+
+    def run(self, on_chunk=None):
+        """Runs every grid cell and returns a SweepResult."""
+        result = SweepResult(self.r_type, self.axes, horizon=self.horizon, dt=self.dt)
+        n = result.size
+        grids = np.meshgrid(*self.axes.values(), indexing="ij")
+        cells = {field: g.ravel() for field, g in zip(self.axes, grids)}
+        flat = {m: v.reshape(-1) for m, v in result.metrics.items()}
+        bounds = [(s, min(n, s + self.chunk_size)) for s in range(0, n, self.chunk_size)]
+
+        def chunk_args(start, stop):
+            return (self.base_unit, {f: v[start:stop] for f, v in cells.items()}, self.horizon, self.dt)
+
+        for start, metrics in map_chunks(simulate_cells, bounds, chunk_args, self.workers):
+            stop = start + len(metrics["peak_temp"])
+            for m in SWEEP_METRICS:
+                flat[m][start:stop] = metrics[m]
+            result.completed += stop - start
+            if on_chunk:
+                on_chunk(result)
+        return result
@@ -5,17 +5,27 @@ import re
 import streamlit as st
 from fpdf import FPDF
 import matplotlib.pyplot as plt
+from collections.abc import Mapping
 from datetime import datetime
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 
+# Events printed per report; longer sessions keep the rest in the unit's EventLog
+REPORT_EVENT_LIMIT = 200
+
 class ReportGenerator:
     """
     Generates multi-page PDF reports for reactor sessions or historical reconstructions.
     """
     
+    @staticmethod
+    def _report_events(event_log, limit=REPORT_EVENT_LIMIT):
+        """Returns (latest events, number omitted) for an EventLog or a plain list."""
+        events = event_log.tail(limit) if hasattr(event_log, "tail") else list(event_log)[-limit:]
+        return events, len(event_log) - len(events)
+
     @staticmethod
     def generate_pdf(unit, session_history):
         """
@@ -118,7 +128,11 @@ class ReportGenerator:
         pdf.cell(0, 10, "CHAIN OF EVENTS", ln=1)
         pdf.set_font("courier", "", 10)
         
-        for event in unit.event_log:
+        report_events, omitted = ReportGenerator._report_events(unit.event_log)
+        if omitted:
+            pdf.cell(0, 6, f"({omitted} earlier events omitted)", ln=1)
+        
+        for event in report_events:
             time_str = f"T+{event['time']:.1f}s"
             msg = str(event['event']).encode('latin-1', 'ignore').decode('latin-1')
             
@@ -181,8 +195,14 @@ class ReportGenerator:
              pdf.cell(0, 8, "DETAILED EVENT LOG", ln=1)
              pdf.set_font("courier", "", 8)
              
-             # Print all events (User requested "full")
-             for e in unit.event_log:
+             # Per-code totals cover the whole session, including events not printed below
+             if hasattr(unit.event_log, "counts"):
+                 summary = ", ".join(f"{code}: {n}" for code, n in sorted(unit.event_log.counts().items()))
+                 pdf.set_x(pdf.l_margin)
+                 pdf.multi_cell(0, 4, f"Totals by code - {summary}")
+             
+             # Print the same window as the chain of events
+             for e in report_events:
                  ts = e.get("time", e.get("timestamp", 0))
                  # Handle float timestamp or datetime object if needed, usually float
                  try:
@@ -205,14 +225,14 @@ class ReportGenerator:
         # Flatten telemetry for printing
         flat_telemetry = {}
         for k, v in final_telemetry.items():
-            if isinstance(v, dict):
+            if isinstance(v, Mapping):
                 for sub_k, sub_v in v.items():
                     flat_telemetry[f"{k}.{sub_k}"] = sub_v
             else:
                 flat_telemetry[k] = v
                 
         # Print 2 columns
-        keys = sorted([k for k in flat_telemetry.keys() if not isinstance(flat_telemetry[k], (list, dict))])
+        keys = sorted([k for k in flat_telemetry.keys() if not isinstance(flat_telemetry[k], (list, Mapping))])
         
         col_width = 95
         for i in range(0, len(keys), 2):
@@ -230,13 +250,19 @@ class ReportGenerator:
             pdf.cell(col_width, 5, txt2[:55], ln=1)
 
         # --- GRAPHS ---
-        if session_history:
+        # Flight recorders and disk recordings hand over a frame directly; plain lists of samples still work
+        if hasattr(session_history, "to_frame"):
+            df = session_history.to_frame()
+        elif isinstance(session_history, pd.DataFrame):
+            df = session_history
+        else:
+            df = pd.DataFrame(session_history or [])
+
+        if not df.empty:
             pdf.add_page()
             pdf.set_font("helvetica", "B", 16)
             pdf.cell(0, 10, "TELEMETRY TRENDS", ln=1)
             
-            df = pd.DataFrame(session_history)
-            
             try:
                 # Use cached generation to prevent Kaleido resource leaks
                 img_bytes = ReportGenerator._create_trend_image(df)
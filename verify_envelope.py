@@ -0,0 +1,34 @@
+import os
+import tempfile
+os.environ["REACTOR_CACHE_DIR"] = tempfile.mkdtemp() # Fresh builds, nothing left in ./cache
+
+from logic import envelope
+from logic.engine import ReactorUnit, ReactorType, apply_disturbance
+
+# Coarse grid keeps the builds quick; the key includes the axes
+envelope.ENVELOPE_AXES = {"power_mw": (0.0, 3000.0), "temp": (280.0, 430.0), "xenon": (0.0, 2.0),
+                          "rod_margin": (-5.0, 5.0), "pump_speed": (0.0, 100.0), "cooling_penalty": (0.2, 1.0)}
+
+
+def test_disturbance_not_keyed():
+    print("--- TEST: cooling disturbance is queried, not rebuilt ---")
+    unit = ReactorUnit(0, "E", ReactorType.PWR)
+    nominal = envelope.envelope_for(unit, workers=1)
+    apply_disturbance(unit.config, "COOLING_FAIL")
+    assert envelope.envelope_for(unit, workers=1) is nominal, "cooling_penalty rebuilt the envelope"
+    assert nominal.query(unit)["recoverable"] >= 0.0
+    print("SUCCESS: one envelope covers the cooling disturbance")
+
+
+def test_background_build():
+    print("--- TEST: wait=False builds off the calling thread ---")
+    unit = ReactorUnit(0, "E", ReactorType.BWR)
+    assert envelope.envelope_for(unit, workers=1, wait=False) is None, "expected no look-ahead while building"
+    built = envelope.envelope_for(unit, workers=1) # Joins the running build
+    assert built is not None and envelope.envelope_for(unit, workers=1, wait=False) is built
+    print("SUCCESS: background build picked up once ready")
+
+
+if __name__ == "__main__":
+    test_disturbance_not_keyed()
+    test_background_build()
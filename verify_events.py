@@ -0,0 +1,31 @@
+from logic.engine import ReactorUnit, ReactorType
+from logic.fleet import FleetEngine
+
+
+def test_loss_of_flow_located():
+    print("--- TEST: loss-of-flow trip timed at the crossing ---")
+    for r_type in ReactorType:
+        unit = ReactorUnit(0, "E", r_type)
+        fleet = FleetEngine(record_history=False)
+        row = fleet.add_unit(ReactorUnit(0, "E", r_type))
+        unit.safety.max_temp = fleet.max_temp[0] = 1e9 # Let flow be the first limit reached
+        for _ in range(10):
+            unit.tick(1.0)
+            fleet.tick(1.0)
+        unit.control_state.pump_speed = row.control_state["pump_speed"] = 0.0
+        while not unit.telemetry.scram:
+            flow0, rods0 = unit.control_state.flow_rate_core, unit.control_state.rods_pos
+            unit.tick(1.0)
+            fleet.tick(1.0)
+        assert "LOSS OF FLOW TRIP" in unit.safety.alerts, f"{r_type.value}: {unit.safety.alerts}"
+        assert flow0 >= unit.safety.min_flow > unit.control_state.flow_rate_core, "trip not in the crossing step"
+        # Rods move only for the part of the step after the crossing
+        speed = unit.config.scram_insertion_speed * 10.0
+        assert unit.control_state.rods_pos < rods0 + speed, f"{r_type.value}: rods got a full step"
+        assert row.telemetry["scram"] and row.control_state["rods_pos"] == unit.control_state.rods_pos, \
+            f"{r_type.value}: fleet row differs from the unit"
+    print("SUCCESS: flow trips located inside the step, fleet matches")
+
+
+if __name__ == "__main__":
+    test_loss_of_flow_located()
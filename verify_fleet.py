@@ -0,0 +1,79 @@
+import math
+from logic.engine import ReactorUnit, ReactorType
+from logic.fleet import FleetEngine
+from logic.branching import branch, FLEET_MIN_BRANCHES
+from logic.sweep import simulate_cells
+from logic.snapshot import clone
+
+
+def _units():
+    units = []
+    for r_type in ReactorType:
+        for rods in (20.0, 35.0, 50.0):
+            for pump in (5.0, 100.0):
+                unit = ReactorUnit(len(units), "F", r_type)
+                unit.control_state.rods_pos = rods
+                unit.control_state.pump_speed = pump
+                units.append(unit)
+    return units
+
+
+def test_parity():
+    print("--- TEST: FleetEngine tracks ReactorUnit exactly ---")
+    units = _units()
+    fleet = FleetEngine()
+    views = [fleet.add_unit(u) for u in units]
+    for _ in range(200):
+        for u in units:
+            u.tick(1.0)
+        fleet.tick(1.0)
+        for u, v in zip(units, views):
+            for k in ("temp", "flux", "pressure", "xenon", "health", "radiation_released"):
+                a, b = u.telemetry[k], v.telemetry[k]
+                assert a == b or (math.isnan(a) and math.isnan(b)), f"{u.type.value} row {v.row}: {k} differs"
+            assert u.telemetry["alerts"] == v.telemetry["alerts"], f"{u.type.value} row {v.row}: alerts differ"
+            assert u.control_state.rods_pos == v.control_state["rods_pos"]
+            assert [(e["time"], e["event"]) for e in u.event_log] == [(e["time"], e["event"]) for e in v.event_log]
+    print("SUCCESS: 18 units identical over 200 ticks")
+
+
+def test_growth():
+    print("--- TEST: rows added before and after ticks ---")
+    fleet = FleetEngine(record_history=False)
+    units = _units()
+    views = [fleet.add_unit(u) for u in units[:9]]
+    fleet.tick(1.0)
+    for u in units[:9]:
+        u.tick(1.0)
+    views += [fleet.add_unit(u) for u in units[9:]] + fleet.add_copies(units[0], range(100, 103))
+    assert fleet.n == len(fleet.telemetry["flux"]) == len(fleet.time_seconds) == 21
+    for u, v in zip(units + [units[0]] * 3, views):
+        assert u.telemetry["temp"] == v.telemetry["temp"] and u.time_seconds == v.time_seconds
+    fleet.tick(1.0)
+    print("SUCCESS: columns grow in place and keep every row")
+
+
+def test_unsupported_physics():
+    print("--- TEST: batch paths never run a unit on physics the fleet lacks ---")
+    unit = ReactorUnit(0, "A", ReactorType.RBMK)
+    unit.use_integrator("adaptive")
+    variants = {f"b{k}": [{"time": 0.0, "controls": {"rods_pos": 45.0}}] for k in range(FLEET_MIN_BRANCHES)}
+    result = branch(unit, variants, horizon=20.0, dt=1.0)
+    own = clone(unit)
+    own.control_state.rods_pos = 45.0
+    for _ in range(20):
+        own.tick(1.0)
+    assert (result["temp"][:, -1] == own.telemetry.temp).all(), "fleet branches ran explicit physics"
+    try:
+        simulate_cells(unit, {"rods_pos": [40.0, 45.0]}, 10.0, 1.0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("sweep accepted an adaptive unit")
+    print("SUCCESS: adaptive unit branched on clones, sweep refused it")
+
+
+if __name__ == "__main__":
+    test_parity()
+    test_growth()
+    test_unsupported_physics()
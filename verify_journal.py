@@ -0,0 +1,111 @@
+import math
+import pickle
+from logic import snapshot
+from logic.engine import ReactorEngine, ReactorUnit, ReactorType
+from logic.journal import InputJournal, resimulate
+
+
+def _run(engine, ticks, dt=0.5):
+    for _ in range(ticks):
+        engine.tick(dt)
+
+
+def _session():
+    """Journaled session exercising every kind of recorded input."""
+    engine = ReactorEngine()
+    engine.start_journal()
+    _run(engine, 10)
+    engine.update_controls("A", {"rods_pos": 40.0, "pump_speed": 80.0})
+    engine.inject_disturbance("B", "COOLING_FAIL")
+    _run(engine, 10, dt=1.0)
+    engine.apply_preset("C", "DEGRADED")
+    engine.use_delayed_neutrons("C")
+    engine.update_config("A", {"responsiveness": 1.2})
+    engine.log_event("A", "note")
+    _run(engine, 20)
+    engine.reset_unit("B")
+    engine.load_scenario("chernobyl")
+    _run(engine, 20)
+    engine.unload_scenario()
+    _run(engine, 10)
+    engine.advance(20.0, max_dt=1.0) # Coarse ticks switch explicit units to "adaptive" and back
+    return engine
+
+
+def test_resimulate_matches_live():
+    print("--- TEST: resimulate reproduces the live session ---")
+    engine = _session()
+    journal = InputJournal.loads(engine.journal.dumps())
+    assert journal.entries == engine.journal.entries and journal.time == engine.journal.time
+    replay = resimulate(journal)
+    assert snapshot.dumps(replay) == snapshot.dumps(engine), "resimulated engine differs from the live one"
+    print("SUCCESS: journal round trip and resimulation are exact")
+
+
+def test_rewind_matches_resimulate():
+    print("--- TEST: rewind_to lands where resimulate does ---")
+    engine = ReactorEngine()
+    engine.start_rewind(interval=5.0, max_keyframes=4)
+    _run(engine, 20)
+    engine.update_controls("A", {"rods_pos": 40.0})
+    engine.inject_disturbance("B", "COOLING_FAIL")
+    _run(engine, 40)
+    journal = InputJournal.loads(engine.journal.dumps())
+    for t in (28.0, 21.5, 12.0): # Between keyframes, then past the oldest one kept (clamped)
+        reached = engine.rewind_to(t)
+        assert snapshot.dumps(engine) == snapshot.dumps(resimulate(journal, until=reached)), \
+            f"rewind to {t} differs from resimulate"
+    engine.update_controls("A", {"rods_pos": 60.0}) # New branch from the rewound point
+    _run(engine, 10)
+    assert snapshot.dumps(engine) == snapshot.dumps(resimulate(engine.journal)), "branch after rewind differs"
+    print("SUCCESS: rewound engine matches resimulation, also after branching")
+
+
+def test_nodal_replay():
+    print("--- TEST: the nodal model survives resimulation and rewind ---")
+    engine = ReactorEngine()
+    engine.start_rewind(interval=5.0)
+    _run(engine, 20)
+    engine.use_nodal_core("A", "axial", nodes=20)
+    engine.update_controls("A", {"rods_pos": 45.0})
+    _run(engine, 40)
+
+    replay = resimulate(engine.journal)
+    assert replay.units["A"].nodal is not None, "resimulate dropped the nodal model"
+    assert replay.units["A"].telemetry.copy() == engine.units["A"].telemetry.copy(), "resimulate diverged"
+
+    live = engine.units["A"].telemetry.copy()
+    engine.rewind_to(15.0)
+    assert engine.units["A"].nodal is not None, "rewind dropped the nodal model"
+    _run(engine, 30)
+    assert engine.units["A"].telemetry.copy() == live, "rewind then replay diverged"
+    print("SUCCESS: nodal model replayed from the journal")
+
+
+def _close(a, b, rel=1e-6):
+    """Telemetry equal up to solver tolerance (a fresh factorization vs defect correction)."""
+    return a.keys() == b.keys() and all(
+        math.isclose(a[k], b[k], rel_tol=rel, abs_tol=1e-9) if isinstance(a[k], float) else a[k] == b[k]
+        for k in a)
+
+
+def test_nodal_pickle():
+    print("--- TEST: a unit with a factorized nodal core pickles ---")
+    unit = ReactorUnit(0, "N", ReactorType.PWR)
+    unit.use_nodal_core("radial", nodes=8)
+    for _ in range(10):
+        unit.tick(0.5)
+    copy = pickle.loads(pickle.dumps(unit))
+    for _ in range(10):
+        unit.tick(0.5)
+        copy.tick(0.5)
+    # The LU cache is not pickled, so the copy refactorizes on its first step
+    assert _close(copy.telemetry.copy(), unit.telemetry.copy()), "pickled nodal unit diverged"
+    print("SUCCESS: pickled nodal unit tracks the original")
+
+
+if __name__ == "__main__":
+    test_resimulate_matches_live()
+    test_rewind_matches_resimulate()
+    test_nodal_replay()
+    test_nodal_pickle()
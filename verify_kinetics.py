@@ -0,0 +1,102 @@
+import math
+import numpy as np
+from logic.engine import ReactorUnit, ReactorType
+from logic.fleet import FleetEngine
+from logic.layers.reactivity import ReactivityLayer
+
+
+def _pull(r_type, pull, delayed, seconds=120.0, dt=0.5):
+    """Peak flux, peak temp and the unit after a rod pull of `pull` % held for `seconds`."""
+    unit = ReactorUnit(0, "K", r_type)
+    if delayed:
+        unit.physics.use_delayed_neutrons(r_type.value)
+    unit.control_state.rods_pos -= pull
+    peak_flux = peak_temp = 0.0
+    for _ in range(int(seconds / dt)):
+        unit.tick(dt)
+        peak_flux = max(peak_flux, unit.telemetry.flux)
+        peak_temp = max(peak_temp, unit.telemetry.temp)
+    return peak_flux, peak_temp, unit
+
+
+def test_rod_pull():
+    print("--- TEST: rod pulls with delayed neutrons ---")
+    for r_type in ReactorType:
+        for pull in (1, 2, 5, 10):
+            label = f"{r_type.value} {pull}%"
+            explicit_peak = _pull(r_type, pull, delayed=False)[0]
+            peak_flux, peak_temp, unit = _pull(r_type, pull, delayed=True)
+            t = unit.telemetry
+            assert np.isfinite(unit.physics.kinetics.state).all(), f"{label}: kinetics state not finite"
+            # Delayed neutrons slow the plant down: never above the explicit excursion
+            assert peak_flux <= explicit_peak, f"{label}: peak flux {peak_flux:.3g} > explicit {explicit_peak:.3g}"
+            assert peak_flux < 0.6 and peak_temp < 600.0, f"{label}: peak flux {peak_flux:.3g}, temp {peak_temp:.0f}"
+            assert not t.get("melted", False) and t.health >= 99.0, f"{label}: core damaged (health {t.health:.0f})"
+            if t.scram:
+                # The SCRAM wins: power and temperature come down
+                assert t.flux < 0.05 and t.temp < 100.0, f"{label}: scrammed at flux {t.flux:.3g}, temp {t.temp:.0f}"
+            else:
+                assert 0.2 < t.flux < 0.5, f"{label}: settled at flux {t.flux:.3g}"
+            print(f"{label} pull: peak flux {peak_flux:.3g} (explicit {explicit_peak:.3g}), "
+                  f"peak temp {peak_temp:.0f}, scram {t.scram}")
+    print("SUCCESS: every excursion bounded and below explicit, SCRAMs bring power down")
+
+
+def test_fleet_bad_row():
+    print("--- TEST: one non-finite fleet row does not stop the others ---")
+    fleet = FleetEngine(record_history=False)
+    for i, r_type in enumerate(ReactorType):
+        fleet.add_unit(ReactorUnit(i, f"K{i}", r_type))
+    fleet.use_delayed_neutrons()
+    fleet.neutron_flux[2] = math.nan
+    fleet.kinetics.state[2] = math.nan
+    for _ in range(50):
+        fleet.tick(0.5)
+    assert np.isfinite(fleet.neutron_flux[:2]).all(), "healthy rows lost their flux"
+    assert fleet.time_seconds[0] == 25.0, "healthy rows stopped advancing"
+    print("SUCCESS: healthy rows kept ticking")
+
+
+def test_adaptive_budget():
+    print("--- TEST: adaptive integrator covers the whole tick when out of sub-steps ---")
+    layer = ReactivityLayer()
+    layer.max_substeps = 1
+    cooling = lambda flux, temp: (0.0, -0.5 * (temp - 20.0)) # Newton cooling, no reactivity feedback
+    for rate in (2.0, -50.0, 400.0):
+        flux, temp = layer._integrate_adaptive(1.0, 300.0, rate / 5.0, 1.0, cooling)
+        expected = 20.0 + 280.0 * math.exp(-0.5)
+        assert math.isclose(flux, math.exp(rate), rel_tol=1e-9), f"rate {rate}: {flux} vs {math.exp(rate)}"
+        assert math.isclose(temp, expected, rel_tol=1e-2), f"rate {rate}: temp {temp} vs {expected}"
+    print("SUCCESS: remainder finished with one unchecked step")
+
+
+def test_adaptive_coarse_ticks():
+    print("--- TEST: adaptive 1 s ticks keep the plant's fate of explicit 0.1 s ticks ---")
+    def run(r_type, pull, cooling, integrator, dt, seconds=300.0):
+        unit = ReactorUnit("A", "a", r_type)
+        unit.use_integrator(integrator)
+        unit.control_state["rods_pos"] -= pull
+        unit.config.cooling_penalty = cooling
+        peak, substeps = 0.0, 0
+        for _ in range(int(round(seconds / dt))):
+            unit.tick(dt)
+            peak = max(peak, unit.telemetry.temp)
+            substeps += unit.physics.substeps
+        return peak, unit.telemetry["melted"], substeps * dt / seconds
+
+    for r_type in ReactorType:
+        for pull in (1.0, 5.0, 10.0):
+            for cooling in (1.0, 0.2):
+                fine, fine_melted, _ = run(r_type, pull, cooling, "explicit", 0.1)
+                coarse, coarse_melted, substeps = run(r_type, pull, cooling, "adaptive", 1.0)
+                assert coarse_melted == fine_melted, f"{r_type.value} {pull}% x{cooling}: melted {coarse_melted} vs {fine_melted}"
+                assert abs(coarse - fine) < 0.15 * fine, f"{r_type.value} {pull}% x{cooling}: peak {coarse:.0f} vs {fine:.0f}"
+                assert substeps < 2.0, f"{r_type.value} {pull}% x{cooling}: {substeps:.1f} sub-steps per tick"
+    print("SUCCESS: coarse adaptive ticks track the fine explicit plant")
+
+
+if __name__ == "__main__":
+    test_rod_pull()
+    test_fleet_bad_row()
+    test_adaptive_budget()
+    test_adaptive_coarse_ticks()
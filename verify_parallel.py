@@ -0,0 +1,61 @@
+import pickle
+import numpy as np
+from logic.engine import ReactorUnit, ReactorType
+from logic.ensemble import map_chunks, EnsembleRunner
+from logic.sweep import StabilitySweep
+
+
+def _square_sum(values):
+    return float(np.sum(np.square(values)))
+
+
+def test_map_chunks():
+    print("--- TEST: map_chunks across a process pool ---")
+    values = np.arange(100.0)
+    bounds = [(s, min(100, s + 16)) for s in range(0, 100, 16)]
+    serial = dict(map_chunks(_square_sum, bounds, lambda a, b: (values[a:b],), workers=1))
+    pooled = dict(map_chunks(_square_sum, bounds, lambda a, b: (values[a:b],), workers=2))
+    assert serial == pooled, "pooled chunks differ from serial"
+    print("SUCCESS: workers=2 matches workers=1")
+
+
+def test_unit_pickle():
+    print("--- TEST: units survive pickling (what the pool sends to workers) ---")
+    for r_type in ReactorType:
+        unit = ReactorUnit(0, "P", r_type)
+        for _ in range(20):
+            unit.tick(0.5)
+        copy = pickle.loads(pickle.dumps(unit))
+        for _ in range(40):
+            unit.tick(0.5)
+            copy.tick(0.5)
+        assert copy.telemetry.copy() == unit.telemetry.copy(), f"{r_type.value}: pickled unit diverged"
+    print("SUCCESS: pickled units tick identically")
+
+
+def test_pool_runners():
+    print("--- TEST: ensemble and sweep with workers=2 ---")
+    for workers in (1, 2):
+        runner = EnsembleRunner(ReactorType.PWR, uncertainty={"cooling_penalty": 0.1}, horizon=20.0,
+                                chunk_size=8, workers=workers, seed=1)
+        result = runner.run(24)
+        if workers == 1:
+            serial = result.peak_temp.copy()
+        else:
+            assert np.array_equal(serial, result.peak_temp), "ensemble differs between workers=1 and 2"
+
+        axes = {"rods_pos": np.linspace(30.0, 70.0, 4), "pump_speed": np.linspace(40.0, 100.0, 3),
+                "void_coefficient": [0.01]}
+        sweep = StabilitySweep(ReactorType.RBMK, axes, horizon=10.0, chunk_size=4, workers=workers).run()
+        if workers == 1:
+            serial_sweep = sweep.section("peak_temp", "rods_pos", "pump_speed")
+        else:
+            assert np.array_equal(serial_sweep, sweep.section("peak_temp", "rods_pos", "pump_speed")), \
+                "sweep differs between workers=1 and 2"
+    print("SUCCESS: process-pool ensemble and sweep match serial runs")
+
+
+if __name__ == "__main__":
+    test_map_chunks()
+    test_unit_pickle()
+    test_pool_runners()
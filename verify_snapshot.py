@@ -0,0 +1,50 @@
+from logic import snapshot
+from logic.engine import ReactorEngine, ReactorUnit, ReactorType
+
+
+def _engine():
+    """Plant with every layer variant in use and some operator history."""
+    engine = ReactorEngine()
+    engine.units["B"].use_multirate()
+    engine.units["C"].physics.use_delayed_neutrons("RBMK")
+    for _ in range(10):
+        engine.tick(0.5)
+    engine.update_controls("A", {"rods_pos": 40.0})
+    engine.inject_disturbance("B", "COOLING_FAIL")
+    engine.apply_preset("C", "DEGRADED")
+    engine.log_event("A", "note")
+    for _ in range(30):
+        engine.tick(0.5)
+    return engine
+
+
+def test_engine_round_trip():
+    print("--- TEST: engine dumps/loads round trip ---")
+    engine = _engine()
+    data = snapshot.dumps(engine)
+    restored = snapshot.loads(data)
+    assert snapshot.dumps(restored) == data, "loads(dumps(engine)) does not re-serialize identically"
+    for _ in range(40):
+        engine.tick(0.5)
+        restored.tick(0.5)
+    assert snapshot.dumps(restored) == snapshot.dumps(engine), "restored engine diverged"
+    print("SUCCESS: restored engine is byte-identical, also after 40 ticks")
+
+
+def test_unit_round_trip():
+    print("--- TEST: unit dumps/loads round trip for each type ---")
+    for r_type in ReactorType:
+        unit = ReactorUnit(0, "S", r_type)
+        for _ in range(20):
+            unit.tick(1.0)
+        restored = snapshot.loads(snapshot.dumps(unit))
+        for _ in range(20):
+            unit.tick(1.0)
+            restored.tick(1.0)
+        assert snapshot.dumps(restored) == snapshot.dumps(unit), f"{r_type.value}: restored unit diverged"
+    print("SUCCESS: restored units tick identically")
+
+
+if __name__ == "__main__":
+    test_engine_round_trip()
+    test_unit_round_trip()
@@ -1,5 +1,7 @@
+import os
 import streamlit as st
 import pandas as pd
+from logic.recorder import Recording
 
 def show(navigate_func):
     st.markdown("## 📈 SYSTEM ANALYTICS & LOGS")
@@ -15,24 +17,120 @@ def show(navigate_func):
     data = states[u_id]
     
     if len(data['history']) > 0:
-        df = pd.DataFrame(data['history'])
+        df = data['history'].to_frame() # Zero-copy view of the flight recorder
         
         c1, c2, c3 = st.columns(3)
-        c1.metric("Peak Power", f"{df['power'].max():.1f} MW")
+        c1.metric("Peak Power", f"{df['power_mw'].max():.1f} MW")
         c2.metric("Max Temp", f"{df['temp'].max():.1f} °C")
-        c3.metric("Duration", f"{df['time'].iloc[-1]:.0f} s")
+        c3.metric("Duration", f"{df['time_seconds'].iloc[-1]:.0f} s")
         
         st.markdown("#### Power Dynamics")
-        st.line_chart(df, x="time", y="power")
+        st.line_chart(df, x="time_seconds", y="power_mw")
         
         st.markdown("#### Thermal Stability")
-        st.line_chart(df, x="time", y="temp")
+        st.line_chart(df, x="time_seconds", y="temp")
         
         st.markdown("#### Reactivity Excursions (pcm)")
-        st.line_chart(df, x="time", y="reactivity")
+        st.line_chart(df, x="time_seconds", y="reactivity")
+        
+        st.markdown("#### Reactivity Balance (pcm)")
+        st.line_chart(df, x="time_seconds", y=["rho_rods", "rho_void", "rho_doppler", "rho_xenon", "rho_boron"])
     else:
         st.warning("No data recorded in current session.")
-        
+
+    # 1b. FULL-RESOLUTION DISK RECORDING
+    st.markdown("### 💾 TICK RECORDER")
+    unit = engine.units[u_id]
+    recording = unit.disk_recorder is not None
+    if st.toggle("Record every tick to disk", value=recording, key=f"disk_rec_{u_id}") != recording:
+        if recording:
+            st.session_state[f"recording_path_{u_id}"] = unit.stop_recording()
+        else:
+            st.session_state[f"recording_path_{u_id}"] = unit.start_recording()
+        st.rerun()
+
+    rec_path = st.session_state.get(f"recording_path_{u_id}")
+    if rec_path and os.path.exists(rec_path):
+        if unit.disk_recorder is not None:
+            unit.disk_recorder.flush()
+        rec = Recording(rec_path) # Lazy: only the selected range is read
+        t_start, t_end = rec.time_range
+        st.caption(f"{rec_path} — {len(rec):,} ticks, T+{t_start:.0f}s to T+{t_end:.0f}s")
+        if len(rec) > 1 and t_end > t_start:
+            lo, hi = st.slider("Time range (s)", t_start, t_end, (t_start, t_end), key=f"rec_range_{u_id}")
+            rows = rec.rows_between(lo, hi)
+            step = max(1, (rows.stop - rows.start) // 5000) # Keep charts light on long runs
+            rec_df = rec.to_frame(lo, hi, channels=["time_seconds", "power_mw", "temp", "pressure"], step=step)
+            st.line_chart(rec_df, x="time_seconds", y=["power_mw", "temp", "pressure"])
+
+            with st.expander("🚨 ALARM DEBRIEF"):
+                # Every warning/annunciator/advice rule replayed over the range in one vectorized pass
+                from logic.rules import RULESET
+                full_df = rec.to_frame(lo, hi, step=step)
+                debrief = RULESET.debrief({k: full_df[k].to_numpy() for k in full_df.columns}, unit.type.value)
+                if debrief:
+                    st.dataframe(pd.DataFrame(debrief), use_container_width=True, hide_index=True)
+                else:
+                    st.caption("No rule fired in this range.")
+
+            if st.checkbox("📥 PREPARE REPORT FOR THIS RANGE", key=f"rec_report_{u_id}"):
+                from services.reporting import ReportGenerator
+                with st.spinner("Compiling Report..."):
+                    pdf_data = ReportGenerator.generate_pdf(unit, rec.to_frame(lo, hi, step=step))
+                st.download_button(
+                    label="📄 DOWNLOAD PDF",
+                    data=pdf_data,
+                    file_name=f"RECORDING_{u_id}_{lo:.0f}-{hi:.0f}s.pdf",
+                    mime="application/pdf"
+                )
+
+    # 1c. STABILITY MAP (parameter sweep over controls x void coefficient)
+    st.markdown("### 🗺️ STABILITY MAP")
+    st.caption("Runs the plant from its nominal state over a grid of control settings and void coefficients.")
+    sweep_axes = {"rods_pos": (30.0, 70.0), "pump_speed": (20.0, 100.0), "turbine_load_mw": (200.0, 2000.0)}
+    m1, m2, m3 = st.columns(3)
+    sweep_type = m1.selectbox("Reactor", ["RBMK", "BWR", "PWR"], key="sweep_type")
+    sweep_x = m2.selectbox("X axis", list(sweep_axes), index=0, key="sweep_x")
+    sweep_y = m3.selectbox("Y axis", [a for a in sweep_axes if a != sweep_x], key="sweep_y")
+    m4, m5, m6 = st.columns(3)
+    sweep_res = m4.select_slider("Resolution", [11, 21, 41], value=21, key="sweep_res")
+    sweep_horizon = m5.select_slider("Horizon (s)", [30, 60, 120, 300], value=60, key="sweep_horizon")
+    void_values = m6.multiselect("Void coefficients", [-0.05, -0.02, 0.01, 0.03, 0.05], default=[0.01, 0.05],
+                                 key="sweep_void")
+
+    if st.button("▶ RUN SWEEP", key="sweep_run") and void_values:
+        import numpy as np
+        from logic.engine import ReactorType
+        from logic.sweep import StabilitySweep
+        axes = {sweep_x: np.linspace(*sweep_axes[sweep_x], sweep_res),
+                sweep_y: np.linspace(*sweep_axes[sweep_y], sweep_res),
+                "void_coefficient": sorted(void_values)}
+        progress = st.progress(0.0, text="Sweeping...")
+        sweep = StabilitySweep(ReactorType(sweep_type), axes, horizon=float(sweep_horizon))
+        st.session_state.sweep_result = sweep.run(
+            on_chunk=lambda r: progress.progress(r.completed / r.size, text=f"Sweeping... {r.completed:,}/{r.size:,} cells"))
+        progress.empty()
+
+    result = st.session_state.get("sweep_result")
+    if result is not None:
+        import plotly.express as px
+        from logic.sweep import SWEEP_METRICS
+        x_name, y_name = list(result.axes)[:2]
+        s1, s2 = st.columns(2)
+        metric = s1.selectbox("Metric", SWEEP_METRICS, key="sweep_metric")
+        voids = [float(v) for v in result.axes["void_coefficient"]]
+        void = s2.select_slider("Void coefficient", voids, key="sweep_void_at") if len(voids) > 1 else voids[0]
+        grid = result.section(metric, x_name, y_name, at={"void_coefficient": void})
+        fig = px.imshow(grid, x=result.axes[x_name], y=result.axes[y_name], origin="lower", aspect="auto",
+                        labels={"x": x_name, "y": y_name, "color": metric},
+                        color_continuous_scale="RdBu_r" if metric == "divergence_rate" else "Inferno",
+                        color_continuous_midpoint=0.0 if metric == "divergence_rate" else None)
+        fig.update_layout(template="plotly_dark", height=420, margin=dict(l=10, r=10, t=30, b=10))
+        st.plotly_chart(fig, width='stretch')
+
+        st.download_button("📥 DOWNLOAD MAP (.npz)", data=result.dumps(),
+                           file_name=f"stability_{result.r_type.value}.npz", mime="application/octet-stream")
+
     st.markdown("---")
     
     # 2. INCIDENT COMPARISON
@@ -43,8 +141,8 @@ def show(navigate_func):
         "Metric": ["Peak Power", "Time to Failure", "Max Reactivity"],
         "Chernobyl (1986)": ["30,000 MW", "60s", "+400 pcm"],
         "Current Run": [
-            f"{df['power'].max():.1f} MW" if len(data['history'])>0 else "-",
-            f"{df['time'].iloc[-1]:.0f} s" if len(data['history'])>0 else "-",
+            f"{df['power_mw'].max():.1f} MW" if len(data['history'])>0 else "-",
+            f"{df['time_seconds'].iloc[-1]:.0f} s" if len(data['history'])>0 else "-",
             f"{df['reactivity'].max():.0f} pcm" if len(data['history'])>0 else "-"
         ]
     })
@@ -1,19 +1,14 @@
 import streamlit as st
+from logic.rules import RULESET
 
-def render_annunciator_panel(telemetry):
-    """Renders a grid of alarm lights."""
-    alerts = {
-        "SCRAM": telemetry.get("scram", False),
-        "HIGH FLUX": telemetry.get("flux", 0) > 1.1,
-        "LOW PRES": telemetry.get("pressure", 150) < 100,
-        "HIGH TEMP": telemetry.get("temp", 300) > 600,
-        "CORE INTG": telemetry.get("health", 100) < 80,
-        "RAD WARN": telemetry.get("flux", 0) > 0.8,
-        "PUMP TRIP": telemetry.get("flow_rate", 100) < 50,
-        "VOID ALRM": telemetry.get("void_fraction", 0) > 0.4,
-        "LOW H2O": telemetry.get("water_level", 5) < 3.0,
-        "HI PRESS": telemetry.get("pressure", 0) > 170
-    }
+def render_annunciator_panel(telemetry, rules=None):
+    """Renders a grid of alarm lights (on the unit's rule evaluator `rules` when given)."""
+    # Lights are the "annunciator" rules of logic.rules.RULES
+    if rules is not None:
+        alerts = rules.update(telemetry, None, "annunciator").states("annunciator")
+    else:
+        _, firing = RULESET.evaluate("annunciator", telemetry)
+        alerts = {RULESET.rules[i].text: RULESET.rules[i] in firing for i in RULESET.groups["annunciator"]}
     
     if telemetry.get("melted", False):
         st.error("CRITICAL CRITICALITY EVENT: CORE MELTDOWN CONFIRMED")
@@ -50,8 +50,14 @@ def show_live_reconstruction(scenario, navigate_func):
             st.session_state.replay_running = not st.session_state.replay_running
             
         if st.button("🔄 RESTART", width='stretch'):
-            unit.time_seconds = 0
-            unit.event_log = []
+            unit.seek(0)
+            st.rerun()
+
+        # Scrub: jump straight to any moment via precomputed keyframes
+        end_time = float(scenario.phases[-1]["time"]) + 1.0
+        scrub = st.slider("⏱ Scrub (s)", 0.0, end_time, min(float(unit.time_seconds), end_time), step=0.5)
+        if abs(scrub - min(float(unit.time_seconds), end_time)) >= 0.5:
+            unit.seek(scrub)
             st.rerun()
 
         if st.button("🛑 STOP REPLAY", width='stretch'):
@@ -64,9 +70,13 @@ def show_live_reconstruction(scenario, navigate_func):
         if st.button("⚡ TAKE CONTROL", type="primary", width='stretch'):
             # Hand over this unit to the main simulator
             unit.is_replay = False
+            # Solve rods/boron/load/feedwater for the replayed state so the plant doesn't jump on handover
+            unit.balance()
             # Break the engine's global scenario bond so it doesn't try to override Unit A
             st.session_state.engine.active_scenario = None 
             st.session_state.engine.units["A"] = unit
+            if st.session_state.engine.journal is not None:
+                st.session_state.engine.start_journal() # Unit swapped in from outside: re-base
             st.session_state.selected_container = "A"
             navigate_func("simulator")
             st.rerun()
@@ -83,16 +93,13 @@ def show_live_reconstruction(scenario, navigate_func):
         st.markdown(f"### 🎞️ RECONSTRUCTION: {scenario.title}")
         
         # Annunciator
-        render_annunciator_panel(unit.telemetry)
+        render_annunciator_panel(unit.telemetry, unit.rules)
         
         # Audio
         render_audio_engine(unit.telemetry, sound_enabled)
         
         # Historical Phase Indicator (Theatric)
-        curr_phase = scenario.phases[0]
-        for p in scenario.phases:
-            if p['time'] <= unit.time_seconds:
-                curr_phase = p
+        curr_phase = scenario.table.phase_at(unit.time_seconds)
         
         st.markdown(f"""
         <div style="background: rgba(255, 165, 0, 0.1); border-left: 5px solid #ffa500; padding: 15px; border-radius: 5px; margin-bottom: 20px;">
@@ -135,7 +142,7 @@ def show_live_reconstruction(scenario, navigate_func):
         if unit.history:
             try:
                 st.markdown("---")
-                df = pd.DataFrame(unit.history)
+                df = unit.history.to_frame()
                 # Ensure columns exist before plotting
                 plot_cols = [c for c in ["power_mw", "temp"] if c in df.columns]
                 x_col = "time_seconds" if "time_seconds" in df.columns else df.columns[0]
@@ -178,13 +185,8 @@ def show_reconstruction(scenario, navigate_func):
 
     with col2:
         st.markdown("### 📊 TELEMETRY TRENDS")
-        history = []
-        for phase in scenario.phases:
-            d = phase['telemetry'].copy()
-            d['time_seconds'] = phase['time']
-            history.append(d)
-        
-        df = pd.DataFrame(history)
+        # Whole replay trajectory at 1 s resolution from the compiled phase table
+        df = scenario.table.frame(dt=1.0)
         fig = px.line(df, x="time_seconds", y=["power_mw", "temp"], title="Historical Event Sequence")
         fig.update_layout(template="plotly_dark", height=400)
         st.plotly_chart(fig, width='stretch')
@@ -220,10 +222,10 @@ def show_reconstruction(scenario, navigate_func):
                 'explanation': scenario.phases[-1]['analysis'],
                 'prevention': ["Better design", "Training", "Independent safety"]
             },
-            'history': history
+            'history': df
         })()
         
-        pdf_data = ReportGenerator.generate_pdf(mock_unit, history)
+        pdf_data = ReportGenerator.generate_pdf(mock_unit, df)
         st.download_button(
             label="📥 DOWNLOAD HISTORICAL FORENSIC REPORT (PDF)",
             data=pdf_data,
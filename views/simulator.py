@@ -4,8 +4,11 @@ import base64
 import time
 from datetime import datetime
 from logic.engine import ReactorEngine, ReactorType
+from logic.events import EVENT_USER
+from logic import snapshot
 from logic.visuals import VisualGenerator
 from logic.instructor import Instructor
+from logic.envelope import envelope_for
 from views.components.audio import render_audio_engine
 from views.components.ui import render_annunciator_panel, render_event_log
 from services.reporting import ReportGenerator, generate_operator_manual_pdf
@@ -97,6 +100,7 @@ def show(navigate_func):
     engine = st.session_state.get('engine')
     if not engine:
         st.session_state.engine = ReactorEngine()
+        st.session_state.engine.start_rewind()
         engine = st.session_state.engine
         
     if 'selected_container' not in st.session_state:
@@ -140,16 +144,47 @@ def show(navigate_func):
     with c_mode:
         flight_mode = st.radio("Mode", ["Monitor", "Control Panel"], index=1, horizontal=True, label_visibility="collapsed")
     with c_run:
-        auto_run = st.toggle("AUTO RUN (1x)", value=st.session_state.get("auto_run", False), key="auto_run_toggle")
+        auto_run = st.toggle("AUTO RUN", value=st.session_state.get("auto_run", False), key="auto_run_toggle")
+        speed = st.select_slider("Time acceleration", [1, 10, 100, 1000], value=1, format_func=lambda x: f"{x}x", key="time_accel")
+        if auto_run and speed > 1 and engine.lag > 1e-9:
+            achieved = speed * (1.0 - engine.lag / (0.1 * speed))
+            st.caption(f"⚠️ CPU-bound: running at ~{achieved:.0f}x")
         if st.button("STEP (+1s)"):
             engine.tick(1.0)
             engine.tick(1.0)
             st.rerun()
 
+    # --- TIME TRAVEL ---
+    if engine.rewind is None:
+        engine.start_rewind()
+    now = engine.journal.time
+    earliest = engine.rewind.earliest
+    c_rw1, c_rw2, c_rw3 = st.columns([1, 1, 3])
+    if c_rw1.button("⏪ 10 s", disabled=now - earliest < 1.0):
+        engine.rewind_to(now - 10.0)
+        st.rerun()
+    if c_rw2.button("⏪ 30 s", disabled=now - earliest < 1.0):
+        engine.rewind_to(now - 30.0)
+        st.rerun()
+    scrubbing = False
+    if now - earliest >= 1.0:
+        # Scrubbing pauses AUTO RUN, so the slider's range (and key) hold still until REWIND
+        scrubbing = c_rw3.toggle("Scrub timeline (pauses auto run)", key="rewind_scrub")
+        if scrubbing:
+            target = c_rw3.slider("Rewind to session second", float(int(earliest)), float(int(now)), float(int(now)), 1.0,
+                                  key=f"rewind_{int(earliest)}_{int(now)}")
+            if c_rw3.button("⏪ REWIND", disabled=target >= int(now)):
+                engine.rewind_to(target)
+                st.rerun()
+
     # --- AUDIO & SETTINGS ---
     with st.sidebar:
         st.markdown("### ⚙️ SETTINGS")
         sound_enabled = st.checkbox("🔊 Enable Sound Effects", value=True)
+        interval = st.select_slider("⏪ Rewind keyframe every (s)", [5, 10, 30, 60], value=int(engine.rewind.interval))
+        if interval != engine.rewind.interval:
+            engine.start_rewind(interval=float(interval)) # Restarts the rewind window
+        st.caption(f"Rewind window: {engine.rewind.interval * engine.rewind.max_keyframes / 60:.0f} min")
         
         st.markdown("---")
         with st.expander("📖 OPERATOR MANUAL"):
@@ -176,6 +211,33 @@ def show(navigate_func):
                 st.session_state["onboarding_complete"] = False
                 st.rerun()
 
+        with st.expander("💾 PLANT CHECKPOINTS"):
+            # Instructor presets: capture the whole plant, reset trainees to it later
+            if st.button("📌 SAVE CHECKPOINT", width='stretch'):
+                st.session_state.checkpoint = snapshot.dumps(engine)
+                st.toast("Checkpoint saved")
+            if st.session_state.get("checkpoint"):
+                if st.button("⏮ RESET TO CHECKPOINT", width='stretch'):
+                    st.session_state.engine = snapshot.loads(st.session_state.checkpoint)
+                    st.session_state.engine.start_rewind()
+                    st.rerun()
+                st.download_button(
+                    "📥 DOWNLOAD CHECKPOINT",
+                    data=st.session_state.checkpoint,
+                    file_name="plant_checkpoint.rxsnap",
+                    mime="application/octet-stream",
+                    width='stretch'
+                )
+            uploaded = st.file_uploader("Restore from file", type=["rxsnap"], key="checkpoint_upload")
+            if uploaded is not None and st.session_state.get("checkpoint_loaded") != uploaded.file_id:
+                try:
+                    st.session_state.engine = snapshot.loads(uploaded.getvalue())
+                    st.session_state.engine.start_rewind()
+                    st.session_state.checkpoint_loaded = uploaded.file_id
+                    st.rerun()
+                except ValueError as e:
+                    st.error(f"Checkpoint rejected: {e}")
+
     # --- 4. MAIN DASHBOARD ---
     selected_id = st.session_state.selected_container
     unit = engine.units[selected_id] # Access actual object for advanced props
@@ -188,8 +250,12 @@ def show(navigate_func):
     col_vis, col_ctrl = st.columns([1.5, 1.2])
     
     with col_vis:
-        # Instructor
-        msgs = Instructor.analyze(unit)
+        # Instructor (look-ahead from the cached safety envelope; built once per config
+        # on a background thread, so no look-ahead until it is ready)
+        envelope = None
+        if not unit.is_replay:
+            envelope = envelope_for(unit, workers=1, wait=False)
+        msgs = Instructor.analyze(unit, envelope)
         if msgs:
             with st.expander("👨‍🏫 INSTRUCTOR REMARKS", expanded=True):
                 for m in msgs:
@@ -223,7 +289,7 @@ def show(navigate_func):
             </style>
             """, unsafe_allow_html=True)
             
-        render_annunciator_panel(telemetry)
+        render_annunciator_panel(telemetry, unit.rules)
         
         # Audio Engine
         render_audio_engine(telemetry, sound_enabled)
@@ -293,6 +359,38 @@ def show(navigate_func):
             c_th3.metric("T-Inlet", f"{telemetry.get('t_inlet', 0):.1f} °C")
             c_th4.metric("T-Outlet", f"{telemetry.get('t_outlet', 0):.1f} °C")
 
+            st.divider()
+            st.caption("⚛️ NEUTRON KINETICS")
+            if unit.physics.integrator != "delayed":
+                if st.button("ENABLE DELAYED NEUTRONS", key=f"delayed_on_{selected_id}", width='stretch',
+                             help="Six-group point kinetics: prompt jump/drop, then the slower precursor period"):
+                    engine.use_delayed_neutrons(selected_id)
+                    st.rerun()
+            else:
+                st.caption("Six-group delayed neutrons active (prompt jump, then the precursor period)")
+
+            st.divider()
+            st.caption("📐 CORE POWER SHAPE (NODAL DIFFUSION)")
+            if unit.nodal is None:
+                c_n1, c_n2 = st.columns(2)
+                geometry = c_n1.selectbox("Geometry", ["axial", "radial"], key=f"nodal_geometry_{selected_id}")
+                if c_n2.button("ENABLE NODAL MODEL", key=f"nodal_on_{selected_id}", width='stretch'):
+                    engine.use_nodal_core(selected_id, geometry)
+                    st.rerun()
+            else:
+                c_n1, c_n2 = st.columns(2)
+                c_n1.metric("Peaking Factor", f"{telemetry.get('peaking_factor', 1.0):.2f}")
+                import plotly.express as px
+                shape = unit.nodal.power_shape()
+                if unit.nodal.geometry == "axial":
+                    c_n2.metric("Axial Offset", f"{telemetry.get('axial_offset', 0.0):+.1f} %")
+                    heights = (pd.RangeIndex(unit.nodal.n) + 0.5) / unit.nodal.n * 100.0 # Bottom to top
+                    fig = px.line(x=shape, y=heights, labels={"x": "Relative power", "y": "Core height (%)"})
+                else:
+                    fig = px.imshow(shape.reshape(unit.nodal.shape), color_continuous_scale="Inferno", aspect="equal")
+                fig.update_layout(template="plotly_dark", height=320, margin=dict(l=10, r=10, t=10, b=10))
+                st.plotly_chart(fig, width='stretch')
+
 
     # CHECK FOR DEATH
     if telemetry.get("health", 100) <= 0:
@@ -314,7 +412,7 @@ def show(navigate_func):
                     st.markdown(f"`T+{e['time']:.1f}s` : {e['event']}")
         
         if st.button(f"RESET {unit.name} (NOMINAL)"):
-             unit.reset()
+             engine.reset_unit(selected_id)
              st.rerun()
              
         # New: Forensic Download
@@ -435,7 +533,7 @@ def show(navigate_func):
             
             st.markdown("---")
             if st.button("🔄 RESET UNIT TO NOMINAL"):
-                unit.reset()
+                engine.reset_unit(selected_id)
                 st.rerun()
             
             # New: Session Report
@@ -459,7 +557,7 @@ def show(navigate_func):
                     if controls.get(key) != val:
                         # Format value for readability
                         val_str = f"{val:.1f}" if isinstance(val, float) else str(val)
-                        unit.log_event(f"USER: Set {key} to {val_str}")
+                        engine.log_event(selected_id, f"USER: Set {key} to {val_str}", EVENT_USER)
                         
                 engine.update_controls(selected_id, new_controls)
                 st.rerun()
@@ -503,14 +601,31 @@ def show(navigate_func):
             - Monitor Steam Line Radiation.
             """)
 
+    # --- 5b. WHAT-IF BRANCHES ---
+    with st.expander("🔀 WHAT-IF BRANCHES", expanded=False):
+        st.caption("Fork the current plant state and run alternative futures side by side. The live session is not advanced.")
+        scram_label = "AZ-5" if r_type == "RBMK" else "SCRAM"
+        delays = st.multiselect(f"{scram_label} after (s)", [0, 5, 10, 20, 30, 60], default=[0, 10], key="branch_delays")
+        horizon = st.slider("Horizon (s)", 30, 300, 120, 10, key="branch_horizon")
+        if st.button("RUN BRANCHES", width='stretch'):
+            variants = {f"{scram_label} T+{d}s": [{"time": d, "controls": {"manual_scram": True}}] for d in delays}
+            variants["No action"] = []
+            st.session_state.branch_result = (selected_id, engine.branch(selected_id, variants, horizon=float(horizon)))
+        result = st.session_state.get("branch_result")
+        if result and result[0] == selected_id:
+            res = result[1]
+            st.line_chart(res.frame("power_mw"), x="time_seconds", y=res.names)
+            st.line_chart(res.frame("temp"), x="time_seconds", y=res.names)
+
     # --- 5. GRAPHS ---
     if len(data['history']) > 2:
         st.markdown("### 📈 FLIGHT RECORDER")
-        df = pd.DataFrame(data['history'])
+        df = data['history'].to_frame()
         st.line_chart(df, x="time_seconds", y=["power_mw", "temp"])
     
-    # Auto Run Tick
-    if auto_run:
+    # Auto Run Tick (0.1 s frames; accelerated time runs more 0.1 s ticks within a CPU
+    # budget, never coarser ones, so speed never changes the plant's fate; a shortfall is engine.lag)
+    if auto_run and not scrubbing:
         time.sleep(0.1)
-        engine.tick(0.1)
+        engine.advance(0.1 * speed, max_dt=0.1, budget=0.08)
         st.rerun()